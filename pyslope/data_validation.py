@@ -1,5 +1,7 @@
 """Module to aid with data validation"""
 
+import numpy as np
+
 
 def assert_integer(n, name):
     """Assert that an input is an integer."""
@@ -31,6 +33,20 @@ def assert_strictly_positive_number(n, name):
         raise ValueError(f"The value for '{name}' should be > 0, not {n}")
 
 
+def assert_positive_array(a, name):
+    """Assert that an input is an array of positive numbers."""
+    a = np.asarray(a)
+    if not np.issubdtype(a.dtype, np.number):
+        raise ValueError(
+            f"The values for '{name}' should be ints or floats, not "
+            f"{a.dtype}."
+        )
+    if np.any(a < 0):
+        raise ValueError(
+            f"The values for '{name}' should be >= 0, not {a[a < 0][0]}"
+        )
+
+
 def assert_number(n, name):
     """Assert that an input is a number."""
     if type(n) not in [int, float]:
@@ -1,6 +1,11 @@
 # standard library imports
-from math import radians, tan, sqrt, atan, cos
-from dataclasses import dataclass
+from math import radians, tan, sqrt, atan, cos, ceil
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from copy import deepcopy
+from itertools import repeat
+from numbers import Integral
 
 # third party imports
 from plotly import graph_objects as go
@@ -13,10 +18,12 @@ import numpy as np
 # if using this file or sphinx, cant be relative
 if __name__ in ("__main__", "pyslope", "__mp_main__"):
     import data_validation
+    import solver
     import utilities
 # if running from django need to use relative
 else:
     from . import data_validation
+    from . import solver
     from . import utilities
 
 COLOUR_FOS_DICT, MATERIAL_COLORS = (
@@ -25,6 +32,73 @@ COLOUR_FOS_DICT, MATERIAL_COLORS = (
 )
 MAX_COLOUR_KEY = max(COLOUR_FOS_DICT)
 
+# solvers available to Slope.analyse_slope
+ENGINES = ("batch", "scalar")
+
+# columns used to store failure planes, (l_x, l_y) and (r_x, r_y) are the
+# left and right intersections of the failure circle with the boundary
+PLANE_DTYPE = np.dtype(
+    [
+        ("l_x", float),
+        ("l_y", float),
+        ("r_x", float),
+        ("r_y", float),
+        ("c_x", float),
+        ("c_y", float),
+        ("radius", float),
+    ]
+)
+
+# columns used to store analysed failure planes
+RESULT_DTYPE = np.dtype(PLANE_DTYPE.descr + [("FOS", float)])
+
+# derived artefacts that depend on each model input, see
+# Slope._invalidate. The search results depend on every input.
+DEPENDENCIES = {
+    "boundary": ("planes", "geometry"),
+    "limits": ("planes",),
+    "search_options": ("planes",),
+    "slice_options": ("geometry",),
+    "materials": ("geometry",),
+    # entry points are placed next to loads
+    "loads": ("planes",),
+    "water": (),
+    "grid": (),
+    "halton": (),
+    "radius_search": (),
+    "screening": (),
+    "individual_planes": (),
+}
+
+# maximum planes x slices for which slice geometry is cached between
+# analyses, the cache holds about 12 floats per element
+GEOMETRY_CACHE_ELEMENTS = 2**21
+
+# slicing modes for the batch solver, see solver.CompiledSlope
+SLICING = ("uniform", "breakpoints")
+
+# radius search planes are warm started from the nearest plane already
+# solved when the radius fractions are closer than this
+WARM_START_FRACTION = 0.05
+
+# methods available to Slope.analyse_slope to search for failure planes
+METHODS = ("entry_exit", "refine", "grid", "halton", "radius_search")
+
+# planes with an estimated FOS within this fraction of the lowest are
+# solved for each offset of a dynamic analysis with offsets
+DYNAMIC_SCREEN = 0.1
+
+# searches available to Slope.analyse_dynamic for the required offset
+DYNAMIC_SEARCHES = ("secant", "bracket")
+
+# maximum number of offsets analysed by a dynamic search after the
+# nearest and furthest offsets
+DYNAMIC_ITERATIONS = 10
+
+# approximate number of (plane, slice) values solved at once by the
+# batch solver, limits the memory used for large searches
+BATCH_ELEMENTS = 2**18
+
 
 @dataclass
 class Material:
@@ -132,11 +206,17 @@ class Udl:
         If True then the load offset will be dynamically moved if a "dynamic
         analysis" is run. (For a standard analysis the offset value is still used).
         By default False.
+    end_magnitude : float
+        magnitude of the load in kPa at the end furthest from the slope
+        (offset + length), the load varies linearly from magnitude at
+        the offset. Requires a load length. By default None (uniform).
 
     Examples
     ------------
     >>> Udl(magnitude = 10, offset = 1, length = 2, color = "pink")
     UDL: 10 kPa, offset = 1 m, load length = 2 m
+    >>> Udl(magnitude = 10, offset = 1, length = 2, end_magnitude = 0)
+    UDL: 10 to 0 kPa, offset = 1 m, load length = 2 m
     >>> Udl()
     UDL: 0 kPa, offset = 0 m, load length continuous
     >>> a = Udl()
@@ -150,6 +230,7 @@ class Udl:
     length: float = None
     color: str = "red"
     dynamic_offset: bool = False
+    end_magnitude: float = None
 
     def __post_init__(self):
         data_validation.assert_number(self.magnitude, "load magnitude")
@@ -165,23 +246,43 @@ class Udl:
         self.magnitude = abs(self.magnitude)
         self.offset = abs(self.offset)
 
+        if self.end_magnitude is not None:
+            data_validation.assert_number(
+                self.end_magnitude, "load end magnitude"
+            )
+            if self.length is None:
+                raise ValueError(
+                    "A load length is required for a load with an end "
+                    "magnitude."
+                )
+            self.end_magnitude = abs(self.end_magnitude)
+
         self.precision = utilities.get_precision(self.magnitude)
 
         if not utilities.is_color(self.color):
             self.color = "red"
 
     def __repr__(self):
+        magnitude = f"{self.magnitude}"
+        if self.end_magnitude is not None:
+            magnitude += f" to {self.end_magnitude}"
+
         if self.length is None:
             return (
-                f"UDL: {self.magnitude} kPa, offset = {self.offset} m, "
+                f"UDL: {magnitude} kPa, offset = {self.offset} m, "
                 "load length continuous"
             )
         else:
             return (
-                f"UDL: {self.magnitude} kPa, offset = {self.offset} m, "
+                f"UDL: {magnitude} kPa, offset = {self.offset} m, "
                 f"load length = {self.length} m"
             )
 
+    @property
+    def max_magnitude(self):
+        """Largest magnitude of the load in kPa."""
+        return max(self.magnitude, self.end_magnitude or 0)
+
 
 @dataclass
 class LineLoad:
@@ -238,6 +339,275 @@ class LineLoad:
         return f"LineLoad: {self.magnitude} kN/m, offset = {self.offset} m"
 
 
+class SearchResults:
+    """Analysed failure planes sorted from lowest to highest factor of safety.
+
+    Results are stored in a single structured array (RESULT_DTYPE). For
+    compatibility with code written for the previous list of dictionaries
+    indexing or iterating returns dictionaries of the form:
+    {"l_c": (x, y), "r_c": (x, y), "c_x": c_x, "c_y": c_y,
+    "radius": radius, "FOS": FOS}, which are created as they are accessed.
+
+    Parameters
+    ----------
+    planes : np.ndarray, optional
+        structured array of planes with the fields of PLANE_DTYPE,
+        by default no planes.
+    FOS : np.ndarray, optional
+        factor of safety for each plane, planes with a nan factor of
+        safety are discarded, by default no planes.
+    max_fos : float, optional
+        If specified only planes with a factor of safety less than or
+        equal to max_fos are kept, by default None.
+
+    Examples
+    ------------
+    >>> planes = np.zeros(3, dtype=PLANE_DTYPE)
+    >>> planes["radius"] = [1, 2, 3]
+    >>> results = SearchResults(planes, np.array([1.5, np.nan, 1.2]))
+    >>> len(results)
+    2
+    >>> results[0]["radius"], results[0]["FOS"]
+    (3.0, 1.2)
+    >>> len(results.filter(max_fos=1.3))
+    1
+    """
+
+    def __init__(self, planes=None, FOS=None, max_fos=None):
+        if planes is None:
+            planes = np.empty(0, dtype=PLANE_DTYPE)
+            FOS = np.empty(0)
+
+        valid = ~np.isnan(FOS)
+        if max_fos:
+            valid &= FOS <= max_fos
+
+        results = np.empty(np.count_nonzero(valid), dtype=RESULT_DTYPE)
+        for name in PLANE_DTYPE.names:
+            results[name] = planes[name][valid]
+        results["FOS"] = FOS[valid]
+
+        # sort from lowest FOS to highest FOS
+        self._results = results[np.argsort(results["FOS"], kind="stable")]
+
+    @classmethod
+    def _from_results(cls, results):
+        """Create from an already sorted structured array of results."""
+        search = cls.__new__(cls)
+        search._results = results
+        return search
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return f"SearchResults: {len(self)} planes"
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SearchResults._from_results(self._results[index])
+
+        return self._row_to_dict(self._results[index])
+
+    def __iter__(self):
+        for row in self._results:
+            yield self._row_to_dict(row)
+
+    @staticmethod
+    def _row_to_dict(row):
+        return {
+            "l_c": (float(row["l_x"]), float(row["l_y"])),
+            "r_c": (float(row["r_x"]), float(row["r_y"])),
+            "c_x": float(row["c_x"]),
+            "c_y": float(row["c_y"]),
+            "radius": float(row["radius"]),
+            "FOS": float(row["FOS"]),
+        }
+
+    @property
+    def array(self):
+        """Structured array of the results (RESULT_DTYPE)."""
+        return self._results
+
+    @property
+    def critical(self):
+        """Dictionary of the plane with the lowest factor of safety."""
+        return self[0]
+
+    def filter(self, max_fos):
+        """Return results with a factor of safety less than or equal to
+        max_fos."""
+        return SearchResults._from_results(
+            self._results[self._results["FOS"] <= max_fos]
+        )
+
+    def to_dicts(self):
+        """Return results as a list of dictionaries."""
+        return list(self)
+
+
+class SearchBuffer:
+    """Collects analysed failure planes as they are solved, keeping only
+    the planes that are required.
+
+    Parameters
+    ----------
+    keep : str or int, optional
+        "all" keeps every plane, "critical" keeps only the plane with the
+        lowest factor of safety and an integer keeps that many planes with
+        the lowest factor of safety, by default "all".
+    max_fos : float, optional
+        If specified only planes with a factor of safety less than or
+        equal to max_fos are kept, by default None.
+
+    Examples
+    ------------
+    >>> planes = np.zeros(4, dtype=PLANE_DTYPE)
+    >>> planes["radius"] = [1, 2, 3, 4]
+    >>> buffer = SearchBuffer(keep=2)
+    >>> buffer.add(planes[:2], np.array([1.5, 1.1]))
+    >>> buffer.add(planes[2:], np.array([1.3, np.nan]))
+    >>> [p["radius"] for p in buffer.results()]
+    [2.0, 3.0]
+    """
+
+    def __init__(self, keep="all", max_fos=None):
+        if keep == "critical":
+            keep = 1
+        elif keep != "all":
+            data_validation.assert_integer(keep, "keep")
+            data_validation.assert_range(keep, "keep", 1, np.inf)
+
+        self._keep = None if keep == "all" else keep
+        self._max_fos = max_fos
+        self._chunks = []
+        self._size = 0
+
+    def add(self, planes, FOS):
+        """Add solved planes to the buffer.
+
+        Parameters
+        ----------
+        planes : np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
+        FOS : np.ndarray
+            factor of safety for each plane, nan where not calculated.
+        """
+        keep = ~np.isnan(FOS)
+        if self._max_fos:
+            keep &= FOS <= self._max_fos
+
+        chunk = np.empty(np.count_nonzero(keep), dtype=RESULT_DTYPE)
+        for name in PLANE_DTYPE.names:
+            chunk[name] = planes[name][keep]
+        chunk["FOS"] = FOS[keep]
+
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+        # reduce the buffer once it is double the size required, keeping
+        # the planes in the order they were added
+        if self._keep and self._size > 2 * self._keep:
+            self._reduce()
+
+    def _reduce(self):
+        if not self._chunks:
+            return
+
+        results = np.concatenate(self._chunks)
+        if len(results) > self._keep:
+            index = np.argpartition(results["FOS"], self._keep - 1)
+            results = results[np.sort(index[: self._keep])]
+
+        self._chunks = [results]
+        self._size = len(results)
+
+    def array(self):
+        """Return the kept planes in the order they were added.
+
+        Returns
+        -------
+        np.ndarray
+            structured array of the planes (RESULT_DTYPE).
+        """
+        if self._keep:
+            self._reduce()
+
+        if self._chunks:
+            return np.concatenate(self._chunks)
+        else:
+            return np.empty(0, dtype=RESULT_DTYPE)
+
+    def results(self):
+        """Return the kept planes sorted from lowest to highest factor
+        of safety.
+
+        Returns
+        -------
+        SearchResults
+        """
+        results = self.array()
+        return SearchResults(results, results["FOS"])
+
+
+def _new_statistics():
+    """Empty analysis statistics, see Slope.get_analysis_statistics."""
+    return {
+        "evaluations": 0,
+        "bishop_planes": 0,
+        "bishop_iterations": 0,
+        "cached_planes": 0,
+    }
+
+
+def _map_with_points(u, low, high, points, width=0.03):
+    """Map values in [0, 1) to [low, high], the top share of the values
+    (width for each point, at most a quarter in total) are mapped onto
+    the points in [low, high]."""
+    points = np.unique([p for p in points if low <= p <= high])
+    if len(points):
+        width = min(width, 0.25 / len(points))
+    main = 1 - width * len(points)
+
+    x = low + np.minimum(u / main, 1) * (high - low)
+
+    snapped = u >= main
+    index = ((u[snapped] - main) // width).astype(int)
+    x[snapped] = points[np.minimum(index, len(points) - 1)]
+
+    return x
+
+
+def write_results(batches, file):
+    """Write analysed failure planes to a csv file as they are produced.
+
+    Parameters
+    ----------
+    batches : iterable
+        iterable of structured arrays (RESULT_DTYPE), for example the
+        generator returned by Slope.iter_analyse.
+    file : str or file object
+        path of the csv file to write or an open text file.
+
+    Returns
+    -------
+    int
+        number of failure planes written.
+    """
+    with ExitStack() as stack:
+        if isinstance(file, str):
+            file = stack.enter_context(open(file, "w", newline=""))
+
+        file.write(",".join(RESULT_DTYPE.names) + "\n")
+
+        count = 0
+        for batch in batches:
+            np.savetxt(file, batch, delimiter=",", fmt="%.6f")
+            count += len(batch)
+
+    return count
+
+
 class Slope:
     """Slope object.
 
@@ -277,10 +647,26 @@ class Slope:
         # NOTE: dont want to reset with changes to the model,
         # just need to initialise here
         self._dynamic_results = {}
-        self._individual_planes = []
+        self._dynamic_curve = None
+        self._individual_planes = np.empty(0, dtype=PLANE_DTYPE)
+
+        # derived artefacts kept between analyses, see _invalidate.
+        # slice geometry of analysed planes is also checked against the
+        # model geometry before use
+        self._entry_exit_planes = None
+        self._geometry_cache = {}
+
+        # loads compiled for the plane by plane solvers, see
+        # _get_load_profile
+        self._load_profile = None
 
         self._external_boundary = None
 
+        # mutations deferred by batch_update, applied on exit
+        self._batch_depth = 0
+        self._batch_inputs = set()
+        self._batch_limits = []
+
         # intialise options
         self.update_boundary_options(MIN_EXT_H=6, MIN_EXT_L=10)
         self.set_external_boundary(height=height, angle=angle, length=length)
@@ -290,17 +676,140 @@ class Slope:
             min_failure_dist=0,
             tolerance=0.005,
             max_iterations=15,
+            acceleration=False,
+            slicing="uniform",
         )
 
         self.update_water_analysis_options(auto=True)
+        self.update_grid_options()
+        self.update_halton_options()
+        self.update_radius_search_options()
+        self.update_screening_options()
 
         # sets default analysis limits (ie no limit)
         self.remove_analysis_limits()
 
+    def _invalidate(self, *inputs):
+        """Invalidate the search results and the derived artefacts that
+        depend on the model inputs that changed (see DEPENDENCIES).
+        Artefacts are recalculated when next needed by analyse_slope.
+
+        Parameters
+        ----------
+        *inputs : str
+            keys of DEPENDENCIES for the inputs that changed.
+        """
+        # any change may move or change the loads
+        self._load_profile = None
+
+        # inside batch_update, invalidate once on exit
+        if self._batch_depth:
+            self._batch_inputs.update(inputs)
+            return
+
+        stale = set()
+        for name in inputs:
+            stale.update(DEPENDENCIES[name])
+
+        if "planes" in stale:
+            self._entry_exit_planes = None
+
+        if "geometry" in stale:
+            self._geometry_cache.clear()
+
+        # results depend on every input
+        self._reset_results()
+
+    @contextmanager
+    def batch_update(self):
+        """Context manager to apply several changes to the model at once.
+
+        Boundary sizing, analysis limits, material ordering, colours and
+        RLs and the invalidation of results are deferred until the
+        outermost batch exits, and are then carried out a single time.
+        Material depths and analysis limits are validated on exit.
+        Model coordinates should not be relied on inside the batch.
+
+        If the body raises or the validation on exit fails, the model is
+        restored to its state before the batch, results are cleared and
+        the exception propagates.
+
+        Examples
+        ------------
+        >>> s = Slope()
+        >>> with s.batch_update():
+        ...     s.set_external_boundary(height=2, angle=45)
+        ...     s.set_materials(Material(depth_to_bottom=12))
+        ...     s.set_udls(Udl(10, offset=4))
+        >>> s._external_height
+        12
+        >>> s._materials[0].RL
+        0
+        """
+        outermost = not self._batch_depth
+        if outermost:
+            # results and cached artefacts are cleared rather than saved
+            saved = deepcopy(
+                {
+                    key: value
+                    for key, value in self.__dict__.items()
+                    if key not in ("_geometry_cache", "_search", "_planes")
+                }
+            )
+
+        self._batch_depth += 1
+        try:
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            if outermost:
+                self._apply_batch_update()
+        except BaseException:
+            if outermost:
+                self._restore_batch_update(saved)
+            raise
+
+    def _restore_batch_update(self, saved):
+        """Restore the model saved before a batch_update that failed."""
+        self.__dict__.update(saved)
+        self._batch_inputs = set()
+        self._batch_limits = []
+        self._invalidate(*DEPENDENCIES)
+
+    def _apply_batch_update(self):
+        """Apply the changes deferred by batch_update."""
+        inputs = self._batch_inputs
+        limits = self._batch_limits
+        self._batch_inputs = set()
+        self._batch_limits = []
+
+        if "boundary" in inputs:
+            self._size_external_boundary()
+
+        # analysis limits set after the last boundary change
+        for kwargs in limits:
+            if kwargs is None:
+                self.remove_analysis_limits()
+            else:
+                self.set_analysis_limits(**kwargs)
+
+        if "water" in inputs and self._water_RL is not None:
+            self._water_RL = max(0, self._top_coord[1] - self._water_depth)
+
+        if "materials" in inputs and self._materials:
+            self._order_materials(self._materials)
+
+        if inputs:
+            self._invalidate(*inputs)
+
     def _reset_results(self):
         """clears search value, run when model results no longer valid."""
 
-        self._search = []
+        self._search = SearchResults()
+        self._planes = np.empty(0, dtype=PLANE_DTYPE)
+        self._analysis_statistics = _new_statistics()
+        self._grid_results = None
         self._min_FOS = 0
         self._min_FOS_location = []
         self._min_FOS_dict = {
@@ -362,6 +871,26 @@ class Slope:
         # help with division by zero errors
         length = max(length, 0.001)
 
+        # set relevant variables to self
+        self._length = length
+        self._height = height
+        self._gradient = height / length
+
+        # size the boundary once on exiting batch_update
+        if self._batch_depth:
+            # boundary change resets analysis limits
+            self._batch_limits = []
+            self._invalidate("boundary")
+            return
+
+        self._size_external_boundary()
+
+    def _size_external_boundary(self):
+        """Size external boundary for the slope height and length and
+        the minimum boundary options."""
+        height = self._height
+        length = self._length
+
         MIN_EXT_H = self._MIN_EXT_H
         MIN_EXT_L = self._MIN_EXT_L
 
@@ -384,11 +913,6 @@ class Slope:
             (0, 0),
         ]
 
-        # set relevant variables to self
-        self._length = length
-        self._height = height
-        self._gradient = height / length
-
         self._top_coord = top
         self._bot_coord = bot
 
@@ -403,8 +927,8 @@ class Slope:
         # reset limits
         self.remove_analysis_limits()
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("boundary")
 
     def set_water_table(self, depth: float):
         """set water table value.
@@ -429,8 +953,8 @@ class Slope:
             self._water_RL = max(0, self._top_coord[1] - depth)
             self._water_depth = depth
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("water")
 
     def remove_water_table(self):
         """Remove water table from model.
@@ -446,8 +970,8 @@ class Slope:
         self._water_RL = None
         self._water_depth = None
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("water")
 
     def set_udls(self, *udls):
         """set a surface surcharge on top of the slope.
@@ -470,7 +994,7 @@ class Slope:
 
         for udl in udls:
             if isinstance(udl, Udl):
-                if udl.magnitude > 0:
+                if udl.max_magnitude > 0:
                     self._udls.append(udl)
 
                     # update to make sure full load is included
@@ -481,16 +1005,16 @@ class Slope:
         self._update_udl_coordinates()
 
         if self._udls:
-            self._udl_max = max(udl.magnitude for udl in self._udls)
+            self._udl_max = max(udl.max_magnitude for udl in self._udls)
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("loads")
 
     # dont need to reset results since this only should be called
     # as a part of resetting
     def _update_udl_coordinates(self):
-        """Update coordinates for left and right of udl based on
-        external boundary and Udl object"""
+        """Update coordinates for left and right of udl and the
+        magnitude at the left based on external boundary and Udl object"""
 
         for udl in self._udls:
             right_x = self._top_coord[0] - udl.offset
@@ -502,6 +1026,15 @@ class Slope:
             udl.left = left_x
             udl.right = right_x
 
+            # varying load may be cut off at the left of the model
+            udl.left_magnitude = udl.magnitude
+            if udl.end_magnitude is not None:
+                udl.left_magnitude += (
+                    (udl.end_magnitude - udl.magnitude)
+                    * (right_x - left_x)
+                    / udl.length
+                )
+
     def remove_udls(self, *udls, remove_all=False):
         """Remove udl from model if associated with model.
 
@@ -531,6 +1064,7 @@ class Slope:
                     check_udl.offset == udl.offset
                     and check_udl.magnitude == udl.magnitude
                     and check_udl.length == udl.length
+                    and check_udl.end_magnitude == udl.end_magnitude
                 ):
                     self._udls.remove(check_udl)
 
@@ -541,8 +1075,8 @@ class Slope:
         if self._udls:
             self._udl_max = max(self._udls, key=lambda x: x.magnitude)
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("loads")
 
     def set_lls(self, *lls):
         """set a surface surcharge on top of the slope
@@ -575,8 +1109,8 @@ class Slope:
 
         self._update_ll_coordinates()
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("loads")
 
     # dont need to reset results since this only should be called
     # as a part of resetting
@@ -625,8 +1159,8 @@ class Slope:
         if remove_all:
             self._lls = []
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("loads")
 
     def set_materials(self, *materials):
         """Assign material instances to the slope instance.
@@ -675,9 +1209,29 @@ class Slope:
 
         # Need to validate material values also
 
-        # sort materials to be in order, include existing materials
         materials = list(materials) + self._materials
-        materials.sort(key=lambda x: x.depth_to_bottom)
+
+        # sort and validate once on exiting batch_update
+        if self._batch_depth:
+            depth = max(m.depth_to_bottom for m in materials)
+            if depth > self._external_height:
+                self.update_boundary_options(MIN_EXT_H=depth)
+
+            self._materials = materials
+            self._invalidate("materials")
+            return
+
+        self._order_materials(materials)
+
+        # invalidate results and anything depending on the change
+        self._invalidate("materials")
+
+    def _order_materials(self, materials):
+        """Sort materials by depth, validate depths and set the RL and
+        color of each material."""
+
+        # sort materials to be in order, include existing materials
+        materials = sorted(materials, key=lambda x: x.depth_to_bottom)
 
         depths = [material.depth_to_bottom for material in materials]
 
@@ -706,9 +1260,6 @@ class Slope:
 
         self._materials = material_refined
 
-        # reset results
-        self._reset_results()
-
     def remove_material(
         self, material: Material = None, depth: float = None, remove_all=False
     ):
@@ -768,8 +1319,8 @@ class Slope:
         if remove_all:
             self._materials = []
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("materials")
 
     def update_water_analysis_options(self, auto: bool = True, H: int = 1):
         """Update analysis options regarding how water is treated.
@@ -806,8 +1357,8 @@ class Slope:
 
         self._water_analysis_H = H
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("water")
 
     def update_analysis_options(
         self,
@@ -816,6 +1367,8 @@ class Slope:
         min_failure_dist: int = None,
         tolerance: float = None,
         max_iterations: int = None,
+        acceleration: bool = None,
+        slicing: str = None,
     ):
         """Function to update analysis modelling options.
 
@@ -841,6 +1394,19 @@ class Slope:
         max_iterations : int, optional
             Maximum number of iterations for convergence on bishop factor of safety.
             By default None. Initialised as 15.
+        acceleration : bool, optional
+            If True bishops factor of safety is found with newton steps
+            rather than fixed point iteration, generally converging in
+            fewer iterations. By default None. Initialised as False.
+        slicing : str, optional
+            "uniform" for equal width slices or "breakpoints" to also put
+            slice boundaries at the crest, toe, load edges, material
+            boundaries and water table, integrating the slice weights
+            exactly. Breakpoint slicing reaches the same accuracy with
+            fewer slices (batch engine only). The remaining slices are
+            spaced evenly so the total stays at slices, unless a plane
+            crosses more breakpoints than slices. By default None.
+            Initialised as "uniform".
 
         Examples
         -----------------
@@ -872,8 +1438,216 @@ class Slope:
         if max_iterations is not None:
             self._max_iterations = max_iterations
 
-        # reset results
-        self._reset_results()
+        if acceleration is not None:
+            self._acceleration = bool(acceleration)
+
+        if slicing is not None:
+            data_validation.assert_contents(slicing, SLICING, "slicing")
+            self._slicing = slicing
+
+        # invalidate results and anything depending on the options changed
+        changed = []
+        if iterations or min_failure_dist is not None:
+            changed.append("search_options")
+        if slices or slicing is not None:
+            changed.append("slice_options")
+        self._invalidate(*changed)
+
+    def update_grid_options(
+        self,
+        x_min: float = None,
+        x_max: float = None,
+        y_min: float = None,
+        y_max: float = None,
+        x_points: int = 20,
+        y_points: int = 20,
+        radius_min: float = None,
+        radius_max: float = None,
+        radius_points: int = 10,
+        tangents: list = None,
+    ):
+        """Function to update the centre grid used by
+        analyse_slope(method="grid").
+
+        Every combination of grid centre and radius is analysed. Radii
+        are either evenly spaced between radius_min and radius_max or
+        set so the circles are tangent to the horizontal lines at the
+        elevations in tangents.
+
+        Parameters
+        ----------
+        x_min : float, optional
+            left x coordinate of the centre grid. If None set to half the
+            slope height left of the slope crest, by default None.
+        x_max : float, optional
+            right x coordinate of the centre grid. If None set to half the
+            slope height right of the slope toe, by default None.
+        y_min : float, optional
+            bottom y coordinate of the centre grid. If None set to the
+            crest elevation, by default None.
+        y_max : float, optional
+            top y coordinate of the centre grid. If None set to twice the
+            slope height above the crest, by default None.
+        x_points : int, optional
+            number of grid centres along x, by default 20.
+        y_points : int, optional
+            number of grid centres along y, by default 20.
+        radius_min : float, optional
+            smallest radius analysed for each centre. If radius_min,
+            radius_max and tangents are None the circles are tangent to
+            evenly spaced elevations between the bottom of the model and
+            the crest, by default None.
+        radius_max : float, optional
+            largest radius analysed for each centre, by default None.
+        radius_points : int, optional
+            number of radii (or default tangent lines) analysed for each
+            centre, by default 10.
+        tangents : list, optional
+            elevations of tangent lines, overrides the radius range,
+            by default None.
+
+        Examples
+        -----------------
+        >>> s = Slope()
+        >>> s.update_grid_options(x_points=10, y_points=10, radius_points=5)
+        >>> s.update_grid_options(tangents=[3, 4, 5])
+        """
+        for value, name in ((x_points, "x_points"), (y_points, "y_points")):
+            data_validation.assert_integer(value, name)
+            data_validation.assert_range(value, name, 1, 1000)
+
+        data_validation.assert_integer(radius_points, "radius_points")
+        data_validation.assert_range(radius_points, "radius_points", 1, 1000)
+
+        for value, name in (
+            (x_min, "x_min"),
+            (x_max, "x_max"),
+            (y_min, "y_min"),
+            (y_max, "y_max"),
+            (radius_min, "radius_min"),
+            (radius_max, "radius_max"),
+        ):
+            if value is not None:
+                data_validation.assert_positive_number(value, name)
+
+        if (radius_min is None) != (radius_max is None):
+            raise ValueError("radius_min and radius_max must be set together")
+
+        if tangents is not None:
+            tangents = list(tangents)
+            for tangent in tangents:
+                data_validation.assert_positive_number(tangent, "tangents")
+
+        self._grid_options = {
+            "x_min": x_min,
+            "x_max": x_max,
+            "y_min": y_min,
+            "y_max": y_max,
+            "x_points": x_points,
+            "y_points": y_points,
+            "radius_min": radius_min,
+            "radius_max": radius_max,
+            "radius_points": radius_points,
+            "tangents": tangents,
+        }
+
+        # invalidate results and anything depending on the change
+        self._invalidate("grid")
+
+    def update_halton_options(self, seed: int = None):
+        """Function to update the options of
+        analyse_slope(method="halton").
+
+        Parameters
+        ----------
+        seed : int, optional
+            Seed used to shift the Halton sequence, each seed gives a
+            different reproducible set of planes. If None the unshifted
+            sequence is used, by default None.
+
+        Examples
+        -----------------
+        >>> s = Slope()
+        >>> s.update_halton_options(seed=1)
+        """
+        if seed is not None:
+            data_validation.assert_integer(seed, "seed")
+
+        self._halton_options = {"seed": seed}
+
+        # invalidate results and anything depending on the change
+        self._invalidate("halton")
+
+    def update_radius_search_options(self, pair_evaluations: int = 6):
+        """Function to update the options of
+        analyse_slope(method="radius_search").
+
+        Parameters
+        ----------
+        pair_evaluations : int, optional
+            Number of planes analysed for each pair of entry and exit
+            points (between 3 and 100). The number of pairs is the
+            analysis iterations divided by this, by default 6.
+
+        Examples
+        -----------------
+        >>> s = Slope()
+        >>> s.update_radius_search_options(pair_evaluations=10)
+        """
+        data_validation.assert_integer(pair_evaluations, "pair_evaluations")
+        data_validation.assert_range(
+            pair_evaluations, "pair_evaluations", 3, 100
+        )
+
+        self._radius_search_options = {"pair_evaluations": pair_evaluations}
+
+        # invalidate results and anything depending on the change
+        self._invalidate("radius_search")
+
+    def update_screening_options(
+        self, screen: float = None, screen_slices: int = None
+    ):
+        """Function to update the two stage screening of failure planes
+        by analyse_slope.
+
+        All planes are first analysed with screen_slices slices and only
+        planes with a factor of safety within screen of the lowest are
+        analysed with the full number of slices and kept in the results.
+        Screening applies to the "entry_exit", "halton" and "grid"
+        methods with the batch engine. The "refine" method analyses its
+        coarse grid with screen_slices slices and doesnt use screen.
+        The "radius_search" method doesnt screen planes.
+
+        Parameters
+        ----------
+        screen : float, optional
+            fraction of the lowest coarse factor of safety (e.g. 0.1 for
+            10 %) within which planes are analysed with the full number of
+            slices. If None planes aren't screened, by default None.
+        screen_slices : int, optional
+            slices used to screen the planes (between 2 and 500). If None
+            a fifth of the analysis slices (minimum 10), by default None.
+
+        Examples
+        -----------------
+        >>> s = Slope()
+        >>> s.update_screening_options(screen=0.1, screen_slices=10)
+        """
+        if screen is not None:
+            data_validation.assert_positive_number(screen, "screen")
+        if screen_slices is not None:
+            data_validation.assert_integer(screen_slices, "screen_slices")
+            data_validation.assert_range(
+                screen_slices, "screen_slices", 2, 500
+            )
+
+        self._screening_options = {
+            "screen": screen,
+            "screen_slices": screen_slices,
+        }
+
+        # invalidate results and anything depending on the change
+        self._invalidate("screening")
 
     def update_boundary_options(
         self,
@@ -920,11 +1694,16 @@ class Slope:
                 height=self._height, length=self._length
             )
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("boundary")
 
     def remove_analysis_limits(self):
         """Reset analysis limits to default (no limits)."""
+        if self._batch_depth:
+            self._batch_limits = [None]
+            self._invalidate("limits")
+            return
+
         self.set_analysis_limits(
             left_x=0,
             right_x_left=self._top_coord[0],
@@ -932,8 +1711,8 @@ class Slope:
             right_x=self._external_length,
         )
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("limits")
 
     def set_analysis_limits(
         self,
@@ -959,6 +1738,19 @@ class Slope:
             right x coordinate left hand limit of search, defines
             inner edge of bottom of search. If none ignored, by default None
         """
+        # validate once the boundary is sized on exiting batch_update
+        if self._batch_depth:
+            self._batch_limits.append(
+                dict(
+                    left_x=left_x,
+                    right_x=right_x,
+                    left_x_right=left_x_right,
+                    right_x_left=right_x_left,
+                )
+            )
+            self._invalidate("limits")
+            return
+
         # set to current model values if not set, else check input is valid
         if left_x is None:
             left_x = self._limits[0]
@@ -1009,19 +1801,82 @@ class Slope:
 
         self._limits = [left_x, left_x_right, right_x_left, right_x]
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("limits")
 
     def _set_entry_exit_planes(self):
         """Function to generate search planes based on a method
         of predetermining where the failure plane will enter and
-        exit the model."""
+        exit the model.
+
+        The generated planes are stored in self._planes as a structured
+        array with the fields of PLANE_DTYPE.
+        """
+        # planes are only regenerated if an input they depend on changed
+        if self._entry_exit_planes is None:
+            *pairs, num_circles = self._get_entry_exit_pairs()
+            self._entry_exit_planes = self._generate_planes_batch(
+                *pairs, num_circles
+            )
+
+        self._planes = self._entry_exit_planes
+
+    def _iter_entry_exit_planes(self, chunk_size, iterations=None):
+        """Generate the entry and exit search planes in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int
+            approximate number of planes in each chunk.
+        iterations : int, optional
+            approximate number of planes to generate, if None the
+            analysis option is used, by default None.
+
+        Yields
+        -------
+        np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
+        """
+        l_x, l_y, r_x, r_y, num_circles = self._get_entry_exit_pairs(
+            iterations
+        )
+        step = max(1, chunk_size // num_circles)
+
+        for i in range(0, len(l_x), step):
+            yield self._generate_planes_batch(
+                l_x[i : i + step],
+                l_y[i : i + step],
+                r_x[i : i + step],
+                r_y[i : i + step],
+                num_circles,
+            )
+
+    def _get_entry_exit_pairs(self, iterations=None, num_circles=None):
+        """Get the entry and exit points used to generate search planes.
+
+        Parameters
+        ----------
+        iterations : int, optional
+            approximate number of planes to generate, if None the
+            analysis option is used, by default None.
+        num_circles : int, optional
+            number of planes per pair of points, if None based on the
+            iterations, by default None.
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (entry x, entry y, exit x, exit y, number of circles per pair)
+        """
+        iterations = iterations or self._iterations
 
         # number of different radii to consider for the same end points
-        num_circles = max(5, int(self._iterations / 800))
+        if num_circles is None:
+            num_circles = max(5, int(iterations / 800))
 
         # generate coordinates for left of slope
-        point_combinations = self._iterations / num_circles
+        point_combinations = iterations / num_circles
 
         # simplification generally will mean slightly less iterations occur.
         # for the default value of 2000 this will be exact
@@ -1029,7 +1884,7 @@ class Slope:
         num_points_top = int(sqrt(point_combinations))
         num_points_bot = num_points_top
 
-        while num_points_top * num_points_bot * num_circles < self._iterations:
+        while num_points_top * num_points_bot * num_circles < iterations:
             num_points_bot += 1
 
         # remove number of points on top to be spread to allow for specific
@@ -1043,130 +1898,695 @@ class Slope:
 
         # coordinates for failure planes at top of slope
         # y coordinate is always the coordinate of the top of the slope
-        left_coords = [
-            (x1 + (n / (num_points_top - 1)) * (x2 - x1), self._top_coord[1])
-            for n in range(num_points_top)
-        ]
+        left_x = x1 + (np.arange(num_points_top) / (num_points_top - 1)) * (
+            x2 - x1
+        )
+
+        # add in coordinates directly adjacent to loads
+        left_x = np.concatenate(
+            [
+                left_x,
+                [ll.coord - 0.001 for ll in self._lls],
+                [udl.left - 0.001 for udl in self._udls],
+            ]
+        )
+        left_y = np.full_like(left_x, self._top_coord[1])
 
         # coodinates for the bottom of the failure plane
         # can be at bottom or on slope, so y is function of x and
         # needs to be determined for different points
-        right_coords_x = [
-            x3 + (n / (num_points_bot)) * (x4 - x3)
-            for n in range(1, num_points_bot + 1)
-        ]
-
-        right_coords = [
-            (x, self.get_external_y_intersection(x)) for x in right_coords_x
-        ]
-
-        search = []
-
-        # add in coordinates directly adjacent to loads
-        for ll in self._lls:
-            left_coords += [(ll.coord - 0.001, self._top_coord[1])]
+        right_x = x3 + (np.arange(1, num_points_bot + 1) / num_points_bot) * (
+            x4 - x3
+        )
+        right_y = np.array(
+            [self.get_external_y_intersection(x) for x in right_x],
+            dtype=float,
+        )
 
-        for udl in self._udls:
-            left_coords += [(udl.left - 0.001, self._top_coord[1])]
+        # every combination of left and right points
+        l_x, r_x = (
+            a.ravel() for a in np.meshgrid(left_x, right_x, indexing="ij")
+        )
+        l_y, r_y = (
+            a.ravel() for a in np.meshgrid(left_y, right_y, indexing="ij")
+        )
 
-        # loop through left and right points to generate coordinates
-        for l_c in left_coords:
-            for r_c in right_coords:
-                if (
-                    utilities.dist_points(l_c, r_c)
-                    > self._min_failure_distance
-                ):
-                    search += self._generate_planes(l_c, r_c, num_circles)
+        distance = np.sqrt((l_x - r_x) ** 2 + (l_y - r_y) ** 2)
+        keep = distance > self._min_failure_distance
 
-        self._search = search
+        return l_x[keep], l_y[keep], r_x[keep], r_y[keep], num_circles
 
-    def _generate_planes(self, l_c, r_c, num_circles=5):
-        """Generate failure plane circle coordinates with entry and exit point.
+    def _generate_planes_batch(self, l_x, l_y, r_x, r_y, num_circles=5):
+        """Generate failure planes for many entry and exit points at once.
 
         Parameters
         ----------
-        l_c : float
-            Left x coordinate which represents the top of the failure
-            plane.
-        r_c : float
-            Right x coordinate which represents the bottom of the failure
-            plane.
+        l_x, l_y : np.ndarray
+            coordinates of the entry points which represent the top of
+            the failure planes.
+        r_x, r_y : np.ndarray
+            coordinates of the exit points which represent the bottom of
+            the failure planes.
         num_circles : int, optional
             number of different circle radii to assess passing through
-            the entry and exit points, by default 5
+            each pair of entry and exit points, by default 5
 
         Returns
         -------
-        list of dictionaries of the form:
-        {
-            "l_c": l_c,
-            "r_c": r_c,
-            "c_x": c_x,
-            "c_y": c_y,
-            "radius": radius,
-        }
+        np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
+            Circles that dont have two intersections with the external
+            boundary are excluded.
+        """
+        c_x, c_y, radius = utilities.circles_from_chords(
+            l_x, l_y, r_x, r_y, num_circles
+        )
+
+        left, right, valid = self._get_circle_external_intersection_batch(
+            c_x, c_y, radius
+        )
+
+        planes = np.empty(np.count_nonzero(valid), dtype=PLANE_DTYPE)
+        planes["l_x"], planes["l_y"] = left[valid].T
+        planes["r_x"], planes["r_y"] = right[valid].T
+        planes["c_x"] = c_x[valid]
+        planes["c_y"] = c_y[valid]
+        planes["radius"] = radius[valid]
+
+        return planes
+
+    def _get_halton_planes(self, model, iterations=None, seed=None):
+        """Generate failure planes with entry x, exit x and radius fraction
+        from a Halton sequence.
 
+        A small share of the sequence in each of the entry and exit
+        directions is placed exactly on the search limits, next to the
+        left of each load (entry) and at the slope toe (exit), as these
+        commonly govern. Points of the sequence that don't give a valid
+        plane are skipped and the sequence continued so exactly
+        iterations planes are returned (unless very few points give valid
+        planes).
+
+        Parameters
+        ----------
+        model : solver.CompiledSlope
+            compiled model used to find the intersections with the
+            external boundary.
+        iterations : int, optional
+            number of planes, if None the analysis option is used,
+            by default None.
+        seed : int, optional
+            seed used to shift the sequence, by default None.
+
+        Returns
+        -------
+        np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
         """
-        search = []
+        if iterations is None:
+            iterations = self._iterations
+
+        x1, x2, x3, x4 = self._limits
+
+        entry_points = [x1, x2]
+        entry_points += [ll.coord - 0.001 for ll in self._lls]
+        entry_points += [udl.left - 0.001 for udl in self._udls]
+        exit_points = [x3, x4, self._bot_coord[0]]
+
+        chunks = []
+        found, start = 0, 0
+
+        # give up if less than 1 in 100 points are valid
+        while found < iterations and start < 100 * iterations:
+            n = iterations - found
+            u = utilities.halton(n, 3, start=start, seed=seed)
+            start += n
+
+            planes, valid = self._generate_planes_from_parameters(
+                l_x=_map_with_points(u[:, 0], x1, x2, entry_points),
+                r_x=_map_with_points(u[:, 1], x3, x4, exit_points),
+                fraction=1 - u[:, 2],
+                model=model,
+            )
+            chunks.append(planes[valid])
+            found += chunks[-1].size
 
-        # assume a starting circle that has a straight vertical slope down at
-        # the top of the slope
-        # this means the centre of the circle is in line with the top of the slope
-        # since the tangent of the circle is perpendicular to the centre
+        return np.concatenate(chunks)
 
-        # angle of slope of choord (For circular slope)
-        beta = atan((l_c[1] - r_c[1]) / (r_c[0] - l_c[0]))
+    def _get_grid(self):
+        """Centre grid coordinates and radii for the grid search.
 
-        # half of the circle coord that passess from top of point to bottom of point
-        half_coord_distance = (
-            sqrt((l_c[1] - r_c[1]) ** 2 + (r_c[0] - l_c[0]) ** 2) / 2
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (grid x coordinates, grid y coordinates, radii) where radii has
+            shape (y_points, x_points, radius_points).
+        """
+        options = self._grid_options
+        top_x, top_y = self._top_coord
+        bot_x, bot_y = self._bot_coord
+        height = top_y - bot_y
+
+        def option(name, default):
+            return default if options[name] is None else options[name]
+
+        x = np.linspace(
+            option("x_min", max(top_x - height / 2, 0)),
+            option("x_max", min(bot_x + height / 2, self._external_length)),
+            options["x_points"],
         )
+        y = np.linspace(
+            option("y_min", top_y),
+            option("y_max", top_y + 2 * height),
+            options["y_points"],
+        )
+
+        c_y = np.broadcast_to(y[:, None, None], (len(y), len(x), 1))
+
+        if options["tangents"] is not None:
+            radius = c_y - np.asarray(options["tangents"], dtype=float)
+        elif options["radius_min"] is not None:
+            radius = np.broadcast_to(
+                np.linspace(
+                    options["radius_min"],
+                    options["radius_max"],
+                    options["radius_points"],
+                ),
+                (len(y), len(x), options["radius_points"]),
+            )
+        else:
+            tangents = np.linspace(0, top_y, options["radius_points"] + 1)[:-1]
+            radius = c_y - tangents
 
-        # starting circle details, if radius 1 would be a vertical slope.
-        # increase to 1.1 to prevent ma denominator issues for bishops method.
-        start_radius = half_coord_distance / cos(beta) * 1.1
-        # start_centre = (l_c[0] + start_radius, l_c[1])
-        start_chord_to_centre = sqrt(start_radius**2 - half_coord_distance**2)
-        start_chord_to_edge = start_radius - start_chord_to_centre
+        return x, y, radius
 
-        # two intersecting chords through circle have segments of chords related
-        # as a * b = c * d , where a and b are the lengths of chord on each
-        # side of intersection as such we have
-        # half_coord_distance ** 2 = chord_to_edge * (R + (R-chord_to_edge)) = C
-        C = half_coord_distance**2
+    def _get_grid_planes(self, model):
+        """Generate the failure planes for the centre grid search.
 
-        for i in range(0, num_circles):
-            # doesnt include going all the way in which we dont want to do anyways
-            chord_to_edge = (
-                start_chord_to_edge * (num_circles - i) / num_circles
+        Circles that don't intersect the slope, that enter or exit outside
+        the analysis limits, or that are shorter than the minimum failure
+        distance are not included.
+
+        Parameters
+        ----------
+        model : solver.CompiledSlope
+            compiled model used to find the intersections with the
+            external boundary.
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (structured array of planes with the fields of PLANE_DTYPE,
+            flat index of the grid centre for each plane)
+        """
+        x, y, radius = self._get_grid()
+        x1, x2, x3, x4 = self._limits
+        tolerance = model.tolerance
+
+        n_radii = radius.shape[-1]
+        c_x = np.broadcast_to(x[None, :, None], radius.shape).ravel()
+        c_y = np.broadcast_to(y[:, None, None], radius.shape).ravel()
+        radius = radius.ravel()
+        centre = np.arange(len(radius)) // n_radii
+
+        # negative radii from tangent lines above the centre
+        positive = radius > 0
+        c_x, c_y, radius, centre = (
+            a[positive] for a in (c_x, c_y, radius, centre)
+        )
+
+        left, right, valid = model.circle_intersection(c_x, c_y, radius)
+        with np.errstate(invalid="ignore"):
+            valid &= (
+                (left[:, 0] >= x1 - tolerance)
+                & (left[:, 0] <= x2 + tolerance)
+                & (right[:, 0] >= x3 - tolerance)
+                & (right[:, 0] <= x4 + tolerance)
+                & (np.hypot(*(right - left).T) > self._min_failure_distance)
             )
-            radius = utilities.circle_radius_from_abcd(chord_to_edge, C)
-            centre = utilities.circle_centre(
-                beta=beta,
-                chord_intersection=utilities.mid_coord(l_c, r_c),
-                chord_to_centre=radius - chord_to_edge,
+
+        planes = np.empty(np.count_nonzero(valid), dtype=PLANE_DTYPE)
+        planes["l_x"], planes["l_y"] = left[valid].T
+        planes["r_x"], planes["r_y"] = right[valid].T
+        planes["c_x"] = c_x[valid]
+        planes["c_y"] = c_y[valid]
+        planes["radius"] = radius[valid]
+
+        return planes, centre[valid]
+
+    def _generate_planes_from_parameters(self, l_x, r_x, fraction, model):
+        """Generate failure planes from entry x, exit x and radius fraction.
+
+        Parameters
+        ----------
+        l_x : np.ndarray
+            entry x coordinates, on the top of the slope.
+        r_x : np.ndarray
+            exit x coordinates.
+        fraction : np.ndarray
+            distance from the chord to the edge of the circle as a fraction
+            of the distance for the largest circle considered for the
+            entry and exit points (see utilities.circles_from_chords).
+        model : solver.CompiledSlope
+            compiled model used to find the intersections with the
+            external boundary.
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (structured array of planes with the fields of PLANE_DTYPE,
+            valid mask). Invalid planes are kept so rows match the inputs.
+        """
+        top_x, top_y = self._top_coord
+        bot_x, bot_y = self._bot_coord
+
+        l_y = np.full_like(l_x, top_y)
+        r_y = np.where(
+            r_x <= top_x,
+            top_y,
+            np.where(
+                r_x >= bot_x, bot_y, top_y - (r_x - top_x) * self._gradient
+            ),
+        )
+
+        # entry and exit can coincide at the crest, these are rejected
+        # by the minimum failure distance check below
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c_x, c_y, radius = utilities.circles_from_chords(
+                l_x, l_y, r_x, r_y, fraction=fraction
             )
-            c_x, c_y = centre
+            left, right, valid = model.circle_intersection(c_x, c_y, radius)
 
-            i_list = self._get_circle_external_intersection(c_x, c_y, radius)
+        distance = np.sqrt((l_x - r_x) ** 2 + (l_y - r_y) ** 2)
+        valid &= distance > self._min_failure_distance
 
-            if len(set(i_list)) < 2:
-                continue
+        planes = np.empty(len(c_x), dtype=PLANE_DTYPE)
+        planes["l_x"], planes["l_y"] = left.T
+        planes["r_x"], planes["r_y"] = right.T
+        planes["c_x"] = c_x
+        planes["c_y"] = c_y
+        planes["radius"] = radius
 
-            l_c = i_list[0]
-            r_c = i_list[1]
+        return planes, valid
 
-            search += [
-                {
-                    "l_c": l_c,
-                    "r_c": r_c,
-                    "c_x": c_x,
-                    "c_y": c_y,
-                    "radius": radius,
-                }
+    def _refine_planes(
+        self,
+        model,
+        points=10,
+        fractions=5,
+        candidates=4,
+        levels=6,
+        coarse_slices=None,
+        executor=None,
+        workers=None,
+        engine="batch",
+    ):
+        """Coarse to fine search for the critical failure plane.
+
+        A coarse grid of entry points, exit points and radius fractions is
+        analysed with a reduced number of slices. The grid spacing is then
+        halved for each level and a local 3 x 3 x 3 grid is analysed around
+        each of the best candidates found so far.
+
+        Parameters
+        ----------
+        model : solver.CompiledSlope
+            compiled model to solve against.
+        points : int, optional
+            number of entry and number of exit points in the coarse grid,
+            by default 10.
+        fractions : int, optional
+            number of radius fractions in the coarse grid, by default 5.
+        candidates : int, optional
+            number of best planes refined at each level, by default 4.
+        levels : int, optional
+            number of refinement levels, by default 6.
+        coarse_slices : int, optional
+            slices used for the coarse grid, by default a fifth of the
+            analysis slices (minimum 10).
+        executor : concurrent.futures.Executor, optional
+            executor to analyse chunks of planes with, by default None.
+        workers : int, optional
+            number of processes to analyse chunks of planes with,
+            by default None.
+        engine : str, optional
+            solver used to evaluate the planes, see analyse_slope,
+            by default "batch".
+
+        Yields
+        -------
+        tuple
+            Tuple containing:
+            (structured array of planes, factor of safety for each plane)
+            for every plane analysed with the full number of slices.
+        """
+        x1, x2, x3, x4 = self._limits
+
+        if coarse_slices is None:
+            coarse_slices = max(10, model.slices // 5)
+        coarse_model = replace(model, slices=coarse_slices)
+
+        # --- coarse grid ---
+        left_x = np.concatenate(
+            [
+                np.linspace(x1, x2, points),
+                [ll.coord - 0.001 for ll in self._lls],
+                [udl.left - 0.001 for udl in self._udls],
             ]
+        )
+        right_x = np.linspace(x3, x4, points + 1)[1:]
+        fraction = (np.arange(fractions) + 1) / fractions
 
-        return search
+        l_x, r_x, f = (
+            a.ravel()
+            for a in np.meshgrid(left_x, right_x, fraction, indexing="ij")
+        )
+        params = np.column_stack([l_x, r_x, f])
+        FOS = self._solve_parameters(
+            params, coarse_model, executor, workers, engine
+        )
+
+        # grid spacing for entry, exit and radius fraction
+        spacing = np.array(
+            [(x2 - x1) / (points - 1), (x4 - x3) / points, 1 / fractions]
+        )
+        lower = np.array([x1, x3, 0.01])
+        upper = np.array([x2, x4, 1])
+
+        offsets = np.stack(
+            np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), -1
+        ).reshape(-1, 3)
+
+        # best candidates, planes analysed with the full number of slices
+        # replace coarse results as they become available
+        best_params, best_FOS = params, FOS
+        seen = set()
+
+        for _ in range(levels):
+            spacing = spacing / 2
+
+            order = np.argsort(best_FOS, kind="stable")
+            order = order[~np.isnan(best_FOS[order])][:candidates]
+
+            trial = best_params[order][:, None, :] + offsets * spacing
+            trial = np.clip(trial.reshape(-1, 3), lower, upper)
+
+            # dont analyse the same plane twice
+            trial = np.unique(trial, axis=0)
+            new = [tuple(t) not in seen for t in trial]
+            trial = trial[new]
+            seen.update(map(tuple, trial))
+
+            if not len(trial):
+                break
+
+            planes, valid = self._generate_planes_from_parameters(
+                trial[:, 0], trial[:, 1], trial[:, 2], model
+            )
+            FOS = np.full(len(trial), np.nan)
+            FOS[valid] = self._solve_all(
+                planes[valid], model, executor, workers=workers, engine=engine
+            )
+
+            yield planes[valid], FOS[valid]
+
+            if best_params is params:
+                best_params, best_FOS = trial, FOS
+            else:
+                best_params = np.concatenate([best_params, trial])
+                best_FOS = np.concatenate([best_FOS, FOS])
+
+    def _radius_search_planes(
+        self,
+        model,
+        evaluations=6,
+        executor=None,
+        workers=None,
+        engine="batch",
+    ):
+        """Search for the critical radius for each pair of entry and exit
+        points with a golden section search, run for all pairs at once.
+
+        The deepest circle (radius fraction of 1) is analysed first, then
+        the golden section search narrows in on the minimum FOS for the
+        radius fraction between 0.01 and 1. Planes that can't be analysed
+        are treated as having an infinite FOS.
+
+        Parameters
+        ----------
+        model : solver.CompiledSlope
+            compiled model to solve against.
+        evaluations : int, optional
+            number of planes analysed for each pair, by default 6.
+        executor : concurrent.futures.Executor, optional
+            executor to analyse chunks of planes with, by default None.
+        workers : int, optional
+            number of processes to analyse chunks of planes with,
+            by default None.
+        engine : str, optional
+            solver used to evaluate the planes, see analyse_slope,
+            by default "batch".
+
+        Yields
+        -------
+        tuple
+            Tuple containing:
+            (structured array of planes, factor of safety for each plane)
+            for every plane analysed.
+        """
+        l_x, _, r_x, _, _ = self._get_entry_exit_pairs(num_circles=evaluations)
+        ratio = (sqrt(5) - 1) / 2
+
+        def evaluate(fraction, initial=None):
+            planes, valid = self._generate_planes_from_parameters(
+                l_x, r_x, fraction, model
+            )
+            if initial is not None:
+                initial = initial[valid]
+            FOS = self._solve_all(
+                planes[valid],
+                model,
+                executor,
+                initial,
+                workers=workers,
+                engine=engine,
+            )
+
+            # objective for the search, infinite where not analysed
+            objective = np.full(len(l_x), np.inf)
+            objective[valid] = np.where(np.isnan(FOS), np.inf, FOS)
+
+            return planes[valid], FOS, objective
+
+        # deepest circle, often governs and golden section wont reach it
+        planes, FOS, _ = evaluate(np.ones_like(l_x))
+        yield planes, FOS
+
+        a = np.full_like(l_x, 0.01)
+        b = np.ones_like(l_x)
+        c = b - ratio * (b - a)
+        d = a + ratio * (b - a)
+
+        planes, FOS, f_c = evaluate(c)
+        yield planes, FOS
+        planes, FOS, f_d = evaluate(d)
+        yield planes, FOS
+
+        for _ in range(evaluations - 3):
+            # minimum is between a and d if c is lower, otherwise c and b
+            left = f_c < f_d
+            a = np.where(left, a, c)
+            b = np.where(left, d, b)
+
+            new = np.where(left, b - ratio * (b - a), a + ratio * (b - a))
+            # warm start from the nearest plane already solved once it
+            # is close enough to be a better estimate than ordinary
+            nearest = np.where(left, c, d)
+            initial = np.where(
+                np.abs(new - nearest) < WARM_START_FRACTION,
+                np.where(left, f_c, f_d),
+                np.nan,
+            )
+            planes, FOS, f_new = evaluate(new, initial=initial)
+            yield planes, FOS
+
+            c, d, f_c, f_d = (
+                np.where(left, new, d),
+                np.where(left, c, new),
+                np.where(left, f_new, f_d),
+                np.where(left, f_c, f_new),
+            )
+
+    def _polish_planes(self, buffer, polish, model):
+        """Refine the best planes in the buffer with a local optimiser.
+
+        Each of the lowest FOS planes is used as the start of a
+        Nelder-Mead search over the circle centre and radius. Circles
+        that don't intersect the slope, that fall outside the analysis
+        limits or that are shorter than the minimum failure distance are
+        rejected. The refined planes are added to the buffer.
+
+        Parameters
+        ----------
+        buffer : SearchBuffer
+            buffer holding the search results so far.
+        polish : int
+            number of planes to refine.
+        model : solver.CompiledSlope
+            compiled model to solve against.
+        """
+        x1, x2, x3, x4 = self._limits
+        tolerance = model.tolerance
+
+        def plane_from_circle(x):
+            c_x, c_y, radius = x
+
+            # vertices of the search can leave the valid circles
+            if not np.all(np.isfinite(x)) or min(c_x, c_y) < 0 or radius <= 0:
+                return None
+
+            left, right, valid = model.circle_intersection(c_x, c_y, radius)
+            (l_x, l_y), (r_x, r_y) = left[0], right[0]
+
+            if (
+                not valid[0]
+                or not x1 - tolerance <= l_x <= x2 + tolerance
+                or not x3 - tolerance <= r_x <= x4 + tolerance
+                or utilities.dist_points((l_x, l_y), (r_x, r_y))
+                <= self._min_failure_distance
+            ):
+                return None
+
+            return (l_x, l_y, r_x, r_y, c_x, c_y, radius)
+
+        def fos(x):
+            plane = plane_from_circle(x)
+            if plane is None:
+                return np.inf
+
+            FOS = model.bishop(x[0], x[1], x[2], plane[0], plane[2])[0]
+            return np.inf if np.isnan(FOS) else FOS
+
+        starts = buffer.results()[:polish]
+
+        planes = np.empty(len(starts), dtype=PLANE_DTYPE)
+        FOS = np.full(len(starts), np.nan)
+        evaluations = 0
+
+        for i, start in enumerate(starts.array):
+            x0 = np.array([start["c_x"], start["c_y"], start["radius"]])
+            x, FOS[i], n = utilities.nelder_mead(
+                fos, x0, step=0.05 * start["radius"], tolerance=1e-5
+            )
+            evaluations += n
+
+            # start plane may lie outside the analysis limits
+            if np.isinf(FOS[i]):
+                planes[i] = start[list(PLANE_DTYPE.names)]
+                FOS[i] = np.nan
+            else:
+                planes[i] = plane_from_circle(x)
+
+        buffer.add(planes, FOS)
+
+        self._analysis_statistics["evaluations"] += evaluations
+        self._analysis_statistics["polish_evaluations"] = evaluations
+        self._analysis_statistics["polish_initial_FOS"] = (
+            float(starts.array["FOS"].min()) if len(starts) else None
+        )
+        self._analysis_statistics["polish_FOS"] = (
+            float(FOS.min()) if len(starts) else None
+        )
+
+    def _solve_parameters(
+        self, params, model, executor=None, workers=None, engine="batch"
+    ):
+        """Calculate bishops FOS for planes defined by (entry x, exit x,
+        radius fraction) rows, nan where the plane is not valid."""
+        planes, valid = self._generate_planes_from_parameters(
+            params[:, 0], params[:, 1], params[:, 2], model
+        )
+        FOS = np.full(len(params), np.nan)
+        FOS[valid] = self._solve_all(
+            planes[valid], model, executor, workers=workers, engine=engine
+        )
+        return FOS
+
+    def _solve_all(
+        self,
+        planes,
+        model,
+        executor=None,
+        initial=None,
+        workers=None,
+        engine="batch",
+    ):
+        """Calculate bishops FOS for all planes, returned as one array.
+        initial is an optional warm start FOS for each plane, not used by
+        the scalar engine."""
+        self._analysis_statistics["evaluations"] += len(planes)
+
+        if engine == "scalar":
+            return self._solve_scalar(planes, progress=False)
+
+        results = [
+            FOS
+            for _, FOS in self._solve_planes(
+                planes,
+                model,
+                workers=workers,
+                executor=executor,
+                progress=False,
+                initial=initial,
+            )
+        ]
+        return np.concatenate(results) if results else np.empty(0)
+
+    def _solve_scalar(self, planes, progress=True):
+        """Calculate bishops FOS for each plane one at a time, nan where
+        it cant be calculated."""
+        FOS = np.full(len(planes), np.nan)
+        for i, plane in enumerate(tqdm(planes, disable=not progress)):
+            fos = self._analyse_circular_failure_bishop(
+                c_x=float(plane["c_x"]),
+                c_y=float(plane["c_y"]),
+                radius=float(plane["radius"]),
+            )
+            if fos is not None:
+                FOS[i] = fos
+
+        return FOS
+
+    def _generate_planes(self, l_c, r_c, num_circles=5):
+        """Generate failure plane circle coordinates with entry and exit point.
+
+        Parameters
+        ----------
+        l_c : float
+            Left x coordinate which represents the top of the failure
+            plane.
+        r_c : float
+            Right x coordinate which represents the bottom of the failure
+            plane.
+        num_circles : int, optional
+            number of different circle radii to assess passing through
+            the entry and exit points, by default 5
+
+        Returns
+        -------
+        np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
+        """
+        return self._generate_planes_batch(
+            np.array([l_c[0]], dtype=float),
+            np.array([l_c[1]], dtype=float),
+            np.array([r_c[0]], dtype=float),
+            np.array([r_c[1]], dtype=float),
+            num_circles,
+        )
 
     def add_single_entry_exit_plane(self, l_cx, r_cx, num_circles=5):
         """Add failure plane to be analysed be specifying start and exit point.
@@ -1184,14 +2604,17 @@ class Slope:
             the entry and exit points, by default 5
         """
         # add by adding in left and right failure coordinate
-        self._individual_planes += self._generate_planes(
+        planes = self._generate_planes(
             (l_cx, self.get_external_y_intersection(l_cx)),
             (r_cx, self.get_external_y_intersection(r_cx)),
             num_circles,
         )
+        self._individual_planes = np.concatenate(
+            [self._individual_planes, planes]
+        )
 
-        # reset results
-        self._reset_results()
+        # invalidate results and anything depending on the change
+        self._invalidate("individual_planes")
 
     def add_single_circular_plane(self, c_x, c_y, radius):
         """Add failure plane to be analysed by specifying circle properties.
@@ -1209,54 +2632,356 @@ class Slope:
         if len(set(i_list)) < 2:
             return None
         else:
-            self._individual_planes += [
-                {
-                    "l_c": i_list[0],
-                    "r_c": i_list[1],
-                    "c_x": c_x,
-                    "c_y": c_y,
-                    "radius": radius,
-                }
-            ]
+            plane = np.array(
+                [(*i_list[0], *i_list[1], c_x, c_y, radius)],
+                dtype=PLANE_DTYPE,
+            )
+            self._individual_planes = np.concatenate(
+                [self._individual_planes, plane]
+            )
+
+        # invalidate results and anything depending on the change
+        self._invalidate("individual_planes")
+
+    def remove_individual_planes(self):
+        """Remove individually added failure planes."""
+        self._individual_planes = np.empty(0, dtype=PLANE_DTYPE)
+
+        # invalidate results and anything depending on the change
+        self._invalidate("individual_planes")
+
+    def analyse_slope(
+        self,
+        max_fos=None,
+        engine="batch",
+        workers=None,
+        executor=None,
+        keep="all",
+        method="entry_exit",
+        polish=0,
+    ):
+        """Analyse many possible failure planes for a slope OR
+        indivually added failure planes if added to slope.
+
+        Options of the search methods are set with update_grid_options,
+        update_halton_options, update_radius_search_options and
+        update_screening_options.
+
+        Parameters
+        ----------
+        max_fos : float, optional
+            If specified only failure planes with a factor of safety less
+            than or equal to max_fos are kept, by default None.
+        engine : str, optional
+            Solver used to evaluate the failure planes. "batch" evaluates
+            every plane at once with vectorised numpy operations, "scalar"
+            evaluates the planes one at a time. By default "batch".
+        workers : int, optional
+            Number of processes used to analyse the failure planes in
+            parallel, not allowed with the scalar engine. By default None
+            (single process).
+        executor : concurrent.futures.Executor, optional
+            Executor to analyse chunks of failure planes with, overrides
+            workers, not allowed with the scalar engine. By default None.
+        keep : str or int, optional
+            Failure planes to keep in the results. "all" keeps every
+            plane, "critical" keeps only the plane with the lowest factor
+            of safety and an integer keeps that many planes with the lowest
+            factor of safety. Only the kept planes are held in memory as
+            the analysis runs. By default "all".
+        method : str, optional
+            Method used to search for the critical failure plane.
+            "entry_exit" analyses an evenly spaced grid of entry points,
+            exit points and radii based on the analysis iterations.
+            "refine" analyses a coarse grid and then refines the grid
+            around the best planes, generally finding a lower FOS with
+            fewer planes analysed. "grid" analyses every combination of
+            circle centre and radius set with update_grid_options, the
+            minimum FOS for each centre is available from
+            get_grid_results. "halton" analyses exactly the analysis
+            iterations number of planes with entry x, exit x and radius
+            spread with a Halton low discrepancy sequence, giving better
+            coverage than the "entry_exit" grid for the same number of
+            planes, see update_halton_options. "radius_search" uses the
+            entry and exit points of "entry_exit" but searches for the
+            critical radius for each pair of points with a golden section
+            search, see update_radius_search_options. By default "entry_exit".
+        polish : int, optional
+            Number of the lowest FOS planes to refine with a local
+            optimiser (Nelder-Mead over the circle centre and radius,
+            constrained to the analysis limits) after the search. The
+            refined FOS and number of planes analysed are available from
+            get_analysis_statistics. Not applied to individually added
+            planes. By default 0.
+
+        Examples
+        -----------------
+        >>> s = Slope()
+        >>> s.set_materials(Material())
+        >>> s.update_analysis_options(slices=10, iterations=500)
+        >>> s.analyse_slope()
+        >>> round(s.get_min_FOS(), 3)
+        2.496
+        """
+        data_validation.assert_contents(engine, ENGINES, "engine")
+        data_validation.assert_contents(method, METHODS, "method")
+        data_validation.assert_integer(polish, "polish")
+        data_validation.assert_range(polish, "polish", 0, np.inf)
+
+        # screening set with update_screening_options
+        screen = self._screening_options["screen"]
+        screen_slices = self._screening_options["screen_slices"]
+        if screen is not None and engine != "batch":
+            raise ValueError(
+                "Screening requires the batch engine, see "
+                "update_screening_options."
+            )
+        if workers is not None:
+            data_validation.assert_integer(workers, "workers")
+            data_validation.assert_range(workers, "workers", 1, 1024)
+        if engine == "scalar" and (
+            workers is not None or executor is not None
+        ):
+            raise ValueError("workers and executor require the batch engine.")
+
+        buffer = SearchBuffer(keep=keep, max_fos=max_fos)
+        self._analysis_statistics = _new_statistics()
+
+        model = self._compile_model()
+
+        if method == "refine" and not len(self._individual_planes):
+            # the coarse grid is the screening stage of refine
+            if screen is not None:
+                raise ValueError(
+                    "screen is not used by the refine method, the coarse "
+                    "grid is analysed with screen_slices slices instead, "
+                    "see update_screening_options."
+                )
+
+            for planes, FOS in self._refine_planes(
+                model,
+                coarse_slices=screen_slices,
+                executor=executor,
+                workers=workers,
+                engine=engine,
+            ):
+                buffer.add(planes, FOS)
+
+        elif method == "halton" and not len(self._individual_planes):
+            self._planes = self._get_halton_planes(
+                model, seed=self._halton_options["seed"]
+            )
+            self._analyse_planes(
+                self._planes,
+                buffer,
+                model,
+                engine,
+                workers,
+                executor,
+                screen,
+                screen_slices,
+            )
+
+        elif method == "radius_search" and not len(self._individual_planes):
+            if screen is not None or screen_slices is not None:
+                raise ValueError(
+                    "Screening is not used by the radius_search method, "
+                    "see update_screening_options."
+                )
+
+            for planes, FOS in self._radius_search_planes(
+                model,
+                self._radius_search_options["pair_evaluations"],
+                executor=executor,
+                workers=workers,
+                engine=engine,
+            ):
+                buffer.add(planes, FOS)
+
+        elif method == "grid" and not len(self._individual_planes):
+            self._planes, centre = self._get_grid_planes(model)
+            FOS = self._analyse_planes(
+                self._planes,
+                buffer,
+                model,
+                engine,
+                workers,
+                executor,
+                screen,
+                screen_slices,
+            )
+
+            x, y, _ = self._get_grid()
+            min_FOS = np.full(len(x) * len(y), np.nan)
+            if len(FOS):
+                np.fmin.at(min_FOS, centre, FOS)
+
+            self._grid_results = {
+                "x": x,
+                "y": y,
+                "FOS": min_FOS.reshape(len(y), len(x)),
+            }
+
+        else:
+            # if individual failure planes set only analyse them
+            if len(self._individual_planes):
+                self._planes = self._individual_planes
+
+            # otherwise generate planes across the entire slope
+            else:
+                self._set_entry_exit_planes()
+
+            self._analyse_planes(
+                self._planes,
+                buffer,
+                model,
+                engine,
+                workers,
+                executor,
+                screen,
+                screen_slices,
+            )
+
+        if polish and not len(self._individual_planes):
+            self._polish_planes(buffer, polish, model)
+
+        # sorted from lowest FOS to highest FOS
+        self._search = buffer.results()
+
+    def _analyse_planes(
+        self,
+        planes,
+        buffer,
+        model,
+        engine,
+        workers,
+        executor,
+        screen=None,
+        screen_slices=None,
+    ):
+        """Calculate the FOS for each plane and add them to the buffer,
+        see analyse_slope for the parameters. Returns the FOS for each
+        plane, nan where it can't be calculated or the plane was screened
+        out."""
+        if screen is not None:
+            if screen_slices is None:
+                screen_slices = max(10, model.slices // 5)
+            coarse = replace(model, slices=screen_slices)
+
+            coarse_FOS = np.concatenate(
+                [np.empty(0)]
+                + [
+                    FOS
+                    for _, FOS in self._solve_planes(
+                        planes,
+                        coarse,
+                        workers=workers,
+                        executor=executor,
+                        cache=True,
+                    )
+                ]
+            )
+            self._analysis_statistics["screening_evaluations"] = len(planes)
+
+            # planes the coarse pass couldnt analyse are kept to be safe
+            cutoff = np.nanmin(coarse_FOS, initial=np.inf) * (1 + screen)
+            with np.errstate(invalid="ignore"):
+                keep = ~(coarse_FOS > cutoff)
+
+            FOS = np.full(len(planes), np.nan)
+            FOS[keep] = self._analyse_planes(
+                planes[keep], buffer, model, engine, workers, executor
+            )
+            return FOS
+
+        self._analysis_statistics["evaluations"] += len(planes)
+
+        if engine == "batch":
+            results = []
+            for chunk, FOS in self._solve_planes(
+                planes,
+                model,
+                workers=workers,
+                executor=executor,
+                cache=True,
+            ):
+                buffer.add(chunk, FOS)
+                results.append(FOS)
+
+            return np.concatenate(results) if results else np.empty(0)
+
+        else:
+            # go through each assumed plane and calculate the FOS
+            FOS = self._solve_scalar(planes)
+            buffer.add(planes, FOS)
 
-        # reset results
-        self._reset_results()
+            return FOS
 
-    def remove_individual_planes(self):
-        """Remove individually added failure planes."""
-        self._individual_planes = []
+    def iter_analyse(
+        self, chunk_size=10000, iterations=None, max_fos=None, executor=None
+    ):
+        """Analyse failure planes in chunks, yielding results as they are
+        calculated.
 
-        # reset results
-        self._reset_results()
+        Planes are generated and analysed one chunk at a time so memory use
+        does not depend on the number of planes. Results are not stored on
+        the slope. If individual failure planes have been added only they
+        are analysed.
 
-    def analyse_slope(self, max_fos=None):
-        """Analyse many possible failure planes for a slope OR
-        indivually added failure planes if added to slope."""
+        Parameters
+        ----------
+        chunk_size : int, optional
+            approximate number of planes analysed in each chunk,
+            by default 10000.
+        iterations : int, optional
+            approximate number of planes to analyse. Unlike the analysis
+            option this is not limited to 100000. If None the analysis
+            option is used, by default None.
+        max_fos : float, optional
+            If specified only failure planes with a factor of safety less
+            than or equal to max_fos are yielded, by default None.
+        executor : concurrent.futures.Executor, optional
+            Executor to analyse chunks of failure planes with,
+            by default None.
+
+        Yields
+        ------
+        np.ndarray
+            structured array (RESULT_DTYPE) of the analysed planes in the
+            chunk, in the order they were generated. Planes where the factor
+            of safety could not be calculated are excluded.
 
-        # if individual failure planes set only analyse them
-        if self._individual_planes != []:
-            self._search = self._individual_planes
+        Examples
+        -----------------
+        >>> s = Slope()
+        >>> s.set_materials(Material())
+        >>> s.update_analysis_options(slices=10)
+        >>> batches = s.iter_analyse(chunk_size=1000, iterations=5000)
+        >>> sum(len(batch) for batch in batches) > 4000
+        True
+        """
+        data_validation.assert_integer(chunk_size, "chunk_size")
+        data_validation.assert_range(chunk_size, "chunk_size", 1, np.inf)
 
-        # otherwise generate planes across the entire slope
-        else:
-            self._set_entry_exit_planes()
+        model = self._compile_model()
 
-        # go through each assumed plane and calculate the FOS
-        for i, search in enumerate(tqdm(self._search)):
-            self._search[i]["FOS"] = self._analyse_circular_failure_bishop(
-                c_x=search["c_x"],
-                c_y=search["c_y"],
-                radius=search["radius"],
+        if len(self._individual_planes):
+            planes = self._individual_planes
+            chunks = (
+                planes[i : i + chunk_size]
+                for i in range(0, len(planes), chunk_size)
             )
+        else:
+            chunks = self._iter_entry_exit_planes(chunk_size, iterations)
 
-        # tidy the information to remove anything that didnt run and
-        # to be sorted from lowest FOS to highest FOS
-        search = list(filter((lambda x: x["FOS"] is not None), self._search))
-        search.sort(key=lambda x: x["FOS"])
-        if max_fos:
-            search = list(filter(lambda x: (x["FOS"] <= max_fos), search))
+        for chunk in chunks:
+            buffer = SearchBuffer(max_fos=max_fos)
+            for planes, FOS in self._solve_planes(
+                chunk, model, executor=executor, progress=False
+            ):
+                buffer.add(planes, FOS)
 
-        self._search = search
+            yield buffer.array()
 
     def _analyse_circular_failure_ordinary(
         self,
@@ -1418,27 +3143,7 @@ class Slope:
         # --- Add distributed and line loads ---
         xl = slice_x - half_width
         xr = slice_x + half_width
-
-        for udl in self._udls:
-            overlap = np.minimum(
-                xr,
-                udl.right,
-            ) - np.maximum(
-                xl,
-                udl.left,
-            )
-            W += (
-                np.clip(
-                    overlap,
-                    0.0,
-                    None,
-                )
-                * udl.magnitude
-            )
-
-        for ll in self._lls:
-            mask = (xl <= ll.coord) & (ll.coord < xr)
-            W[mask] += ll.magnitude
+        W += self._get_load_profile().load(xl, xr)
 
         # --- Water uplift ---
         if self._water_RL:
@@ -1634,29 +3339,10 @@ class Slope:
             slice_y_bottom,
         )
 
-        # --- Add uniformly distributed loads (UDLs) ---
+        # --- Add distributed loads (UDLs) and line loads (LLs) ---
         x_left = slice_x - half_slice
         x_right = slice_x + half_slice
-        for udl in self._udls:
-            overlap = np.minimum(
-                x_right,
-                udl.right,
-            ) - np.maximum(
-                x_left,
-                udl.left,
-            )
-            overlap = np.clip(
-                overlap,
-                0.0,
-                None,
-            )
-            W += overlap * udl.magnitude
-
-        # --- Add line loads (LLs) ---
-        for ll in self._lls:
-            mask = (x_left <= ll.coord) & (ll.coord < x_right)
-            if np.any(mask):
-                W[mask] += ll.magnitude
+        W += self._get_load_profile().load(x_left, x_right)
 
         # --- Water pressures (uplift) ---
         if self._water_RL:
@@ -1730,15 +3416,281 @@ class Slope:
 
         return float(prev_FS)
 
-    def analyse_dynamic(self, critical_fos=1.3):
+    def _solve_planes(
+        self,
+        planes,
+        model=None,
+        workers=None,
+        executor=None,
+        progress=True,
+        initial=None,
+        cache=False,
+    ):
+        """Calculate the bishop FOS for a structured array of planes using
+        the batch solver. Planes are solved in chunks so that the size of
+        the (planes x slices) arrays stays bounded.
+
+        Parameters
+        ----------
+        planes : np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
+        model : solver.CompiledSlope, optional
+            compiled model to solve against, if None the model is
+            compiled from the slope, by default None.
+        workers : int, optional
+            number of processes to solve chunks of planes in parallel. If
+            None or 1 (and no executor) planes are solved in this process,
+            by default None.
+        executor : concurrent.futures.Executor, optional
+            executor to submit chunks of planes to, by default None.
+        progress : bool, optional
+            If true shows a progress bar, by default True.
+        initial : np.ndarray, optional
+            initial estimate of the factor of safety for each plane used
+            to warm start the bishop iteration, by default None.
+        cache : bool, optional
+            If true the slice geometry of the planes is kept and reused
+            when the same planes are solved again with a model with the
+            same geometry, for example after a change to the loads. Only
+            used when solving in this process and for fewer than
+            GEOMETRY_CACHE_ELEMENTS planes x slices, by default False.
+
+        Yields
+        -------
+        tuple
+            Tuple containing:
+            (chunk of planes, factor of safety for each plane in the
+            chunk). The factor of safety is nan where it cant be
+            calculated. Chunks are yielded in order.
+        """
+        if model is None:
+            model = self._compile_model()
+
+        n = len(planes)
+        chunk_size = max(1, BATCH_ELEMENTS // model.slices)
+
+        # make sure there are enough chunks to spread between workers
+        if workers:
+            chunk_size = min(chunk_size, max(1, ceil(n / (4 * workers))))
+
+        chunks = [planes[i : i + chunk_size] for i in range(0, n, chunk_size)]
+        if initial is None:
+            initial_chunks = repeat(None, len(chunks))
+        else:
+            initial_chunks = [
+                initial[i : i + chunk_size] for i in range(0, n, chunk_size)
+            ]
+
+        statistics = self._analysis_statistics
+
+        in_process = executor is None and not (workers and workers > 1)
+        if (
+            cache
+            and in_process
+            and n * model.slices <= GEOMETRY_CACHE_ELEMENTS
+        ):
+            geometries = self._get_geometry_cache(planes, model, len(chunks))
+        else:
+            geometries = None
+
+        with ExitStack() as stack:
+            if executor is None and workers and workers > 1:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=workers)
+                )
+
+            if geometries is not None:
+                results = (
+                    self._solve_cached_chunk(model, chunk, init, geometries, i)
+                    for i, (chunk, init) in enumerate(
+                        zip(chunks, initial_chunks)
+                    )
+                )
+            else:
+                solve = map if executor is None else executor.map
+                results = solve(
+                    solver.solve_planes, repeat(model), chunks, initial_chunks
+                )
+
+            # results are returned in the order of the chunks so the
+            # outcome is the same as solving in series
+            bar = stack.enter_context(tqdm(total=n, disable=not progress))
+            for chunk, (FOS, iterations) in zip(chunks, results):
+                bar.update(len(chunk))
+                statistics["bishop_planes"] += len(chunk)
+                statistics["bishop_iterations"] += int(iterations.sum())
+                yield chunk, FOS
+
+    def _get_geometry_cache(self, planes, model, num_chunks):
+        """Get the list of cached slice geometry for each chunk of planes,
+        None for chunks not yet calculated. A new empty list is cached if
+        the planes or the model geometry have changed.
+
+        A cache is kept for the two most recently used model geometries
+        so that screening with coarse slices doesn't evict the full
+        resolution geometry.
+        """
+        key = (model.geometry_key(), num_chunks)
+        cache = self._geometry_cache.pop(key, None)
+
+        if cache is None or not np.array_equal(cache["planes"], planes):
+            cache = {"planes": planes.copy(), "chunks": [None] * num_chunks}
+
+        # most recently used last, keep at most two geometries
+        self._geometry_cache[key] = cache
+        while len(self._geometry_cache) > 2:
+            del self._geometry_cache[next(iter(self._geometry_cache))]
+
+        return cache["chunks"]
+
+    def _solve_cached_chunk(self, model, chunk, initial, geometries, index):
+        """Solve a chunk of planes with cached slice geometry, calculating
+        and caching the geometry if needed."""
+        if geometries[index] is None:
+            geometries[index] = solver.plane_geometry(model, chunk)
+        else:
+            self._analysis_statistics["cached_planes"] += len(chunk)
+
+        return solver.solve_planes(model, chunk, initial, geometries[index])
+
+    def _compile_model(self):
+        """Create an immutable snapshot of the model for the batch solvers.
+
+        Returns
+        -------
+        solver.CompiledSlope
+        """
+        if self._water_RL:
+            water_x = self.get_external_x_intersection(self._water_RL)
+        else:
+            water_x = None
+
+        return solver.CompiledSlope(
+            top_coord=tuple(self._top_coord),
+            bot_coord=tuple(self._bot_coord),
+            gradient=self._gradient,
+            external_length=self._external_length,
+            external_height=self._external_height,
+            material_RL=[m.RL for m in self._materials],
+            unit_weight=[m.unit_weight for m in self._materials],
+            cohesion=[m.cohesion for m in self._materials],
+            tan_phi=[m.tan_friction_angle for m in self._materials],
+            udl_left=[udl.left for udl in self._udls],
+            udl_right=[udl.right for udl in self._udls],
+            udl_magnitude=[udl.magnitude for udl in self._udls],
+            udl_left_magnitude=[udl.left_magnitude for udl in self._udls],
+            ll_coord=[ll.coord for ll in self._lls],
+            ll_magnitude=[ll.magnitude for ll in self._lls],
+            water_RL=self._water_RL,
+            water_x=water_x,
+            water_H=self._water_analysis_H,
+            slices=self._slices,
+            tolerance=self._tolerance,
+            max_iterations=self._max_iterations,
+            acceleration=self._acceleration,
+            slicing=self._slicing,
+        )
+
+    def _analyse_circular_failure_ordinary_batch(
+        self, c_x, c_y, radius, x_left, x_right
+    ):
+        """Calculate factor of safety for many circular failure planes at
+        once using the ordinary method, see solver.CompiledSlope.ordinary.
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (factor of safety array, valid mask array).
+        """
+        return self._compile_model().ordinary(
+            c_x, c_y, radius, x_left, x_right
+        )
+
+    def _analyse_circular_failure_bishop_batch(
+        self, c_x, c_y, radius, x_left, x_right
+    ):
+        """Calculate factor of safety for many circular failure planes at
+        once using bishops method, see solver.CompiledSlope.bishop.
+
+        Returns
+        -------
+        np.ndarray
+            factor of safety for each plane, nan where the factor of
+            safety cant be calculated.
+        """
+        return self._compile_model().bishop(c_x, c_y, radius, x_left, x_right)
+
+    def analyse_dynamic(
+        self,
+        critical_fos=1.3,
+        incremental=False,
+        offsets=None,
+        search="secant",
+        tolerance=0.01,
+    ):
         """Analyse slope and offset dynamic loads until critical FOS is achieved
 
+        The number of offsets analysed is available from
+        get_analysis_statistics as "dynamic_analyses".
+
         Parameters
         ----------
         critical_fos : float, optional
             minimum required factor of safety, by default 1.3
+        incremental : bool, optional
+            If true the failure planes and their slice geometry are
+            generated once, with the dynamic loads at the furthest
+            offset, and only the dynamic loads are updated for each
+            offset (see solver.DynamicSolver). Otherwise the slope is
+            reanalysed from scratch for each offset, by default False.
+        offsets : int or sequence, optional
+            If specified, instead of searching for the required offset
+            the critical FOS is calculated for each of these offsets (or
+            this number of evenly spaced offsets from the crest to the
+            furthest offset) together with the incremental analysis. The
+            curve of critical FOS against offset is available from
+            get_dynamic_curve. The curve is always analysed
+            incrementally, so incremental and search can't be set with
+            offsets. The offsets are screened (see
+            solver.DynamicSolver.solve), then the offsets either side of
+            the required offset are solved again without screening and
+            the required offset is interpolated between them and
+            analysed last. If every offset is safe, offset 0 is checked.
+            If none are, the slope is left with the loads at the furthest
+            offset. By default None.
+        search : str, optional
+            Method used to search for the required offset. "secant"
+            interpolates between the last offsets either side of the
+            required offset. "bracket" narrows
+            the range of offsets containing the required offset with the
+            Illinois method until it is no wider than tolerance (see
+            utilities.illinois), with the incremental analysis the
+            nearest and furthest offsets are analysed together. Both
+            searches analyse at most 10 offsets after the nearest and
+            furthest, the "bracket" search then warns if the range is
+            still wider than tolerance.
+            By default "secant".
+        tolerance : float, optional
+            width in metres of the final range of offsets for the
+            "bracket" search, by default 0.01.
+
+        Returns
+        -------
+        float
+            with offsets or the "bracket" search, the required offset of
+            the dynamic loads (0 if the slope is safe with the loads at
+            the crest), None if the critical FOS isnt reached at any
+            offset. If the "bracket" search doesnt narrow the range to
+            tolerance within its 10 analyses a RuntimeWarning is raised,
+            the safe end of the range is returned and the "dynamic_converged"
+            analysis statistic is False.
         """
+        data_validation.assert_contents(search, DYNAMIC_SEARCHES, "search")
+        data_validation.assert_range(tolerance, "tolerance", 0, 100, True)
+
         self._dynamic_results = {}
+        self._dynamic_curve = None
 
         # check case for load at right and load at left before
         # trying to converge on position
@@ -1748,26 +3700,136 @@ class Slope:
         left = self._length
         for udl in self._udls:
             if udl.dynamic_offset:
-                left = max(left, self._top_coord[0] - udl.length)
+                left = max(left, self._top_coord[0] - (udl.length or 0))
 
         left -= 0.01
 
+        if offsets is not None:
+            if incremental or search != "secant":
+                raise ValueError(
+                    "The curve with offsets is always analysed "
+                    "incrementally, incremental and search can't be set "
+                    "with offsets."
+                )
+            return self._analyse_dynamic_curve(critical_fos, offsets, left)
+
+        if incremental:
+            analyse = self._get_dynamic_analysis(left)
+        else:
+
+            def analyse(offsets):
+                return [self._analyse_dynamic_offset(x) for x in offsets]
+
+        def analyse_offsets(offsets):
+            FOS = analyse(offsets)
+            self._dynamic_results.update(zip(offsets, FOS))
+            self._dynamic_analyses += len(offsets)
+            return FOS
+
+        self._dynamic_analyses = 0
+        self._dynamic_converged = True
+        if search == "bracket":
+            setback = self._bracket_dynamic_offset(
+                analyse_offsets,
+                critical_fos,
+                right,
+                left,
+                tolerance,
+                incremental,
+            )
+        else:
+            setback = self._secant_dynamic_offset(
+                analyse_offsets, critical_fos, right, left
+            )
+
+        self._analysis_statistics["dynamic_analyses"] = self._dynamic_analyses
+        if search == "bracket":
+            self._analysis_statistics["dynamic_converged"] = (
+                self._dynamic_converged
+            )
+        self._dynamic_results = dict(
+            sorted(self._dynamic_results.items(), key=lambda item: item[1])
+        )
+
+        return setback
+
+    def _bracket_dynamic_offset(
+        self, analyse_offsets, critical_fos, right, left, tolerance, together
+    ):
+        """Find the required offset of the dynamic loads with the Illinois
+        method, see analyse_dynamic.
+
+        Parameters
+        ----------
+        analyse_offsets : function
+            function analysing a list of offsets, returns the min FOS for
+            each offset.
+        critical_fos : float
+            minimum required factor of safety
+        right, left : float
+            nearest and furthest offsets
+        tolerance : float
+            width of the final bracket in metres
+        together : bool
+            if true the nearest and furthest offsets are analysed
+            together, otherwise the furthest offset is only analysed if
+            the nearest isnt safe.
+
+        Returns
+        -------
+        float
+            required offset, None if the furthest offset isnt safe
+        """
+        if together:
+            right_fos, left_fos = analyse_offsets([right, left])
+        else:
+            (right_fos,) = analyse_offsets([right])
+            left_fos = None
+
+        if right_fos >= critical_fos:
+            return right
+
+        if left_fos is None:
+            (left_fos,) = analyse_offsets([left])
+
+        if not left_fos >= critical_fos:
+            return None
+
+        # required offset is at the safe end of the final bracket
+        unsafe, _, safe, _, _ = utilities.illinois(
+            lambda x: analyse_offsets([x])[0] - critical_fos,
+            right,
+            left,
+            right_fos - critical_fos,
+            left_fos - critical_fos,
+            tolerance,
+            DYNAMIC_ITERATIONS,
+        )
+        self._dynamic_converged = abs(safe - unsafe) <= tolerance
+
+        return safe
+
+    def _secant_dynamic_offset(
+        self, analyse_offsets, critical_fos, right, left
+    ):
+        """Search for the required offset of the dynamic loads with the
+        secant method, see analyse_dynamic and _bracket_dynamic_offset
+        for the parameters. Returns 0 if the slope is safe with the loads
+        at the crest and 1 if not safe at the furthest offset."""
+
+        def analyse_offset(offset):
+            return analyse_offsets([offset])[0]
+
         # check for extreme case with loads at crest (right)
         # if slope is safe (FOS high) then return
-        self._set_dynamic_offset(right)
-        self.analyse_slope()
-        fos = self.get_min_FOS()
-        self._dynamic_results[right] = fos
+        fos = analyse_offset(right)
         if fos > critical_fos:
             return 0
 
         # check for extreme case with loads at end of slope as far
         # away from crest (left)
         # If slope is unsafe (FOS still low) then return
-        self._set_dynamic_offset(left)
-        self.analyse_slope()
-        fos = self.get_min_FOS()
-        self._dynamic_results[left] = fos
+        fos = analyse_offset(left)
         if fos < critical_fos:
             return 1
 
@@ -1782,7 +3844,7 @@ class Slope:
         previous_fos = 0
 
         # converge
-        for _ in range(10):
+        for _ in range(DYNAMIC_ITERATIONS):
             # # check midpoint for FOS
             # midpoint = (left + right) / 2
 
@@ -1793,10 +3855,7 @@ class Slope:
             m = (left_fos - right_fos) / (left - right)
             midpoint = right + (critical_fos - right_fos) / m
 
-            self._set_dynamic_offset(midpoint)
-            self.analyse_slope()
-            fos = self.get_min_FOS()
-            self._dynamic_results[midpoint] = fos
+            fos = analyse_offset(midpoint)
 
             # check if load is within the zone of influence,
             # if last two FOS are identical
@@ -1816,8 +3875,244 @@ class Slope:
 
             previous_fos = fos
 
-        self._dynamic_results = dict(
-            sorted(self._dynamic_results.items(), key=lambda item: item[1])
+    def _analyse_dynamic_curve(self, critical_fos, offsets, max_offset):
+        """Incremental dynamic analysis of a set of offsets, see
+        analyse_dynamic. Returns the required offset."""
+        if isinstance(offsets, Integral):
+            offsets = int(offsets)
+        if np.ndim(offsets) == 0:
+            data_validation.assert_integer(offsets, "offsets")
+            data_validation.assert_range(offsets, "offsets", 2, 10000)
+            offsets = np.linspace(0, max_offset, offsets)
+        else:
+            offsets = np.unique(np.asarray(offsets, dtype=float))
+            data_validation.assert_positive_array(offsets, "offsets")
+            if not len(offsets):
+                raise ValueError("At least one offset is required.")
+
+            # boundary is sized to fit every offset
+            max_offset = max(max_offset, offsets[-1])
+
+        analyse_offsets = self._get_dynamic_analysis(
+            max_offset, offsets.tolist(), DYNAMIC_SCREEN
+        )
+        FOS = analyse_offsets(offsets.tolist())
+        analysed = len(offsets)
+
+        # the offsets either side of the last offset that isnt safe are
+        # solved again without screening, until they dont change
+        exact = np.zeros(len(offsets), dtype=bool)
+        while True:
+            with np.errstate(invalid="ignore"):
+                unsafe = np.flatnonzero(~(FOS >= critical_fos))
+            i = unsafe[-1] if len(unsafe) else -1
+            check = [j for j in (i, i + 1) if 0 <= j < len(offsets)]
+            check = [j for j in check if not exact[j]]
+            if not check:
+                break
+            FOS[check] = analyse_offsets(offsets[check].tolist(), None)
+            exact[check] = True
+            analysed += len(check)
+            last = offsets[check[-1]]
+
+        self._dynamic_curve = {"offset": offsets, "FOS": FOS}
+        self._dynamic_results = dict(zip(offsets.tolist(), FOS.tolist()))
+
+        if i == len(offsets) - 1:
+            # leave the slope with the loads at the furthest offset
+            if last != offsets[i]:
+                analyse_offsets([offsets[i]], None)
+                analysed += 1
+            self._analysis_statistics["dynamic_analyses"] = analysed
+            return None
+
+        if i >= 0:
+            setback = np.interp(
+                critical_fos, FOS[i : i + 2], offsets[i : i + 2]
+            )
+        elif offsets[0] == 0:
+            setback = 0.0
+        else:
+            # every offset is safe, check with the loads at the crest
+            (crest,) = analyse_offsets([0.0], None)
+            self._dynamic_results[0.0] = float(crest)
+            analysed += 1
+            last = setback = 0.0
+            if not crest >= critical_fos:
+                setback = np.interp(
+                    critical_fos, [crest, FOS[0]], [0.0, offsets[0]]
+                )
+
+        # leave the slope with the loads and results at the setback
+        if setback != last:
+            (fos,) = analyse_offsets([setback], None)
+            self._dynamic_results[float(setback)] = float(fos)
+            analysed += 1
+        self._analysis_statistics["dynamic_analyses"] = analysed
+
+        return float(setback)
+
+    def _analyse_dynamic_offset(self, offset):
+        """Analyse the slope with the dynamic loads at offset, returns
+        the minimum FOS."""
+        self._set_dynamic_offset(offset)
+        self.analyse_slope()
+        return self.get_min_FOS()
+
+    def _get_dynamic_analysis(self, max_offset, offsets=(), screen=None):
+        """Set up the incremental dynamic analysis.
+
+        The dynamic loads are moved to max_offset so that the boundary
+        fits every offset up to it, then the failure planes and their
+        slice geometry are generated once. For each offset the planes
+        entering next to the dynamic loads are added, as they would be
+        for a full analysis. The planes for offsets known in advance are
+        analysed with the other planes at every offset.
+
+        Parameters
+        ----------
+        max_offset : float
+            furthest offset of the dynamic loads from the crest
+        offsets : sequence, optional
+            offsets known in advance, by default ().
+        screen : float, optional
+            if specified offsets are screened with an estimate of the
+            FOS of each plane, see solver.DynamicSolver.solve,
+            by default None.
+
+        Returns
+        -------
+        function
+            function analysing the slope with the dynamic loads at each
+            of a sequence of offsets together, returns an array of the
+            minimum FOS for each offset. The screening of the offsets
+            can be overridden with a second argument. The slope is left
+            with the loads at the last offset and the results of its
+            analysis.
+        """
+        self._set_dynamic_offset(max_offset)
+
+        if len(self._individual_planes):
+            planes = self._individual_planes
+        else:
+            self._set_entry_exit_planes()
+            planes = np.concatenate(
+                [self._planes]
+                + [self._get_dynamic_load_planes(offset) for offset in offsets]
+            )
+        known = set(offsets)
+
+        udls = [udl for udl in self._udls if not udl.dynamic_offset]
+        lls = [ll for ll in self._lls if not ll.dynamic_offset]
+        dynamic_udls = [udl for udl in self._udls if udl.dynamic_offset]
+        dynamic_lls = [ll for ll in self._lls if ll.dynamic_offset]
+
+        model = self._compile_model()
+        static = replace(
+            model,
+            udl_left=[udl.left for udl in udls],
+            udl_right=[udl.right for udl in udls],
+            udl_magnitude=[udl.magnitude for udl in udls],
+            udl_left_magnitude=[udl.left_magnitude for udl in udls],
+            ll_coord=[ll.coord for ll in lls],
+            ll_magnitude=[ll.magnitude for ll in lls],
+        )
+
+        dynamic = solver.DynamicSolver(
+            static,
+            planes,
+            udl_length=[udl.length for udl in dynamic_udls],
+            udl_magnitude=[udl.magnitude for udl in dynamic_udls],
+            ll_magnitude=[ll.magnitude for ll in dynamic_lls],
+            udl_end_magnitude=[
+                (
+                    udl.magnitude
+                    if udl.end_magnitude is None
+                    else udl.end_magnitude
+                )
+                for udl in dynamic_udls
+            ],
+            cache=len(planes) * model.slices <= GEOMETRY_CACHE_ELEMENTS,
+            batch_elements=BATCH_ELEMENTS,
+        )
+
+        def analyse_offsets(offsets, screen=screen):
+            extra = [
+                (
+                    self._get_dynamic_load_planes(offset)
+                    if offset not in known
+                    else np.empty(0, dtype=PLANE_DTYPE)
+                )
+                for offset in offsets
+            ]
+            FOS, extra_FOS = dynamic.solve(offsets, extra, screen)
+
+            min_FOS = np.fmin(
+                np.nanmin(FOS, axis=1, initial=np.inf),
+                [np.nanmin(fos, initial=np.inf) for fos in extra_FOS],
+            )
+            min_FOS[np.isinf(min_FOS)] = np.nan
+
+            # planes are sorted by entry point in the solver
+            self._set_dynamic_offset(offsets[-1])
+            self._planes = np.concatenate([dynamic.planes, extra[-1]])
+
+            buffer = SearchBuffer()
+            buffer.add(dynamic.planes, FOS[-1])
+            buffer.add(extra[-1], extra_FOS[-1])
+            self._search = buffer.results()
+
+            statistics = self._analysis_statistics
+            statistics["evaluations"] = dynamic.evaluations
+            statistics["bishop_planes"] = dynamic.evaluations
+            statistics["bishop_iterations"] = dynamic.iterations
+
+            return min_FOS
+
+        return analyse_offsets
+
+    def _get_dynamic_load_planes(self, offset):
+        """Failure planes entering directly next to the dynamic loads at
+        offset for the incremental dynamic analysis, with the exit
+        points and radii of the entry and exit planes. None are added
+        for individually set planes.
+
+        Parameters
+        ----------
+        offset : float
+            offset of the dynamic loads from the crest in metres
+
+        Returns
+        -------
+        np.ndarray
+            structured array of planes with the fields of PLANE_DTYPE.
+        """
+        if len(self._individual_planes):
+            return np.empty(0, dtype=PLANE_DTYPE)
+
+        _, _, r_x, r_y, num_circles = self._get_entry_exit_pairs()
+        r_x, index = np.unique(r_x, return_index=True)
+        r_y = r_y[index]
+
+        # load positions as for _update_udl_coordinates and
+        # _update_ll_coordinates
+        right = self._top_coord[0] - offset
+        left_x = [max(0, right) for ll in self._lls if ll.dynamic_offset] + [
+            max(0, right - udl.length) if udl.length else 0
+            for udl in self._udls
+            if udl.dynamic_offset
+        ]
+        left_x = np.array(left_x, dtype=float) - 0.001
+        left_y = np.full_like(left_x, self._top_coord[1])
+
+        l_x, r_x = (a.ravel() for a in np.meshgrid(left_x, r_x, indexing="ij"))
+        l_y, r_y = (a.ravel() for a in np.meshgrid(left_y, r_y, indexing="ij"))
+
+        distance = np.sqrt((l_x - r_x) ** 2 + (l_y - r_y) ** 2)
+        keep = distance > self._min_failure_distance
+
+        return self._generate_planes_batch(
+            l_x[keep], l_y[keep], r_x[keep], r_y[keep], num_circles
         )
 
     def _set_dynamic_offset(self, offset):
@@ -1917,6 +4212,42 @@ class Slope:
 
         return unique_list
 
+    def _get_circle_external_intersection_batch(self, c_x, c_y, radius):
+        """Get intersection points of many circles with the external boundary.
+
+        Parameters
+        ----------
+        c_x : np.ndarray
+            circle x coordinates
+        c_y : np.ndarray
+            circle y coordinates
+        radius : np.ndarray
+            circle radii
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (left coordinates (n, 2), right coordinates (n, 2),
+            valid mask (n,))
+        """
+        return self._compile_model().circle_intersection(c_x, c_y, radius)
+
+    def _get_load_profile(self):
+        """Get the udls and line loads compiled into a load profile, see
+        solver.LoadProfile. Compiled when first needed after a change."""
+        if self._load_profile is None:
+            self._load_profile = solver.LoadProfile(
+                udl_left=[udl.left for udl in self._udls],
+                udl_right=[udl.right for udl in self._udls],
+                udl_magnitude=[udl.magnitude for udl in self._udls],
+                ll_coord=[ll.coord for ll in self._lls],
+                ll_magnitude=[ll.magnitude for ll in self._lls],
+                udl_left_magnitude=[udl.left_magnitude for udl in self._udls],
+            )
+
+        return self._load_profile
+
     def _calculate_strip_weights(
         self,
         b: float,
@@ -1927,12 +4258,14 @@ class Slope:
 
         Parameters
         ----------
-        b : float
-            strip width in metres
+        b : float or np.ndarray
+            strip width in metres, for a batch of planes an array
+            of shape (n_planes, 1)
         s_yt : np.ndarray
-            array of slice top y coordinates (shape (n,))
+            array of slice top y coordinates (shape (n,) or
+            (n_planes, n_slices))
         s_yb : np.ndarray
-            array of slice bottom y coordinates (shape (n,))
+            array of slice bottom y coordinates (same shape as s_yt)
 
         Returns
         -------
@@ -1951,13 +4284,13 @@ class Slope:
         n = s_yt.size
         if n == 0:
             return np.zeros(
-                0,
+                s_yt.shape,
                 dtype=float,
             )
 
         if not self._materials:
             return np.zeros(
-                n,
+                s_yt.shape,
                 dtype=float,
             )
 
@@ -1978,7 +4311,7 @@ class Slope:
         )
 
         W = np.zeros(
-            n,
+            s_yt.shape,
             dtype=float,
         )
 
@@ -2013,9 +4346,62 @@ class Slope:
 
         return self._materials[-1]
 
+    def get_analysis_statistics(self):
+        """Get statistics for the last analysis.
+
+        Returns
+        -------
+        dict
+            dictionary with the keys "evaluations", the number of failure
+            planes analysed with bishops method, "bishop_planes" and
+            "bishop_iterations", the number of planes solved with the
+            batch solver and their total bishop iterations, and
+            "mean_bishop_iterations", the mean iterations per plane.
+            Polish statistics are included if polishing was used and
+            "dynamic_analyses", the number of offsets analysed, after a
+            dynamic analysis, with "dynamic_converged", whether the range
+            of offsets was narrowed to tolerance, for the "bracket"
+            search.
+        """
+        statistics = dict(self._analysis_statistics)
+        statistics["mean_bishop_iterations"] = (
+            statistics["bishop_iterations"] / statistics["bishop_planes"]
+            if statistics["bishop_planes"]
+            else None
+        )
+        return statistics
+
+    def get_grid_results(self):
+        """Get the minimum factor of safety for each centre of the last
+        grid search (analyse_slope(method="grid")), for contouring.
+
+        Returns
+        -------
+        dict
+            dictionary with keys "x" and "y", the grid centre coordinates,
+            and "FOS", an array of shape (len(y), len(x)) with the minimum
+            factor of safety of the circles about each centre (nan where
+            no circle about the centre was analysed). None if a grid
+            search has not been run.
+        """
+        return self._grid_results
+
     def get_dynamic_results(self):
         return self._dynamic_results
 
+    def get_dynamic_curve(self):
+        """Get the critical FOS against the offset of the dynamic loads
+        from analyse_dynamic with offsets.
+
+        Returns
+        -------
+        dict
+            dictionary with the keys "offset" and "FOS" of arrays of the
+            offsets (sorted) and the critical FOS for each offset. None
+            if the curve hasnt been analysed.
+        """
+        return self._dynamic_curve
+
     def print_dynamic_results(self):
         for k, v in self.get_dynamic_results().items():
             offset = str(round(k, 3))
@@ -2034,7 +4420,7 @@ class Slope:
         float
             critical factor of safety
         """
-        return self._search[0]["FOS"]
+        return self._search.critical["FOS"]
 
     def get_min_FOS_circle(self):
         """Get the properties of the circle that gave the
@@ -2046,10 +4432,8 @@ class Slope:
             Tuple containing:
             (circle x coordinate, circle y coordinate, circle radius)
         """
-        c_x = self._search[0]["c_x"]
-        c_y = self._search[0]["c_y"]
-        radius = self._search[0]["radius"]
-        return (c_x, c_y, radius)
+        critical = self._search.critical
+        return (critical["c_x"], critical["c_y"], critical["radius"])
 
     def get_min_FOS_end_points(self):
         """Get the external boundary intersection for the slope that
@@ -2060,9 +4444,8 @@ class Slope:
         tuple
             tuple containing (left coordinate, right coordinate)
         """
-        l_c = self._search[0]["l_c"]
-        r_c = self._search[0]["r_c"]
-        return (l_c, r_c)
+        critical = self._search.critical
+        return (critical["l_c"], critical["r_c"])
 
     def get_external_y_intersection(self, x):
         """return y coordinate of intersection with boundary for a given x"""
@@ -2247,12 +4630,13 @@ class Slope:
         """
         fig = self.plot_boundary(material_table=material_table, legend=legend)
 
-        FOS = self._search[0]["FOS"]
-        c_x = self._search[0]["c_x"]
-        c_y = self._search[0]["c_y"]
-        radius = self._search[0]["radius"]
-        l_c = self._search[0]["l_c"]
-        r_c = self._search[0]["r_c"]
+        critical = self._search.critical
+        FOS = critical["FOS"]
+        c_x = critical["c_x"]
+        c_y = critical["c_y"]
+        radius = critical["radius"]
+        l_c = critical["l_c"]
+        r_c = critical["r_c"]
 
         fig = self._plot_failure_plane(
             fig, c_x, c_y, radius, l_c, r_c, FOS=FOS, show_center=True
@@ -2522,36 +4906,39 @@ class Slope:
         return fig
 
     def _plot_udl(self, fig, udl):
-        """Add Uniform load to plot"""
+        """Add Uniform or varying load to plot"""
+
+        varying = udl.left_magnitude != udl.magnitude
 
         fig = utilities.draw_arrow(
             fig,
             angle=-90,
-            force=udl.magnitude,
+            force=udl.left_magnitude,
             x_sup=udl.left,
             y_sup=self._top_coord[1],
             color=udl.color,
-            arrowlength=100 * (udl.magnitude / self._udl_max),
-            show_values=False,
-            units="kN",
+            arrowlength=100 * (udl.left_magnitude / self._udl_max),
+            show_values=varying,
+            units="kPa",
             arrowhead=10,
             precision=udl.precision,
         )
 
-        fig = utilities.draw_arrow(
-            fig,
-            angle=-90,
-            force=udl.magnitude,
-            x_sup=(udl.left + udl.right) / 2,
-            y_sup=self._top_coord[1],
-            color="black",
-            arrowlength=100 * (udl.magnitude / self._udl_max) + 10,
-            show_values=True,
-            precision=udl.precision,
-            units="kPa",
-            arrowhead=0,
-            line_width=0,
-        )
+        if not varying:
+            fig = utilities.draw_arrow(
+                fig,
+                angle=-90,
+                force=udl.magnitude,
+                x_sup=(udl.left + udl.right) / 2,
+                y_sup=self._top_coord[1],
+                color="black",
+                arrowlength=100 * (udl.magnitude / self._udl_max) + 10,
+                show_values=True,
+                precision=udl.precision,
+                units="kPa",
+                arrowhead=0,
+                line_width=0,
+            )
 
         fig = utilities.draw_arrow(
             fig,
@@ -2561,13 +4948,15 @@ class Slope:
             y_sup=self._top_coord[1],
             color=udl.color,
             arrowlength=100 * (udl.magnitude / self._udl_max),
-            show_values=False,
-            units="kN",
+            show_values=varying,
+            units="kPa",
             arrowhead=10,
+            precision=udl.precision,
         )
 
         # Draw in line above arrows
-        y0 = 100 * (udl.magnitude / self._udl_max)
+        y0 = 100 * (udl.left_magnitude / self._udl_max)
+        y1 = 100 * (udl.magnitude / self._udl_max)
 
         shape = dict(
             type="line",
@@ -2576,7 +4965,7 @@ class Slope:
             x0=udl.left,
             y0=y0,
             x1=udl.right,
-            y1=y0,
+            y1=y1,
             line_color=udl.color,
             line_width=2,
             ysizemode="pixel",
@@ -2586,15 +4975,15 @@ class Slope:
 
         fig.add_shape(shape)
 
-        # draw in rectangular area
+        # draw in loaded area
         shape = dict(
-            type="rect",
+            type="path",
             xref="x",
             yref="y",
-            x0=udl.left,
-            y0=0,
-            x1=udl.right,
-            y1=y0,
+            path=(
+                f"M {udl.left},0 L {udl.left},{y0} "
+                f"L {udl.right},{y1} L {udl.right},0 Z"
+            ),
             fillcolor=udl.color,
             opacity=0.2,
             line_width=2,
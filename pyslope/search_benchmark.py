@@ -0,0 +1,58 @@
+# to benchmark the minimum FOS found against the number of planes analysed
+# for the entry and exit grid, halton sampling and radius search methods
+from pyslope import Slope, Material, Udl, LineLoad
+
+s = Slope(height=1, angle=None, length=1.5)
+
+m1 = Material(20, 40, 1, 0.3)
+m2 = Material(20, 35, 2, 1)
+m3 = Material(18, 30, 0, 1.5)
+m4 = Material(16, 27, 0.1, 2)
+m5 = Material(17, 22, 0, 3)
+m6 = Material(19, 28, 0, 5)
+
+s.set_materials(m1, m2, m3, m4, m5, m6)
+
+s.set_lls(
+    LineLoad(magnitude=5, offset=0.5),
+    LineLoad(magnitude=20, offset=2.5),
+)
+s.set_udls(
+    Udl(magnitude=100, offset=1, length=0.5),
+    Udl(magnitude=300, offset=3, length=0.5),
+)
+
+s.update_water_analysis_options(auto=False, H=0.98)
+s.set_water_table(1)
+
+if __name__ == "__main__":
+    seeds = range(5)
+
+    print(
+        f"{'planes':>8} {'grid':>8} {'halton':>8} "
+        f"{'halton (mean of seeds)':>24} {'radius search':>14}"
+    )
+
+    for iterations in (500, 1000, 2500, 5000, 10000, 25000):
+        s.update_analysis_options(slices=25, iterations=iterations)
+
+        s.analyse_slope()
+        grid = s.get_min_FOS()
+        planes = s.get_analysis_statistics()["evaluations"]
+
+        s.analyse_slope(method="halton")
+        halton = s.get_min_FOS()
+
+        s.analyse_slope(method="radius_search")
+        radius_search = s.get_min_FOS()
+
+        seeded = []
+        for seed in seeds:
+            s.update_halton_options(seed=seed)
+            s.analyse_slope(method="halton")
+            seeded.append(s.get_min_FOS())
+
+        print(
+            f"{planes:>8} {grid:>8.4f} {halton:>8.4f} "
+            f"{sum(seeded) / len(seeded):>24.4f} {radius_search:>14.4f}"
+        )
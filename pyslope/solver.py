@@ -0,0 +1,1516 @@
+"""Batch solvers for analysing many circular failure planes at once.
+
+The solvers work from a CompiledSlope, an immutable snapshot of the
+properties of a Slope that are required for analysis. As the snapshot
+holds no reference to the Slope it can be shared between threads or
+pickled and sent to worker processes.
+"""
+
+# standard library imports
+from dataclasses import dataclass
+
+# third party imports
+import numpy as np
+
+# width of the slice holding each line load with breakpoint slicing
+LINE_LOAD_WIDTH = 1e-6
+
+# have to do this to allow for relative imports
+# have to allow for relative imports so also works with django
+
+# if using this file or sphinx, cant be relative
+if __name__ in ("__main__", "solver", "__mp_main__"):
+    import data_validation
+    import utilities
+# if running from django need to use relative
+else:
+    from . import data_validation
+    from . import utilities
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledSlope:
+    """Immutable snapshot of the slope properties required for analysis.
+
+    Created with Slope._compile_model, should not need to be created
+    directly. Material properties are ordered from the top material to
+    the bottom material. Array attributes are made read only.
+
+    Parameters
+    ----------
+    top_coord : tuple
+        (x, y) coordinate of the top of the slope
+    bot_coord : tuple
+        (x, y) coordinate of the bottom of the slope
+    gradient : float
+        gradient of the slope (height / length)
+    external_length : float
+        length of the model
+    external_height : float
+        height of the model
+    material_RL : np.ndarray
+        reduced level of the bottom of each material
+    unit_weight : np.ndarray
+        unit weight of each material in kN/m3
+    cohesion : np.ndarray
+        cohesion of each material in kPa
+    tan_phi : np.ndarray
+        tangent of the friction angle of each material
+    udl_left : np.ndarray
+        left x coordinate of each udl
+    udl_right : np.ndarray
+        right x coordinate of each udl
+    udl_magnitude : np.ndarray
+        magnitude of each udl in kPa, at the right end of varying udls
+    ll_coord : np.ndarray
+        x coordinate of each line load
+    ll_magnitude : np.ndarray
+        magnitude of each line load in kN/m
+    water_RL : float
+        reduced level of the water table, None if no water table
+    water_x : float
+        x coordinate of the intersection of the water table and the
+        slope, None if no water table
+    water_H : float
+        factor on water pressure for slices between the water
+        intersection and the bottom of the slope
+    slices : int
+        number of slices for each failure plane
+    tolerance : float
+        convergance tolerance on bishops factor of safety
+    max_iterations : int
+        maximum number of iterations for convergence on bishops
+        factor of safety
+    acceleration : bool
+        if true bishops factor of safety is found with newton steps on
+        the bishop equation rather than fixed point iteration, by
+        default False.
+    slicing : str
+        "uniform" for equal width slices or "breakpoints" to also place
+        slice boundaries where the slope geometry, loads, materials or
+        water table change, by default "uniform".
+    udl_left_magnitude : np.ndarray
+        magnitude of each udl at its left end in kPa, the load varies
+        linearly to udl_magnitude at the right end. By default None
+        (uniform udls).
+    """
+
+    top_coord: tuple
+    bot_coord: tuple
+    gradient: float
+    external_length: float
+    external_height: float
+    material_RL: np.ndarray
+    unit_weight: np.ndarray
+    cohesion: np.ndarray
+    tan_phi: np.ndarray
+    udl_left: np.ndarray
+    udl_right: np.ndarray
+    udl_magnitude: np.ndarray
+    ll_coord: np.ndarray
+    ll_magnitude: np.ndarray
+    water_RL: float
+    water_x: float
+    water_H: float
+    slices: int
+    tolerance: float
+    max_iterations: int
+    acceleration: bool = False
+    slicing: str = "uniform"
+    udl_left_magnitude: np.ndarray = None
+
+    def __post_init__(self):
+        if self.udl_left_magnitude is None:
+            object.__setattr__(self, "udl_left_magnitude", self.udl_magnitude)
+
+        for name in (
+            "material_RL",
+            "unit_weight",
+            "cohesion",
+            "tan_phi",
+            "udl_left",
+            "udl_right",
+            "udl_magnitude",
+            "udl_left_magnitude",
+            "ll_coord",
+            "ll_magnitude",
+        ):
+            array = np.array(getattr(self, name), dtype=float)
+            array.setflags(write=False)
+            object.__setattr__(self, name, array)
+
+        # layer tops and bottoms used for calculating strip weights,
+        # last material extends downwards indefinitely.
+        bottoms = self.material_RL.copy()
+        if len(bottoms):
+            bottoms[-1] = -np.inf
+        tops = np.concatenate([[self.external_height], bottoms[:-1]])
+
+        bottoms.setflags(write=False)
+        tops.setflags(write=False)
+        object.__setattr__(self, "_layer_bottoms", bottoms)
+        object.__setattr__(self, "_layer_tops", tops)
+
+        # loads compiled once for loading the slices of every plane
+        object.__setattr__(
+            self,
+            "_load_profile",
+            LoadProfile(
+                self.udl_left,
+                self.udl_right,
+                self.udl_magnitude,
+                self.ll_coord,
+                self.ll_magnitude,
+                self.udl_left_magnitude,
+            ),
+        )
+
+    def geometry_key(self):
+        """Key identifying everything slice_geometry depends on, models
+        with equal keys give the same slice geometry for a plane."""
+        key = (
+            tuple(self.top_coord),
+            tuple(self.bot_coord),
+            self.gradient,
+            self.external_length,
+            self.external_height,
+            tuple(self.material_RL),
+            tuple(self.unit_weight),
+            tuple(self.cohesion),
+            tuple(self.tan_phi),
+            self.slices,
+            self.slicing,
+        )
+
+        # breakpoint slice boundaries depend on the loads and water table
+        if self.slicing == "breakpoints":
+            key += (
+                tuple(self.udl_left),
+                tuple(self.udl_right),
+                tuple(self.ll_coord),
+                self.water_RL,
+                self.water_x,
+            )
+
+        return key
+
+    @property
+    def surface(self):
+        """Polyline of the slope surface from the left of the model to
+        the right of the model."""
+        return (
+            (0, self.top_coord[1]),
+            self.top_coord,
+            self.bot_coord,
+            (self.external_length, self.bot_coord[1]),
+        )
+
+    def circle_intersection(self, c_x, c_y, radius):
+        """Get intersection points of many circles with the slope surface.
+
+        Parameters
+        ----------
+        c_x : np.ndarray
+            circle x coordinates
+        c_y : np.ndarray
+            circle y coordinates
+        radius : np.ndarray
+            circle radii
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (left coordinates (n, 2), right coordinates (n, 2),
+            valid mask (n,))
+        """
+        return utilities.circle_polyline_intersection(
+            c_x, c_y, radius, self.surface
+        )
+
+    def strip_weights(self, b, s_yt, s_yb):
+        """Calculate soil weight of slices.
+
+        Parameters
+        ----------
+        b : float or np.ndarray
+            strip width in metres, for a batch of planes an array
+            of shape (n_planes, 1)
+        s_yt : np.ndarray
+            array of slice top y coordinates
+        s_yb : np.ndarray
+            array of slice bottom y coordinates (same shape as s_yt)
+
+        Returns
+        -------
+        np.ndarray
+            array of weights (kN) for each slice
+        """
+        W = np.zeros(np.shape(s_yt), dtype=float)
+
+        # loop over (few) materials and accumulate overlap contribution
+        for top, bottom, uw in zip(
+            self._layer_tops, self._layer_bottoms, self.unit_weight
+        ):
+            overlap = np.minimum(s_yt, top)
+            overlap -= np.maximum(s_yb, bottom)
+            overlap[overlap < 0.0] = 0.0  # in-place clip
+            W += uw * overlap
+
+        W *= b
+        return W
+
+    def slice_geometry(self, c_x, c_y, radius, x_left, x_right):
+        """Calculate the slice geometry and soil weights for many failure
+        planes at once.
+
+        These only depend on the slope boundary, materials and slicing so
+        can be reused when only the loads or water table change (except
+        for breakpoint slicing, where slice boundaries depend on the loads
+        and water table). See slice_properties for the parameters.
+
+        Returns
+        -------
+        dict
+            dictionary with the keys "slice_width", "slice_x", "xl", "xr"
+            (slice centre, left and right x coordinates), "slice_yt",
+            "base_yb" (slice top and mean base y coordinates),
+            "cos_alpha", "sin_alpha", "W" (soil weight), "cohesion",
+            "tan_phi" and "valid".
+        """
+        c_x, c_y, radius = c_x[:, None], c_y[:, None], radius[:, None]
+        x_left, x_right = x_left[:, None], x_right[:, None]
+        num_slices = self.slices
+
+        total_width = x_right - x_left
+        valid = total_width[:, 0] > 1e-6
+
+        top_x, top_y = self.top_coord
+        bot_x, bot_y = self.bot_coord
+
+        if self.slicing == "breakpoints":
+            bounds = self._slice_boundaries(c_x, c_y, radius, x_left, x_right)
+            xl, xr = bounds[:, :-1], bounds[:, 1:]
+            slice_width = xr - xl
+            slice_x = (xl + xr) / 2
+
+        else:
+            slice_width = total_width / num_slices
+            half_width = slice_width / 2
+
+            # Centers of slices along x-axis
+            slice_x = np.linspace(
+                x_left[:, 0] + half_width[:, 0],
+                x_right[:, 0] - half_width[:, 0],
+                num_slices,
+                axis=1,
+            )
+            xl = slice_x - half_width
+            xr = slice_x + half_width
+
+        # --- Bottom of slice (on circle) ---
+        dx_sq = (slice_x - c_x) ** 2
+        radius_sq = radius**2
+
+        # zero width slices padding breakpoint slicing lie on the end of
+        # the plane, where rounding can put them just outside the circle
+        used = slice_width > 0
+        valid &= ~np.any((dx_sq > radius_sq) & used, axis=1)
+
+        slice_yb = c_y - np.sqrt(np.maximum(radius_sq - dx_sq, 0.0))
+
+        # mean height of the base over the slice, for the slice area
+        if self.slicing == "breakpoints":
+            base_yb = _mean_circle_base(c_x, c_y, radius, xl, xr, slice_yb)
+        else:
+            base_yb = slice_yb
+
+        # --- Top of slice (on slope surface) ---
+        slice_yt = np.where(
+            slice_x <= top_x,
+            top_y,
+            np.where(
+                slice_x >= bot_x,
+                bot_y,
+                top_y - (slice_x - top_x) * self.gradient,
+            ),
+        )
+        slice_yt = np.maximum(slice_yt, slice_yb)
+
+        # --- Slice geometry ---
+        with np.errstate(divide="ignore", invalid="ignore"):
+            alpha = np.arctan((c_x - slice_x) / (c_y - slice_yb))
+        cos_alpha = np.cos(alpha)
+        sin_alpha = np.sin(alpha)
+        valid &= ~np.any((cos_alpha == 0) & used, axis=1)
+
+        # --- Slice weights ---
+        W = self.strip_weights(slice_width, slice_yt, base_yb)
+
+        # --- Material properties ---
+        # slice takes the first material from the top with a bottom below
+        # the base of the slice, otherwise the last material.
+        if len(self.material_RL):
+            index = np.searchsorted(-self.material_RL, -slice_yb, side="right")
+            index = np.minimum(index, len(self.material_RL) - 1)
+            cohesion = self.cohesion[index]
+            tan_phi = self.tan_phi[index]
+        else:
+            cohesion = np.zeros_like(W)
+            tan_phi = np.zeros_like(W)
+            valid[:] = False
+
+        return {
+            "slice_width": slice_width,
+            "slice_x": slice_x,
+            "xl": xl,
+            "xr": xr,
+            "slice_yt": slice_yt,
+            "base_yb": base_yb,
+            "cos_alpha": cos_alpha,
+            "sin_alpha": sin_alpha,
+            "W": W,
+            "cohesion": cohesion,
+            "tan_phi": tan_phi,
+            "valid": valid,
+        }
+
+    def slice_properties(
+        self, c_x, c_y, radius, x_left, x_right, geometry=None
+    ):
+        """Calculate slice properties for many failure planes at once.
+
+        Every argument is a 1D array with one value per failure plane. The
+        returned arrays have shape (n_planes, n_slices), except for the
+        valid mask which has shape (n_planes,) and the slice width which
+        has shape (n_planes, 1) for uniform slicing.
+
+        With breakpoint slicing, slice boundaries are also placed at the
+        slope crest and toe, load edges, line loads, the water table
+        intersection with the slope and where the failure plane and the
+        slope surface cross material boundaries and the water table.
+        Within each slice the slope surface is then straight and the
+        slice base and top are each within a single material, so using
+        the exact mean height of the circular base gives the exact slice
+        area. Unused breakpoints become zero width slices, which don't
+        contribute to the factor of safety.
+
+        Parameters
+        ----------
+        c_x : np.ndarray
+            circle center x coordinates
+        c_y : np.ndarray
+            circle center y coordinates
+        radius : np.ndarray
+            circle radii
+        x_left : np.ndarray
+            x coordinates of the left intersection between the boundary
+            and the failure planes
+        x_right : np.ndarray
+            x coordinates of the right intersection between the boundary
+            and the failure planes
+        geometry : dict, optional
+            slice geometry from slice_geometry if already calculated for
+            the planes, by default None.
+
+        Returns
+        -------
+        dict
+            dictionary of slice properties with the keys "slice_width",
+            "cos_alpha", "sin_alpha", "W", "head", "cohesion", "tan_phi"
+            and "valid". "head" is the water pressure per unit length of
+            the slice base (kPa), zero if there is no water table.
+        """
+        g = geometry
+        if g is None:
+            g = self.slice_geometry(c_x, c_y, radius, x_left, x_right)
+
+        xl, xr, slice_x = g["xl"], g["xr"], g["slice_x"]
+        slice_yt, base_yb = g["slice_yt"], g["base_yb"]
+        bot_x = self.bot_coord[0]
+
+        # soil weight is copied so cached geometry isn't changed
+        W = g["W"].copy()
+
+        # --- Add distributed and line loads ---
+        W += self._load_profile.load(xl, xr)
+
+        # --- Water pressure ---
+        if self.water_RL:
+            mask = (self.water_x < slice_x) & (slice_x < bot_x)
+            head = (
+                np.maximum(np.minimum(self.water_RL, slice_yt) - base_yb, 0.0)
+                * 9.81
+                * np.where(mask, self.water_H, 1.0)
+            )
+        else:
+            head = np.zeros_like(W)
+
+        return {
+            "slice_width": g["slice_width"],
+            "cos_alpha": g["cos_alpha"],
+            "sin_alpha": g["sin_alpha"],
+            "W": W,
+            "head": head,
+            "cohesion": g["cohesion"],
+            "tan_phi": g["tan_phi"],
+            "valid": g["valid"],
+        }
+
+    def _slice_boundaries(self, c_x, c_y, radius, x_left, x_right):
+        """Slice boundaries for breakpoint slicing, see slice_properties.
+
+        Parameters are (n_planes, 1) arrays. Returns an array of sorted
+        slice boundary x coordinates with slices + 1 columns. The slices
+        left after the breakpoints inside each plane are spaced evenly
+        across it. A plane that crosses more breakpoints than slices
+        keeps every breakpoint, in which case the array is widened and
+        the other planes are padded with zero width slices at x_right.
+        """
+        top_x, top_y = self.top_coord
+        bot_x, bot_y = self.bot_coord
+
+        # levels where the material or water pressure changes
+        levels = list(self.material_RL[:-1])
+        if self.water_RL:
+            levels.append(self.water_RL)
+        levels = np.array(levels, dtype=float)
+
+        # breakpoints common to every plane, including where levels
+        # intersect the slope face
+        fixed = [top_x, bot_x, *self.udl_left, *self.udl_right]
+
+        # line loads get a very narrow slice of their own so the load is
+        # applied to the base directly below it
+        fixed += list(self.ll_coord - LINE_LOAD_WIDTH / 2)
+        fixed += list(self.ll_coord + LINE_LOAD_WIDTH / 2)
+        if self.water_RL:
+            fixed.append(self.water_x)
+        on_face = levels[(levels > bot_y) & (levels < top_y)]
+        fixed += list(top_x + (top_y - on_face) / self.gradient)
+        fixed = np.broadcast_to(
+            np.array(fixed, dtype=float), (len(c_x), len(fixed))
+        )
+
+        # where the failure plane crosses each level
+        with np.errstate(invalid="ignore"):
+            half_chord = np.sqrt(radius**2 - (c_y - levels) ** 2)
+        crossing = np.concatenate([c_x - half_chord, c_x + half_chord], axis=1)
+
+        breakpoints = np.concatenate([fixed, crossing], axis=1)
+        inside = (breakpoints > x_left) & (breakpoints < x_right)
+        breakpoints = np.where(inside, breakpoints, np.nan)
+
+        # the remaining slices of each plane are evenly spaced
+        uniform = np.maximum(
+            self.slices - inside.sum(axis=1, keepdims=True), 1
+        )
+        step = np.arange(self.slices + 1)
+        even = x_left + (x_right - x_left) * (step / uniform)
+        even = np.where(step == uniform, x_right, even)
+        even = np.where(step <= uniform, even, np.nan)
+
+        # nan sorts last, so unused columns become zero width slices
+        bounds = np.sort(np.concatenate([even, breakpoints], axis=1), axis=1)
+        used = np.isfinite(bounds).sum(axis=1).max(initial=0)
+        columns = max(self.slices + 1, int(used))
+        bounds = bounds[:, :columns]
+        return np.where(np.isnan(bounds), x_right, bounds)
+
+    def ordinary(
+        self, c_x, c_y, radius, x_left, x_right, slice_properties=None
+    ):
+        """Calculate factor of safety for many circular failure planes at
+        once using the ordinary method (swedish method of slices).
+
+        Parameters
+        ----------
+        c_x : np.ndarray
+            circle center x coordinates
+        c_y : np.ndarray
+            circle center y coordinates
+        radius : np.ndarray
+            circle radii
+        x_left : np.ndarray
+            x coordinates of the left intersection between the boundary
+            and the failure planes
+        x_right : np.ndarray
+            x coordinates of the right intersection between the boundary
+            and the failure planes
+        slice_properties : dict, optional
+            slice properties from slice_properties if already
+            calculated for the planes, by default None.
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (factor of safety array, valid mask array). The factor of
+            safety is nan where it cant be calculated.
+        """
+        c_x, c_y, radius, x_left, x_right = _as_arrays(
+            c_x, c_y, radius, x_left, x_right
+        )
+
+        # --- Validate input (once for the whole batch) ---
+        for value, name in [
+            (c_x, "c_x (circle x coordinate)"),
+            (c_y, "c_y (circle y coordinate)"),
+            (radius, "radius"),
+        ]:
+            data_validation.assert_positive_array(value, name)
+
+        p = slice_properties
+        if p is None:
+            p = self.slice_properties(c_x, c_y, radius, x_left, x_right)
+        b = p["slice_width"]
+        cos_alpha, W, tan_phi = p["cos_alpha"], p["W"], p["tan_phi"]
+
+        # --- Forces ---
+        driving = np.sum(W * p["sin_alpha"], axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            length_base = b / cos_alpha
+            U = p["head"] * length_base
+            resisting = np.sum(
+                p["cohesion"] * length_base
+                + np.maximum(0.0, W * cos_alpha - U) * tan_phi,
+                axis=1,
+            )
+            FS = resisting / driving
+
+        valid = p["valid"] & (driving > 0)
+        FS[~valid] = np.nan
+
+        return FS, valid
+
+    def bishop(
+        self,
+        c_x,
+        c_y,
+        radius,
+        x_left,
+        x_right,
+        initial=None,
+        return_iterations=False,
+        geometry=None,
+    ):
+        """Calculate factor of safety for many circular failure planes at
+        once using bishops method.
+
+        The bishop iteration is run for all planes together, planes are
+        removed from the iteration as they individually converge.
+
+        With acceleration each iteration is a newton step on
+        F - g(F) = 0, where g is the bishop fixed point update, using the
+        analytical derivative of g. A step that doesnt give a positive
+        factor of safety falls back to the fixed point update.
+
+        Parameters
+        ----------
+        c_x : np.ndarray
+            circle center x coordinates
+        c_y : np.ndarray
+            circle center y coordinates
+        radius : np.ndarray
+            circle radii
+        x_left : np.ndarray
+            x coordinates of the left intersection between the boundary
+            and the failure planes
+        x_right : np.ndarray
+            x coordinates of the right intersection between the boundary
+            and the failure planes
+        initial : np.ndarray, optional
+            initial estimate of the factor of safety for each plane, for
+            example from a similar plane already solved. Where not
+            positive and finite the ordinary method is used, by default
+            None (ordinary method for all planes).
+        return_iterations : bool, optional
+            if true also return the number of iterations for each plane,
+            by default False.
+        geometry : dict, optional
+            slice geometry from slice_geometry if already calculated for
+            the planes, by default None.
+
+        Returns
+        -------
+        np.ndarray or tuple
+            factor of safety for each plane, nan where the factor of
+            safety cant be calculated. If return_iterations is true,
+            Tuple containing: (factor of safety, iterations).
+        """
+        c_x, c_y, radius, x_left, x_right = _as_arrays(
+            c_x, c_y, radius, x_left, x_right
+        )
+
+        p = self.slice_properties(
+            c_x, c_y, radius, x_left, x_right, geometry=geometry
+        )
+        b = p["slice_width"]
+        cos_alpha, sin_alpha = p["cos_alpha"], p["sin_alpha"]
+        W, cohesion, tan_phi = p["W"], p["cohesion"], p["tan_phi"]
+
+        driving = np.sum(W * sin_alpha, axis=1)
+
+        # --- Initial estimate of the Factor of Safety ---
+        # warm start where given, otherwise using the Ordinary Method
+        if initial is None:
+            warm = np.zeros(c_x.shape, dtype=bool)
+        else:
+            initial = np.broadcast_to(
+                np.asarray(initial, dtype=float), c_x.shape
+            )
+            with np.errstate(invalid="ignore"):
+                warm = np.isfinite(initial) & (initial > 0)
+
+        if warm.all():
+            prev_FS = initial.copy()
+            valid = p["valid"] & (driving > 0)
+        else:
+            prev_FS, valid = self.ordinary(
+                c_x, c_y, radius, x_left, x_right, slice_properties=p
+            )
+            if warm.any():
+                prev_FS[warm] = initial[warm]
+
+        # --- Iterative Bishop solution ---
+        FS = np.full(c_x.shape, np.nan)
+        iterations = np.zeros(c_x.shape, dtype=int)
+        active = valid.copy()
+        U = p["head"] * b
+
+        for _ in range(self.max_iterations):
+            if not np.any(active):
+                break
+
+            rows = np.flatnonzero(active)
+            iterations[rows] += 1
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                m = sin_alpha[rows] * tan_phi[rows]
+                denom = cos_alpha[rows] + m / prev_FS[rows, None]
+                N = (
+                    cohesion[rows] * b[rows]
+                    + (W[rows] - U[rows]) * tan_phi[rows]
+                )
+                resisting = np.sum(N / denom, axis=1)
+
+            failed = np.any(denom == 0, axis=1) | (resisting < 0)
+            fos = resisting / driving[rows]
+
+            if self.acceleration:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    F = prev_FS[rows]
+                    # derivative of the fixed point update g(F)
+                    dg = np.sum(N * m / denom**2, axis=1) / (
+                        F**2 * driving[rows]
+                    )
+                    newton = F - (F - fos) / (1 - dg)
+                fos = np.where(np.isfinite(newton) & (newton > 0), newton, fos)
+
+            converged = ~failed & (
+                np.abs(fos - prev_FS[rows]) < self.tolerance
+            )
+            FS[rows[converged]] = fos[converged]
+
+            active[rows[failed | converged]] = False
+            prev_FS[rows] = fos
+
+        # planes that didnt converge take the last calculated value
+        FS[active] = prev_FS[active]
+
+        if return_iterations:
+            return FS, iterations
+
+        return FS
+
+
+def solve_planes(model, planes, initial=None, geometry=None):
+    """Calculate bishops factor of safety for a structured array of planes.
+
+    Module level so that it can be submitted to a process pool.
+
+    Parameters
+    ----------
+    model : CompiledSlope
+        compiled model to solve against
+    planes : np.ndarray
+        structured array of planes with l_x, r_x, c_x, c_y and radius fields
+    initial : np.ndarray, optional
+        initial estimate of the factor of safety for each plane, see
+        CompiledSlope.bishop, by default None.
+    geometry : dict, optional
+        slice geometry of the planes from CompiledSlope.slice_geometry,
+        by default None.
+
+    Returns
+    -------
+    tuple
+        Tuple containing:
+        (factor of safety for each plane, nan where the factor of
+        safety cant be calculated, bishop iterations for each plane)
+    """
+    return model.bishop(
+        planes["c_x"],
+        planes["c_y"],
+        planes["radius"],
+        planes["l_x"],
+        planes["r_x"],
+        initial=initial,
+        return_iterations=True,
+        geometry=geometry,
+    )
+
+
+class LoadProfile:
+    """Distributed and line loads compiled into cumulative load profiles.
+
+    The distributed load intensity is piecewise linear in x between the
+    sorted load ends, so its integral from the left of the model is
+    piecewise quadratic and is stored at each load end. The load on a
+    slice is the difference of the integral at the slice boundaries
+    plus the difference of the cumulative line loads, each found with a
+    binary search. The cost of loading slices doesnt depend on the
+    number of loads.
+
+    Parameters
+    ----------
+    udl_left, udl_right, udl_magnitude : sequence, optional
+        left and right x coordinate of each udl and its magnitude (kPa)
+        at the right end
+    ll_coord, ll_magnitude : sequence, optional
+        x coordinate and magnitude (kN/m) of each line load
+    udl_left_magnitude : sequence, optional
+        magnitude (kPa) of each udl at the left end, the load varies
+        linearly between the ends. By default None (uniform loads).
+
+    Examples
+    --------
+    >>> profile = LoadProfile([0, 2], [4, 3], [10, 20], [1], [5], [0, 20])
+    >>> profile.load(np.array([0, 1, 2, 3]), np.array([1, 2, 3, 4]))
+    array([ 1.25,  8.75, 26.25,  8.75])
+    """
+
+    def __init__(
+        self,
+        udl_left=(),
+        udl_right=(),
+        udl_magnitude=(),
+        ll_coord=(),
+        ll_magnitude=(),
+        udl_left_magnitude=None,
+    ):
+        left = np.array(udl_left, dtype=float)
+        right = np.array(udl_right, dtype=float)
+        magnitude = np.array(udl_magnitude, dtype=float)
+        if udl_left_magnitude is None:
+            left_magnitude = magnitude
+        else:
+            left_magnitude = np.array(udl_left_magnitude, dtype=float)
+
+        # loads with no length dont add anything
+        keep = right > left
+        left, right = left[keep], right[keep]
+        magnitude, left_magnitude = magnitude[keep], left_magnitude[keep]
+
+        # intensity of each load is constant + slope * x, added to the
+        # segments between load ends with a difference array
+        x = np.unique(np.concatenate([left, right]))
+        slope = (magnitude - left_magnitude) / (right - left)
+        constant = left_magnitude - slope * left
+
+        start = np.searchsorted(x, left)
+        end = np.searchsorted(x, right)
+        segment_constant = np.zeros(len(x) + 1)
+        segment_slope = np.zeros(len(x) + 1)
+        np.add.at(segment_constant, start, constant)
+        np.add.at(segment_constant, end, -constant)
+        np.add.at(segment_slope, start, slope)
+        np.add.at(segment_slope, end, -slope)
+        segment_constant = np.cumsum(segment_constant)[:-1]
+        segment_slope = np.cumsum(segment_slope)[:-1]
+
+        # no load to the right of the last load end
+        if len(x):
+            segment_constant[-1] = 0
+            segment_slope[-1] = 0
+
+        # intensity at the start of each segment and its slope
+        self.x = x
+        self.intensity = segment_constant + segment_slope * x
+        self.slope = segment_slope
+
+        # integral of the intensity from the left to each load end
+        width = np.diff(x)
+        self.cumulative = np.concatenate(
+            [
+                [0.0],
+                np.cumsum(
+                    self.intensity[:-1] * width
+                    + self.slope[:-1] * width**2 / 2
+                ),
+            ]
+        )
+
+        # cumulative line loads, first value for no line loads
+        order = np.argsort(ll_coord, kind="stable")
+        self.ll_coord = np.array(ll_coord, dtype=float)[order]
+        self.ll_cumulative = np.concatenate(
+            [[0.0], np.cumsum(np.array(ll_magnitude, dtype=float)[order])]
+        )
+
+    def distributed(self, x):
+        """Integral of the distributed load intensity from the left of
+        the model to x (kN/m run of slope), same shape as x."""
+        x = np.asarray(x, dtype=float)
+        if not len(self.x):
+            return np.zeros(x.shape)
+
+        # segment starting at or before x, start of the first segment
+        # (no load) if before every load
+        index = np.searchsorted(self.x, x, side="right") - 1
+        index = np.clip(index, 0, len(self.x) - 1)
+        distance = np.maximum(x - self.x[index], 0.0)
+
+        return (
+            self.cumulative[index]
+            + self.intensity[index] * distance
+            + self.slope[index] * distance**2 / 2
+        )
+
+    def load(self, xl, xr):
+        """Load (kN) applied to slices by the distributed and line loads.
+
+        Line loads are applied to the slice with xl <= coordinate < xr.
+
+        Parameters
+        ----------
+        xl : np.ndarray
+            slice left x coordinates
+        xr : np.ndarray
+            slice right x coordinates
+
+        Returns
+        -------
+        np.ndarray
+            load on each slice, same shape as xl
+        """
+        load = self.distributed(xr) - self.distributed(xl)
+
+        if len(self.ll_coord):
+            load = load + (
+                self.ll_cumulative[np.searchsorted(self.ll_coord, xr)]
+                - self.ll_cumulative[np.searchsorted(self.ll_coord, xl)]
+            )
+
+        return load
+
+
+def surcharge(
+    xl,
+    xr,
+    udl_left,
+    udl_right,
+    udl_magnitude,
+    ll_coord,
+    ll_magnitude,
+    udl_left_magnitude=None,
+):
+    """Load (kN) applied to slices by distributed and line loads.
+
+    Load coordinates may be scalars or arrays that broadcast against the
+    slices, for example of shape (n_planes, 1) for a different load
+    position for each plane. Loads at fixed positions are compiled into
+    a LoadProfile, otherwise each load is added in turn.
+
+    Parameters
+    ----------
+    xl : np.ndarray
+        slice left x coordinates
+    xr : np.ndarray
+        slice right x coordinates
+    udl_left, udl_right, udl_magnitude : sequence
+        left and right x coordinate and magnitude (kPa) at the right end
+        of each udl
+    ll_coord, ll_magnitude : sequence
+        x coordinate and magnitude (kN/m) of each line load
+    udl_left_magnitude : sequence, optional
+        magnitude (kPa) at the left end of each udl, by default None
+        (uniform loads).
+
+    Returns
+    -------
+    np.ndarray
+        load on each slice, same shape as xl
+    """
+    if udl_left_magnitude is None:
+        udl_left_magnitude = udl_magnitude
+
+    if all(np.ndim(x) == 0 for x in [*udl_left, *udl_right, *ll_coord]):
+        profile = LoadProfile(
+            udl_left,
+            udl_right,
+            udl_magnitude,
+            ll_coord,
+            ll_magnitude,
+            udl_left_magnitude,
+        )
+        return profile.load(xl, xr)
+
+    load = np.zeros(np.shape(xl), dtype=float)
+
+    for left, right, magnitude, left_magnitude in zip(
+        udl_left, udl_right, udl_magnitude, udl_left_magnitude
+    ):
+        start = np.maximum(xl, left)
+        end = np.minimum(xr, right)
+
+        # mean intensity over the overlap, the intensity is linear
+        with np.errstate(divide="ignore", invalid="ignore"):
+            middle = (right - (start + end) / 2) / (right - left)
+        intensity = magnitude + (left_magnitude - magnitude) * np.nan_to_num(
+            middle
+        )
+        load += np.clip(end - start, 0.0, None) * intensity
+
+    for coord, magnitude in zip(ll_coord, ll_magnitude):
+        load += np.where((xl <= coord) & (coord < xr), magnitude, 0)
+
+    return load
+
+
+class DynamicSolver:
+    """Bishops factor of safety of a fixed set of failure planes for
+    different offsets of the dynamic loads from the slope crest.
+
+    The slice geometry of the planes is calculated once (if cache is
+    true), each offset then only needs the dynamic loads added to the
+    slice weights before the bishop iteration. The iteration is warm
+    started from the factor of safety of the last offset solved.
+
+    The planes are solved once without the dynamic loads. Planes are
+    stored sorted by their entry (left) x coordinate so that the planes
+    within the zone of influence of the loads at an offset, the planes
+    entering to the left of the loads and exiting to the right of them,
+    are found with a binary search. Only these are solved for the
+    offset, the others keep their factor of safety without the dynamic
+    loads.
+
+    Many offsets can be screened with an estimate of the factor of
+    safety from bishops equation linearised about the solution without
+    the dynamic loads, see estimate. Only the planes close to the
+    critical estimate for each offset are then solved.
+
+    With breakpoint slicing the slice boundaries stay where they were
+    placed for the model, loads are still applied exactly.
+
+    Parameters
+    ----------
+    model : CompiledSlope
+        compiled model without the dynamic loads
+    planes : np.ndarray
+        structured array of planes with l_x, r_x, c_x, c_y and radius
+        fields, sorted by l_x when stored in the solver
+    udl_length : sequence, optional
+        length of each dynamic udl, 0 or None if continuous
+    udl_magnitude : sequence, optional
+        magnitude of each dynamic udl in kPa
+    ll_magnitude : sequence, optional
+        magnitude of each dynamic line load in kN/m
+    udl_end_magnitude : sequence, optional
+        magnitude of each dynamic udl in kPa at the end furthest from
+        the crest, the load varies linearly between the ends. By default
+        None (uniform udls).
+    cache : bool, optional
+        If true the slice geometry of the planes is kept between offsets,
+        by default True.
+    batch_elements : int, optional
+        approximate number of (plane, slice) values solved at once,
+        by default 2**18.
+    """
+
+    def __init__(
+        self,
+        model,
+        planes,
+        udl_length=(),
+        udl_magnitude=(),
+        ll_magnitude=(),
+        udl_end_magnitude=None,
+        cache=True,
+        batch_elements=2**18,
+    ):
+        self.model = model
+        self.batch_elements = batch_elements
+        self.planes = planes[np.argsort(planes["l_x"], kind="stable")]
+        self.udl_length = [length or 0 for length in udl_length]
+        self.udl_magnitude = list(udl_magnitude)
+        self.ll_magnitude = list(ll_magnitude)
+        self.udl_end_magnitude = list(
+            self.udl_magnitude
+            if udl_end_magnitude is None
+            else udl_end_magnitude
+        )
+
+        self.geometry = None
+        if cache:
+            self.geometry = plane_geometry(model, self.planes)
+
+        # linearised bishop solution without the dynamic loads, see
+        # _linearise
+        self.base = None
+
+        # factor of safety of each plane for the last offset solved
+        self.FOS = None
+
+        # number of offsets, planes and bishop iterations solved
+        self.offsets = 0
+        self.evaluations = 0
+        self.iterations = 0
+
+    def load_positions(self, offsets):
+        """Coordinates of the dynamic loads for each offset, see surcharge.
+
+        Parameters
+        ----------
+        offsets : np.ndarray
+            offset of the loads from the slope crest, any shape
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (udl left coordinates, udl right coordinates, line load
+            coordinates), lists with an array like offsets for each load
+        """
+        top_x = self.model.top_coord[0]
+        right = top_x - offsets
+
+        udl_left = [
+            np.maximum(0, right - length) if length else np.zeros_like(right)
+            for length in self.udl_length
+        ]
+        udl_right = [right] * len(self.udl_length)
+        ll_coord = [np.maximum(0, right)] * len(self.ll_magnitude)
+
+        return udl_left, udl_right, ll_coord
+
+    def udl_left_magnitudes(self, udl_left, udl_right):
+        """Magnitude of each dynamic udl at its left coordinate, from
+        load_positions. Differs from the end magnitude where the udl is
+        cut off at the left of the model."""
+        return [
+            (
+                magnitude + (end - magnitude) * (right - left) / length
+                if length
+                else magnitude
+            )
+            for left, right, magnitude, end, length in zip(
+                udl_left,
+                udl_right,
+                self.udl_magnitude,
+                self.udl_end_magnitude,
+                self.udl_length,
+            )
+        ]
+
+    def solve(self, offsets, extra=None, screen=None):
+        """Calculate the factor of safety of every plane for each offset.
+
+        Offsets are solved together in batches of planes x offsets.
+
+        Parameters
+        ----------
+        offsets : sequence
+            offsets of the dynamic loads from the slope crest in metres
+        extra : list, optional
+            structured array of additional planes to solve for each
+            offset, for example planes starting next to the loads at
+            that offset. Their slice geometry isn't cached and they
+            aren't screened, by default None.
+        screen : float, optional
+            If specified only planes with an estimated factor of safety
+            within this fraction of the lowest estimate for the offset
+            are solved, the factor of safety of the others in the zone of
+            influence is nan. By default None (all planes solved).
+
+        Returns
+        -------
+        np.ndarray or tuple
+            factor of safety array of shape (n_offsets, n_planes), nan
+            where the factor of safety cant be calculated. If extra
+            planes are given, Tuple containing: (factor of safety array,
+            list of factor of safety arrays for the extra planes)
+        """
+        offsets = np.atleast_1d(np.asarray(offsets, dtype=float))
+        if self.base is None:
+            self.base = self._linearise()
+            self.FOS = self.base["FOS"].copy()
+
+        # planes outside the zone of influence keep their factor of
+        # safety without the dynamic loads
+        zone = self.zone(offsets)
+        FOS = np.where(zone, np.nan, self.base["FOS"])
+
+        if screen is None:
+            row, index = np.nonzero(zone)
+            initial = None
+        else:
+            estimate = self.estimate(offsets)
+            cutoff = np.nanmin(estimate, axis=1, initial=np.inf)
+            with np.errstate(invalid="ignore"):
+                keep = zone & (estimate <= cutoff[:, None] * (1 + screen))
+            row, index = np.nonzero(keep)
+            initial = estimate[row, index]
+
+        FOS[row, index] = self._solve_rows(
+            self.planes[index], offsets[row], index, initial
+        )
+
+        # warm start from the latest factor of safety of each plane
+        self.offsets += len(offsets)
+        solved = ~np.isnan(FOS[-1])
+        self.FOS[solved] = FOS[-1][solved]
+
+        if extra is None:
+            return FOS
+
+        sizes = [len(planes) for planes in extra]
+        extra_FOS = self._solve_rows(
+            np.concatenate(extra), np.repeat(offsets, sizes)
+        )
+
+        return FOS, np.split(extra_FOS, np.cumsum(sizes)[:-1])
+
+    def zone(self, offsets):
+        """Planes within the zone of influence of the dynamic loads at
+        each offset, see DynamicSolver.
+
+        Parameters
+        ----------
+        offsets : np.ndarray
+            offsets of the dynamic loads from the slope crest in metres
+
+        Returns
+        -------
+        np.ndarray
+            boolean array of shape (n_offsets, n_planes)
+        """
+        zone = np.zeros((len(offsets), len(self.planes)), dtype=bool)
+        entry, exit = self.planes["l_x"], self.planes["r_x"]
+
+        for i, offset in enumerate(offsets):
+            udl_left, udl_right, ll_coord = self.load_positions(offset)
+            if not len(udl_left + ll_coord):
+                continue
+
+            # planes are sorted by entry so those entering to the left of
+            # the loads come first
+            count = np.searchsorted(
+                entry, max(udl_right + ll_coord), side="right"
+            )
+            zone[i, :count] = exit[:count] > min(udl_left + ll_coord)
+
+        return zone
+
+    def estimate(self, offsets):
+        """Estimate the factor of safety of every plane for each offset.
+
+        Bishops equation is linearised about the solution without the
+        dynamic loads: the terms depending on the factor of safety are
+        held at that solution so that the resisting and driving forces
+        are linear in the slice loads.
+
+        Parameters
+        ----------
+        offsets : np.ndarray
+            offsets of the dynamic loads from the slope crest in metres
+
+        Returns
+        -------
+        np.ndarray
+            estimated factor of safety array of shape
+            (n_offsets, n_planes), nan where the factor of safety without
+            the dynamic loads cant be calculated
+        """
+        if self.base is None:
+            self.base = self._linearise()
+
+        # outside the zone of influence the estimate is the solution
+        # without the dynamic loads
+        estimate = np.tile(self.base["FOS"], (len(offsets), 1))
+
+        zones = self.zone(offsets)
+        for i, (offset, zone) in enumerate(zip(offsets, zones)):
+            if not zone.any():
+                continue
+
+            # zone of influence is within the first count planes
+            count = len(zone) - np.argmax(zone[::-1])
+            udl_left, udl_right, ll_coord = self.load_positions(offset)
+            resisting = self.base["resisting"][:count]
+            driving = self.base["driving"][:count]
+
+            # varying udls are taken as their mean magnitude
+            left_magnitude = self.udl_left_magnitudes(udl_left, udl_right)
+            for left, right, magnitude in zip(
+                udl_left,
+                udl_right,
+                (np.add(self.udl_magnitude, left_magnitude) / 2).tolist(),
+            ):
+                resisting_right, driving_right, _, _ = self._load_forces(
+                    right, count
+                )
+                resisting_left, driving_left, _, _ = self._load_forces(
+                    left, count
+                )
+                resisting = resisting + magnitude * (
+                    resisting_right - resisting_left
+                )
+                driving = driving + magnitude * (driving_right - driving_left)
+
+            for coord, magnitude in zip(ll_coord, self.ll_magnitude):
+                _, _, resisting_point, driving_point = self._load_forces(
+                    coord, count
+                )
+                resisting = resisting + magnitude * resisting_point
+                driving = driving + magnitude * driving_point
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                estimate[i, :count] = np.where(
+                    zone[:count], resisting / driving, estimate[i, :count]
+                )
+
+        estimate[~(estimate > 0)] = np.nan
+        return estimate
+
+    def _load_forces(self, x, count):
+        """Linearised change in the resisting and driving forces of the
+        first count planes for a unit distributed load from the left of
+        the plane to x, and for a unit line load at x.
+
+        The cumulative forces at the slice boundaries are looked up for
+        the slice containing x, so the cost doesnt depend on the number
+        of slices covered by the load.
+
+        Returns
+        -------
+        tuple
+            Tuple containing:
+            (resisting force for the distributed load, driving force for
+            the distributed load, resisting force for the line load,
+            driving force for the line load)
+        """
+        base = {key: value[:count] for key, value in self.base.items()}
+        xl, width = base["xl"], base["slice_width"]
+
+        # last slice starting at or before x, slices are in order
+        rows = np.arange(count)
+        index = np.count_nonzero(xl <= x, axis=1) - 1
+        index = np.clip(index, 0, xl.shape[1] - 1)
+
+        start = xl[rows, index]
+        width = np.broadcast_to(width, xl.shape)[rows, index]
+        covered = np.clip(x - start, 0.0, width)
+
+        resisting = base["resisting_load"][rows, index]
+        driving = base["driving_load"][rows, index]
+
+        # line load applies to the slice with xl <= x < xr
+        point = (start <= x) & (x < start + width)
+
+        return (
+            base["resisting_cumulative"][rows, index] + resisting * covered,
+            base["driving_cumulative"][rows, index] + driving * covered,
+            np.where(point, resisting, 0.0),
+            np.where(point, driving, 0.0),
+        )
+
+    def _linearise(self):
+        """Solve every plane without the dynamic loads and linearise
+        bishops equation about the solution, see estimate.
+
+        Returns
+        -------
+        dict
+            dictionary of arrays with the keys "FOS", "resisting" and
+            "driving" (forces for each plane), "resisting_load" and
+            "driving_load"
+            (change in the forces per unit load on each slice),
+            "resisting_cumulative" and "driving_cumulative" (change in the
+            forces for a unit distributed load up to the left of each
+            slice), "xl" and "slice_width".
+        """
+        batch = max(1, self.batch_elements // self.model.slices)
+        results = []
+
+        for start in range(0, len(self.planes), batch):
+            planes = self.planes[start : start + batch]
+            if self.geometry is None:
+                geometry = plane_geometry(self.model, planes)
+            else:
+                geometry = {
+                    key: value[start : start + batch]
+                    for key, value in self.geometry.items()
+                }
+
+            FOS, iterations = solve_planes(
+                self.model, planes, geometry=geometry
+            )
+            self.evaluations += len(planes)
+            self.iterations += int(iterations.sum())
+
+            c_x, c_y, radius, x_left, x_right = _as_arrays(
+                planes["c_x"],
+                planes["c_y"],
+                planes["radius"],
+                planes["l_x"],
+                planes["r_x"],
+            )
+            p = self.model.slice_properties(
+                c_x, c_y, radius, x_left, x_right, geometry=geometry
+            )
+            b, tan_phi = p["slice_width"], p["tan_phi"]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                m = p["cos_alpha"] + p["sin_alpha"] * tan_phi / FOS[:, None]
+                N = p["cohesion"] * b + (p["W"] - p["head"] * b) * tan_phi
+
+                resisting_load = tan_phi / m
+
+            b = np.broadcast_to(b, m.shape)
+            results.append(
+                {
+                    "FOS": FOS,
+                    "resisting": np.sum(N / m, axis=1),
+                    "driving": np.sum(p["W"] * p["sin_alpha"], axis=1),
+                    "resisting_load": resisting_load,
+                    "driving_load": p["sin_alpha"],
+                    "resisting_cumulative": _cumulative(resisting_load * b),
+                    "driving_cumulative": _cumulative(p["sin_alpha"] * b),
+                    "xl": geometry["xl"],
+                    "slice_width": b,
+                }
+            )
+
+        if not results:
+            return {"FOS": np.empty(0)}
+
+        return {
+            key: np.concatenate([result[key] for result in results])
+            for key in results[0]
+        }
+
+    def _solve_rows(self, planes, offsets, index=None, initial=None):
+        """Solve each plane with the dynamic loads at the offset for the
+        plane, in batches.
+
+        Parameters
+        ----------
+        planes : np.ndarray
+            structured array of planes
+        offsets : np.ndarray
+            offset of the loads for each plane
+        index : np.ndarray, optional
+            index of each plane in self.planes, to use the cached geometry
+            and warm start. If None the geometry is calculated,
+            by default None.
+        initial : np.ndarray, optional
+            initial estimate of the factor of safety for each plane, by
+            default None (latest factor of safety of the plane if known).
+
+        Returns
+        -------
+        np.ndarray
+            factor of safety of each plane
+        """
+        batch = max(1, self.batch_elements // self.model.slices)
+        FOS = np.full(len(planes), np.nan)
+
+        for start in range(0, len(planes), batch):
+            rows = slice(start, start + batch)
+
+            if index is None or self.geometry is None:
+                geometry = plane_geometry(self.model, planes[rows])
+            else:
+                # views of the cached geometry where the planes are in
+                # order, otherwise copies
+                take = index[rows]
+                if np.all(np.diff(take) == 1):
+                    take = slice(take[0], take[-1] + 1)
+
+                geometry = {
+                    key: value[take] for key, value in self.geometry.items()
+                }
+
+            # add the dynamic loads, each plane with its own offset
+            positions = self.load_positions(offsets[rows, None])
+            geometry["W"] = geometry["W"] + surcharge(
+                geometry["xl"],
+                geometry["xr"],
+                positions[0],
+                positions[1],
+                self.udl_magnitude,
+                positions[2],
+                self.ll_magnitude,
+                self.udl_left_magnitudes(positions[0], positions[1]),
+            )
+
+            if initial is not None:
+                start_FOS = initial[rows]
+            elif index is not None and self.FOS is not None:
+                start_FOS = self.FOS[index[rows]]
+            else:
+                start_FOS = None
+
+            FOS[rows], iterations = solve_planes(
+                self.model, planes[rows], start_FOS, geometry
+            )
+            self.evaluations += len(geometry["valid"])
+            self.iterations += int(iterations.sum())
+
+        return FOS
+
+
+def plane_geometry(model, planes):
+    """Slice geometry for a structured array of planes, see
+    CompiledSlope.slice_geometry."""
+    c_x, c_y, radius, x_left, x_right = _as_arrays(
+        planes["c_x"],
+        planes["c_y"],
+        planes["radius"],
+        planes["l_x"],
+        planes["r_x"],
+    )
+    return model.slice_geometry(c_x, c_y, radius, x_left, x_right)
+
+
+def _mean_circle_base(c_x, c_y, radius, xl, xr, centre_yb):
+    """Exact mean y coordinate of the bottom of a circle between xl and xr,
+    the slice centre value where the slice has no width."""
+
+    def integral(x):
+        # integral of sqrt(r^2 - u^2) with u measured from the centre
+        u = np.clip(x - c_x, -radius, radius)
+        return (
+            u * np.sqrt(np.maximum(radius**2 - u**2, 0.0))
+            + radius**2 * np.arcsin(u / radius)
+        ) / 2
+
+    width = xr - xl
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = c_y - (integral(xr) - integral(xl)) / width
+
+    return np.where(width > 0, mean, centre_yb)
+
+
+def _cumulative(values):
+    """Cumulative sum along each row starting from zero, one longer than
+    the rows."""
+    total = np.zeros((values.shape[0], values.shape[1] + 1))
+    np.cumsum(values, axis=1, out=total[:, 1:])
+    return total
+
+
+def _as_arrays(*values):
+    """Convert values to 1D float arrays."""
+    return tuple(np.atleast_1d(np.asarray(v, dtype=float)) for v in values)
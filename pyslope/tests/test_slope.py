@@ -1,6 +1,9 @@
 # pytest is expected to be run from top level directory only
 
+from dataclasses import replace
+
 from pyslope.pyslope import Slope, Material, Udl, LineLoad
+import numpy as np
 import pytest
 
 
@@ -278,6 +281,18 @@ def test_remove_individual_planes():
     assert len(s._search) < 1200
 
 
+def dynamic_slope():
+    """Slope with a dynamic udl, used by the dynamic analysis tests."""
+    s = Slope(height=3, angle=30)
+    s.set_materials(Material(20, 45, 2, 2), Material(20, 30, 2, 5))
+    s.set_udls(
+        Udl(magnitude=20),
+        Udl(magnitude=100, length=1, offset=2, dynamic_offset=True),
+    )
+    s.update_analysis_options(slices=20, iterations=2000)
+    return s
+
+
 def test_dynamic_analysis():
     s = Slope(height=1, angle=None, length=1)
     ll1 = LineLoad(magnitude=20, dynamic_offset=True)
@@ -297,6 +312,220 @@ def test_dynamic_analysis():
     assert s.get_dynamic_results()
 
 
+def test_incremental_dynamic_analysis():
+    s1 = dynamic_slope()
+    s1.analyse_dynamic(critical_fos=1.4)
+    s2 = dynamic_slope()
+    s2.analyse_dynamic(critical_fos=1.4, incremental=True)
+
+    # both start with the loads at the crest and the same planes
+    full = s1.get_dynamic_results()
+    incremental = s2.get_dynamic_results()
+    assert incremental[0] == pytest.approx(full[0], abs=1e-3)
+
+    # slope left with the loads and results at the last offset
+    offset = [udl.offset for udl in s2._udls if udl.dynamic_offset][0]
+    assert s2.get_min_FOS() == incremental[offset]
+
+    offsets = [k for k, v in full.items() if v >= 1.4]
+    setback = [k for k, v in incremental.items() if v >= 1.4]
+    assert min(setback) == pytest.approx(min(offsets), abs=0.1)
+
+    # whole curve, screened planes against solving every plane
+    s3 = dynamic_slope()
+    setback = s3.analyse_dynamic(critical_fos=1.4, offsets=20)
+    curve = s3.get_dynamic_curve()
+    assert len(curve["offset"]) == 20
+    assert curve["FOS"][0] == pytest.approx(full[0], abs=0.005)
+    assert setback == pytest.approx(min(offsets), abs=0.1)
+    assert s3.get_min_FOS() == pytest.approx(1.4, abs=0.01)
+
+    analyse_offsets = dynamic_slope()._get_dynamic_analysis(
+        curve["offset"][-1]
+    )
+    exhaustive = analyse_offsets(curve["offset"].tolist())
+    assert np.allclose(curve["FOS"], exhaustive, atol=0.005)
+
+    # offsets either side of the setback are solved without screening
+    i = np.searchsorted(curve["offset"], setback)
+    for offset, fos in zip(
+        curve["offset"][i - 1 : i + 1], curve["FOS"][i - 1 :]
+    ):
+        expected = dynamic_slope()._analyse_dynamic_offset(offset)
+        assert fos == pytest.approx(expected, abs=0.005)
+
+    # safe at the crest, with offset 0 checked explicitly
+    s4 = dynamic_slope()
+    assert s4.analyse_dynamic(critical_fos=1.0, offsets=[1, 2]) == 0
+    assert 0 in s4.get_dynamic_results()
+
+    # no offset is safe, loads left at the furthest offset
+    s5 = dynamic_slope()
+    assert s5.analyse_dynamic(critical_fos=10, offsets=[1, 2]) is None
+    offset = [udl.offset for udl in s5._udls if udl.dynamic_offset][0]
+    assert offset == 2
+    assert s5.get_min_FOS() == s5.get_dynamic_results()[2]
+
+    # numpy integers give evenly spaced offsets
+    s5.analyse_dynamic(critical_fos=1.4, offsets=np.int64(5))
+    assert len(s5.get_dynamic_curve()["offset"]) == 5
+
+    with pytest.raises(ValueError):
+        s5.analyse_dynamic(offsets=5, incremental=True)
+    with pytest.raises(ValueError):
+        s5.analyse_dynamic(offsets=5, search="bracket")
+
+
+def test_bracketed_dynamic_analysis(monkeypatch):
+    from pyslope import pyslope
+
+    s1 = dynamic_slope()
+    s1.analyse_dynamic(critical_fos=1.4, incremental=True)
+    secant = s1.get_analysis_statistics()["dynamic_analyses"]
+    offsets = [k for k, v in s1.get_dynamic_results().items() if v >= 1.4]
+
+    for incremental in (False, True):
+        s = dynamic_slope()
+        setback = s.analyse_dynamic(
+            critical_fos=1.4,
+            incremental=incremental,
+            search="bracket",
+            tolerance=0.005,
+        )
+        results = s.get_dynamic_results()
+
+        # setback is safe and an offset within tolerance isnt
+        assert results[setback] >= 1.4
+        assert any(
+            v < 1.4 and setback - 0.005 <= k < setback
+            for k, v in results.items()
+        )
+        assert setback == pytest.approx(min(offsets), abs=0.05)
+
+    # no more analyses than the secant search to a similar range
+    s = dynamic_slope()
+    s.analyse_dynamic(
+        critical_fos=1.4, incremental=True, search="bracket", tolerance=0.02
+    )
+    assert s.get_analysis_statistics()["dynamic_analyses"] <= secant
+    assert s.get_analysis_statistics()["dynamic_converged"]
+
+    # warns if the range is still too wide after the last analysis
+    monkeypatch.setattr(pyslope, "DYNAMIC_ITERATIONS", 2)
+    s = dynamic_slope()
+    with pytest.warns(RuntimeWarning):
+        setback = s.analyse_dynamic(critical_fos=1.4, search="bracket")
+    assert s.get_dynamic_results()[setback] >= 1.4
+    statistics = s.get_analysis_statistics()
+    assert statistics["dynamic_analyses"] == 4
+    assert not statistics["dynamic_converged"]
+
+    s = dynamic_slope()
+    assert s.analyse_dynamic(critical_fos=1.0, search="bracket") == 0
+    assert s.analyse_dynamic(critical_fos=10, search="bracket") is None
+
+    with pytest.raises(ValueError):
+        s.analyse_dynamic(search="bisect")
+
+
+def test_dynamic_zone_of_influence():
+    from pyslope import solver
+
+    s = Slope(height=3, angle=30)
+    s.set_materials(Material(20, 45, 2, 2), Material(20, 30, 2, 5))
+    s.set_udls(Udl(magnitude=100, length=1, offset=8, dynamic_offset=True))
+    s.set_lls(LineLoad(magnitude=30, offset=8, dynamic_offset=True))
+    s.update_analysis_options(slices=20, iterations=2000)
+    s._set_entry_exit_planes()
+    planes = s._planes
+
+    model = s._compile_model()
+    static = replace(
+        model,
+        udl_left=[],
+        udl_right=[],
+        udl_magnitude=[],
+        udl_left_magnitude=[],
+        ll_coord=[],
+        ll_magnitude=[],
+    )
+    dynamic = solver.DynamicSolver(static, planes, [1], [100], [30])
+
+    # planes are stored sorted by entry point
+    assert np.all(np.diff(dynamic.planes["l_x"]) >= 0)
+
+    offsets = [0.5, 4, 8]
+    FOS = dynamic.solve(offsets)
+    zone = dynamic.zone(np.array(offsets))
+
+    # far from the crest only a few planes are affected by the loads
+    assert zone[0].sum() > zone[2].sum()
+    assert zone[2].sum() < len(planes) / 2
+    base = np.broadcast_to(dynamic.base["FOS"], FOS.shape)
+    assert np.array_equal(FOS[~zone], base[~zone], equal_nan=True)
+
+    # same as solving every plane with the loads at the offset
+    for offset, fos in zip(offsets, FOS):
+        s._set_dynamic_offset(offset)
+        expected, _ = solver.solve_planes(s._compile_model(), dynamic.planes)
+        assert np.allclose(fos, expected, atol=0.01, equal_nan=True)
+
+
+def test_varying_udl():
+    from pyslope import solver
+
+    def slope(*udls):
+        s = Slope(height=3, angle=30)
+        s.set_materials(Material(20, 35, 2, 2), Material(20, 30, 2, 5))
+        s.set_udls(Udl(5), *udls)
+        s.set_lls(LineLoad(10, offset=2), LineLoad(20, offset=4))
+        s.update_analysis_options(slices=30, iterations=500)
+        s._set_entry_exit_planes()
+        return s
+
+    # varying load against the same load as many uniform strips
+    s1 = slope(Udl(10, offset=1, length=4, end_magnitude=30))
+    s2 = slope(
+        *[
+            Udl(10 + 20 * (i + 0.5) / 200, offset=1 + i * 0.02, length=0.02)
+            for i in range(200)
+        ]
+    )
+    planes = s1._planes
+    FOS1, _ = solver.solve_planes(s1._compile_model(), planes)
+    FOS2, _ = solver.solve_planes(s2._compile_model(), planes)
+    assert np.allclose(FOS1, FOS2, rtol=1e-4, equal_nan=True)
+
+    for plane in planes[:: len(planes) // 5]:
+        circle = (float(plane["c_x"]), float(plane["c_y"]))
+        circle += (float(plane["radius"]),)
+        assert s1._analyse_circular_failure_bishop(*circle) == pytest.approx(
+            s2._analyse_circular_failure_bishop(*circle), rel=1e-4
+        )
+
+    # profile lookups against adding each load in turn
+    xb = np.sort(np.random.default_rng(0).uniform(-1, 12, (4, 31)), axis=1)
+    xl, xr = xb[:, :-1], xb[:, 1:]
+    loads = [np.array([x]) for x in (0, 2, 5)], [3, 4, 9], [10, 20, 0]
+    moving = solver.surcharge(xl, xr, *loads, [3], [7], [10, 20, 30])
+    fixed = solver.surcharge(
+        xl, xr, [0, 2, 5], *loads[1:], [3], [7], [10, 20, 30]
+    )
+    assert np.allclose(moving, fixed)
+
+    # magnitude at the left of a load cut off by the model
+    s = Slope(height=3, angle=30)
+    s.set_udls(Udl(10, offset=1, length=4, end_magnitude=30))
+    assert s._udls[0].left_magnitude == pytest.approx(30)
+    dynamic = solver.DynamicSolver(
+        s1._compile_model(), planes, [100], [10], udl_end_magnitude=[110]
+    )
+    assert dynamic.udl_left_magnitudes([0], [50]) == pytest.approx([60])
+
+    with pytest.raises(ValueError):
+        Udl(10, end_magnitude=20)
+
+
 def test_custom_color():
     s = Slope(height=1, angle=None, length=1)
     ll1 = LineLoad(magnitude=20, dynamic_offset=True, color="purple")
@@ -318,3 +547,463 @@ def test_custom_color():
     s.analyse_slope()
 
     s.plot_critical()
+
+
+def test_batch_engine_matches_scalar(s):
+    s.analyse_slope(engine="scalar")
+    scalar = {(p["c_x"], p["c_y"], p["radius"]): p["FOS"] for p in s._search}
+
+    s.analyse_slope(engine="batch")
+    batch = {(p["c_x"], p["c_y"], p["radius"]): p["FOS"] for p in s._search}
+
+    assert scalar.keys() == batch.keys()
+    for key, fos in scalar.items():
+        assert fos == pytest.approx(batch[key], abs=1e-9)
+
+    with pytest.raises(ValueError):
+        s.analyse_slope(engine="scalar", workers=2)
+
+
+def test_ordinary_batch_matches_scalar(s):
+    s.analyse_slope()
+    planes = s._search[:50]
+
+    FOS, valid = s._analyse_circular_failure_ordinary_batch(
+        [p["c_x"] for p in planes],
+        [p["c_y"] for p in planes],
+        [p["radius"] for p in planes],
+        [p["l_c"][0] for p in planes],
+        [p["r_c"][0] for p in planes],
+    )
+
+    for plane, fos, is_valid in zip(planes, FOS, valid):
+        scalar = s._analyse_circular_failure_ordinary(
+            plane["c_x"], plane["c_y"], plane["radius"]
+        )
+        assert is_valid == (scalar is not None)
+        if is_valid:
+            assert fos == pytest.approx(scalar, abs=1e-9)
+
+    with pytest.raises(ValueError):
+        s._analyse_circular_failure_ordinary_batch(
+            [1, 2], [-1, 2], [1, 1], [0, 0], [1, 1]
+        )
+
+
+def test_circle_intersection_batch_matches_scalar(s):
+    circles = [(p["c_x"], p["c_y"], p["radius"]) for p in s._search[:100]]
+    circles += [(3, 8, 1), (3, 8, 0.5), (5, 10, 20)]
+
+    c_x, c_y, radius = zip(*circles)
+    left, right, valid = s._get_circle_external_intersection_batch(
+        c_x, c_y, radius
+    )
+
+    for i, circle in enumerate(circles):
+        scalar = s._get_circle_external_intersection(*circle)
+        assert valid[i] == (len(set(scalar)) >= 2)
+        if valid[i]:
+            assert left[i] == pytest.approx(scalar[0])
+            assert right[i] == pytest.approx(scalar[1])
+
+
+def test_entry_exit_planes_columnar(s):
+    s._set_entry_exit_planes()
+    planes = s._planes
+
+    assert planes.dtype.names == (
+        "l_x",
+        "l_y",
+        "r_x",
+        "r_y",
+        "c_x",
+        "c_y",
+        "radius",
+    )
+    assert 0 < len(planes) <= 500
+
+    # each pair of entry and exit points generates the same planes
+    # when generated individually
+    single = s._generate_planes(
+        (planes["l_x"][0], planes["l_y"][0]),
+        (planes["r_x"][0], planes["r_y"][0]),
+    )
+    assert single["radius"][0] == pytest.approx(planes["radius"][0])
+
+
+def test_search_results(s):
+    s.analyse_slope(max_fos=3)
+    FOS = s._search.array["FOS"]
+
+    assert len(s._search) == len(FOS)
+    assert (FOS <= 3).all()
+    assert (FOS[:-1] <= FOS[1:]).all()
+    assert s._search.critical == s._search[0]
+    assert s.get_min_FOS() == FOS[0]
+    assert len(s._search.filter(2)) == (FOS <= 2).sum()
+    assert isinstance(s._search.to_dicts()[0]["l_c"], tuple)
+
+
+def test_compiled_model_is_picklable(s):
+    import pickle
+
+    s.analyse_slope()
+    planes = s._search.array
+    model = s._compile_model()
+    copy = pickle.loads(pickle.dumps(model))
+
+    FOS = copy.bishop(
+        planes["c_x"],
+        planes["c_y"],
+        planes["radius"],
+        planes["l_x"],
+        planes["r_x"],
+    )
+    assert FOS == pytest.approx(planes["FOS"])
+
+    with pytest.raises(Exception):
+        model.slices = 50
+
+
+def test_parallel_analysis_matches_serial(s):
+    from concurrent.futures import ThreadPoolExecutor
+
+    s.analyse_slope()
+    serial = s._search.array.copy()
+
+    s.analyse_slope(workers=2)
+    assert (s._search.array == serial).all()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        s.analyse_slope(executor=executor)
+    assert (s._search.array == serial).all()
+
+
+def test_keep_lowest_planes(s):
+    s.analyse_slope(max_fos=3)
+    full = s._search.array.copy()
+
+    s.analyse_slope(max_fos=3, keep=50)
+    assert len(s._search) == 50
+    assert (s._search.array["FOS"] == full["FOS"][:50]).all()
+
+    s.analyse_slope(keep="critical")
+    assert len(s._search) == 1
+    assert s.get_min_FOS() == full["FOS"][0]
+
+
+def test_iter_analyse(s, tmp_path):
+    from pyslope.pyslope import write_results
+
+    s.analyse_slope()
+    batches = list(s.iter_analyse(chunk_size=100))
+
+    assert len(batches) > 1
+    streamed = np.sort(np.concatenate(batches)["FOS"])
+    assert streamed == pytest.approx(s._search.array["FOS"])
+
+    path = str(tmp_path / "results.csv")
+    count = write_results(s.iter_analyse(chunk_size=100, max_fos=2), path)
+
+    with open(path) as f:
+        lines = f.readlines()
+    assert lines[0].strip() == "l_x,l_y,r_x,r_y,c_x,c_y,radius,FOS"
+    assert len(lines) == count + 1
+    assert count == len(s._search.filter(2))
+
+
+def test_grid_search(s):
+    s.update_grid_options(x_points=8, y_points=6, radius_points=5)
+    s.analyse_slope(method="grid")
+    grid = s.get_grid_results()
+
+    assert grid["FOS"].shape == (6, 8)
+    assert np.nanmin(grid["FOS"]) == s.get_min_FOS()
+    assert s.get_analysis_statistics()["evaluations"] >= len(s._search)
+
+    c_x, c_y, radius = s.get_min_FOS_circle()
+    assert c_x in grid["x"] and c_y in grid["y"]
+    assert s._analyse_circular_failure_bishop(
+        c_x, c_y, radius
+    ) == pytest.approx(s.get_min_FOS())
+
+    s.update_grid_options(x_points=8, y_points=6, tangents=[2, 3])
+    s.analyse_slope(method="grid")
+    assert {
+        round(c_y - r, 9) for c_y, r in s._search.array[["c_y", "radius"]]
+    } <= {2, 3}
+
+    s.update_grid_options()
+
+
+def test_halton_search(s):
+    s.analyse_slope(method="halton")
+    assert s.get_analysis_statistics()["evaluations"] == 500
+
+    first = s._search.array.copy()
+    s.analyse_slope(method="halton")
+    assert (s._search.array == first).all()
+
+    s.update_halton_options(seed=1)
+    s.analyse_slope(method="halton")
+    assert len(s._planes) == 500
+    assert not (s._search.array == first).all()
+
+    s.update_halton_options()
+
+
+def test_halton_search_many_loads():
+    s = Slope(height=3, angle=30)
+    s.set_materials(Material(20, 35, 2, 5))
+    s.set_udls(*[Udl(5, offset=0.2 * i, length=0.1) for i in range(40)])
+    s.update_analysis_options(slices=10, iterations=1000)
+    s.analyse_slope(method="halton")
+
+    # at most a quarter of the planes are snapped to the load edges
+    l_x = s._search.array["l_x"]
+    edges = [x for udl in s._udls for x in (udl.left, udl.right)]
+    assert np.isin(l_x, edges).mean() <= 0.25
+    assert len(np.unique(l_x)) > 500
+
+
+def test_radius_search(s):
+    s.analyse_slope()
+    grid_fos = s.get_min_FOS()
+
+    s.update_radius_search_options(pair_evaluations=10)
+    s.analyse_slope(method="radius_search")
+    assert s.get_analysis_statistics()["evaluations"] <= 500 * 1.15
+    assert s.get_min_FOS() <= grid_fos
+
+    radius_fos = s.get_min_FOS()
+    s.analyse_slope(method="radius_search", engine="scalar")
+    assert s.get_min_FOS() == pytest.approx(radius_fos, rel=0.01)
+    assert s.get_analysis_statistics()["bishop_planes"] == 0
+
+    s.update_screening_options(screen=0.1)
+    with pytest.raises(ValueError):
+        s.analyse_slope(method="radius_search")
+    with pytest.raises(ValueError):
+        s.analyse_slope(engine="scalar")
+    s.update_screening_options()
+
+    with pytest.raises(ValueError):
+        s.update_radius_search_options(pair_evaluations=2)
+    s.update_radius_search_options()
+
+
+def test_bishop_acceleration_and_warm_start(s):
+    s.update_analysis_options(tolerance=1e-9, max_iterations=200)
+    s.analyse_slope()
+    exact = s._search.array.copy()
+
+    s.update_analysis_options(tolerance=0.005, max_iterations=15)
+    s.analyse_slope()
+    plain = s.get_analysis_statistics()["mean_bishop_iterations"]
+
+    s.update_analysis_options(acceleration=True)
+    s.analyse_slope()
+    accelerated = s.get_analysis_statistics()["mean_bishop_iterations"]
+
+    assert accelerated < plain
+    assert s.get_min_FOS() == pytest.approx(exact["FOS"][0], abs=1e-4)
+    s.update_analysis_options(acceleration=False)
+
+    # warm starting from the solution converges in a single iteration
+    model = s._compile_model()
+    FOS, iterations = model.bishop(
+        exact["c_x"],
+        exact["c_y"],
+        exact["radius"],
+        exact["l_x"],
+        exact["r_x"],
+        initial=exact["FOS"],
+        return_iterations=True,
+    )
+    assert FOS == pytest.approx(exact["FOS"], abs=1e-6)
+    assert (iterations == 1).all()
+
+
+def test_breakpoint_slicing(s):
+    from dataclasses import replace
+
+    s.analyse_slope()
+    planes = s._search.array
+    args = [planes[k] for k in ("c_x", "c_y", "radius", "l_x", "r_x")]
+
+    model = replace(s._compile_model(), tolerance=1e-9, max_iterations=100)
+    reference = replace(model, slices=4000).bishop(*args)
+    uniform = replace(model, slices=200).bishop(*args)
+    breakpoints = replace(model, slices=50, slicing="breakpoints").bishop(
+        *args
+    )
+
+    # same accuracy with a quarter of the slices
+    error_uniform = np.nanmedian(np.abs(uniform - reference))
+    error_breakpoints = np.nanmedian(np.abs(breakpoints - reference))
+    assert error_breakpoints < error_uniform
+
+    # breakpoints take slices from the evenly spaced ones
+    bounds = replace(
+        model, slices=50, slicing="breakpoints"
+    )._slice_boundaries(*(a[:, None] for a in args))
+    assert bounds.shape == (len(planes), 51)
+    assert np.all(np.diff(bounds, axis=1) >= 0)
+
+    s.update_analysis_options(slices=50, slicing="breakpoints")
+    s.analyse_slope()
+    assert s.get_min_FOS() == pytest.approx(np.nanmin(reference), abs=0.005)
+    s.update_analysis_options(slices=10, slicing="uniform")
+
+
+def test_breakpoint_slicing_padding():
+    s = Slope(height=3, angle=30)
+    s.set_materials(Material(20, 35, 2, 1), Material(20, 30, 2, 5))
+    s.set_udls(*[Udl(10, offset=0.3 * i, length=0.1) for i in range(12)])
+    s.update_analysis_options(slices=10, slicing="breakpoints")
+    s._set_entry_exit_planes()
+    planes = s._planes
+    args = [planes[k] for k in ("c_x", "c_y", "radius", "l_x", "r_x")]
+    model = s._compile_model()
+
+    # some planes cross more breakpoints than slices, the rest are
+    # padded with zero width slices at the end of the plane
+    bounds = model._slice_boundaries(*(a[:, None] for a in args))
+    assert bounds.shape[1] > 11
+    assert np.any(bounds[:, -2] == bounds[:, -1])
+
+    # padding on planes ending just outside the circle, as can happen
+    # with rounding, doesnt invalidate the plane
+    c_x, c_y, radius, l_x, _ = args
+    r_x = c_x + radius + 1e-9
+    uniform = replace(model, slicing="uniform").slice_geometry(
+        c_x, c_y, radius, l_x, r_x
+    )
+    padded = model.slice_geometry(c_x, c_y, radius, l_x, r_x)
+    assert uniform["valid"].any()
+    assert np.array_equal(padded["valid"], uniform["valid"])
+
+
+def test_geometry_cache():
+    s = Slope(height=1, angle=None, length=1.5)
+    s.set_materials(Material(20, 40, 1, 0.3), Material(18, 30, 0, 5))
+    s.update_analysis_options(slices=20, iterations=1000)
+    s.set_udls(Udl(magnitude=50, offset=1, length=0.5))
+
+    s.analyse_slope()
+    assert s.get_analysis_statistics()["cached_planes"] == 0
+
+    # only loads and water changed, geometry is reused
+    s.remove_udls(remove_all=True)
+    s.set_udls(Udl(magnitude=100, offset=1, length=0.5))
+    s.set_water_table(1)
+    s.analyse_slope()
+    assert s.get_analysis_statistics()["cached_planes"] == len(s._planes)
+    cached = s._search.array.copy()
+
+    s._geometry_cache.clear()
+    s.analyse_slope()
+    assert (s._search.array == cached).all()
+
+    # materials are part of the geometry
+    s.set_materials(Material(18, 25, 0, 3))
+    s.analyse_slope()
+    assert s.get_analysis_statistics()["cached_planes"] == 0
+
+
+def test_invalidation():
+    s = Slope(height=1, angle=None, length=1.5)
+    s.set_materials(Material(20, 40, 1, 0.3), Material(18, 30, 0, 5))
+    s.update_analysis_options(slices=20, iterations=1000)
+
+    s.analyse_slope()
+    planes = s._planes
+
+    # water only changes the results
+    s.set_water_table(1)
+    assert len(s._search) == 0
+    assert s._geometry_cache
+    s.analyse_slope()
+    assert s._planes is planes
+    assert s.get_analysis_statistics()["cached_planes"] == len(planes)
+
+    # solver options dont change the planes or geometry
+    s.update_analysis_options(tolerance=0.001)
+    s.analyse_slope()
+    assert s._planes is planes
+
+    # materials change the geometry but not the planes
+    s.set_materials(Material(18, 25, 0, 3))
+    assert not s._geometry_cache
+    s.analyse_slope()
+    assert s._planes is planes
+
+    # limits change the planes
+    s.set_analysis_limits(left_x=1)
+    s.analyse_slope()
+    assert s._planes is not planes
+
+
+def test_batch_update(monkeypatch):
+    def build(s):
+        s.set_materials(Material(20, 40, 1, 0.3), Material(18, 30, 0, 12))
+        s.set_udls(Udl(10, offset=3, length=2), Udl(5, offset=8))
+        s.set_lls(LineLoad(20, offset=6))
+        s.set_water_table(2)
+        s.set_analysis_limits(left_x=2, right_x=20)
+        s.update_analysis_options(slices=10, iterations=500)
+
+    s1 = Slope(height=2, angle=None, length=3)
+    build(s1)
+
+    s2 = Slope(height=2, angle=None, length=3)
+    sizes = []
+    size = s2._size_external_boundary
+    monkeypatch.setattr(
+        s2, "_size_external_boundary", lambda: sizes.append(1) or size()
+    )
+    with s2.batch_update():
+        build(s2)
+        assert s2._materials[0].depth_to_bottom == 0.3
+
+    # boundary sized once and model matches unbatched construction
+    assert len(sizes) == 1
+    assert s2._external_boundary == s1._external_boundary
+    assert s2._limits == s1._limits
+    assert s2._water_RL == s1._water_RL
+    assert [m.RL for m in s2._materials] == [m.RL for m in s1._materials]
+    assert [m.color for m in s2._materials] == [m.color for m in s1._materials]
+    assert [(u.left, u.right) for u in s2._udls] == [
+        (u.left, u.right) for u in s1._udls
+    ]
+    assert s2._lls[0].coord == s1._lls[0].coord
+
+    s1.analyse_slope()
+    s2.analyse_slope()
+    assert s2.get_min_FOS() == s1.get_min_FOS()
+
+    # validation deferred to exit, the model is restored if it fails
+    FOS = s2.get_min_FOS()
+    with pytest.raises(ValueError):
+        with s2.batch_update():
+            s2.set_external_boundary(height=3)
+            s2.set_materials(Material(depth_to_bottom=1))
+            s2.set_materials(Material(depth_to_bottom=1))
+    assert s2._external_boundary == s1._external_boundary
+    assert [m.RL for m in s2._materials] == [m.RL for m in s1._materials]
+    assert len(s2._search) == 0
+    s2.analyse_slope()
+    assert s2.get_min_FOS() == FOS
+
+    # an exception in the body is not masked by validation on exit
+    s1.update_analysis_options(iterations=100)
+    s1.analyse_slope()
+    with pytest.raises(KeyError):
+        with s1.batch_update():
+            s1.set_materials(Material(depth_to_bottom=1))
+            s1.set_materials(Material(depth_to_bottom=1))
+            raise KeyError
+    assert s1._batch_depth == 0
+    assert not s1._batch_inputs
+    assert len(s1._search) == 0
+    assert len(s1._materials) == 2
@@ -1,6 +1,7 @@
 # pytest is expected to be run from top level directory only
 
 from pyslope.pyslope import Slope, Material, Udl, LineLoad
+import pytest
 
 
 # for c the results of 500 slices
@@ -285,3 +286,107 @@ def test_example_g():
         s.analyse_slope()
 
         assert s.get_min_FOS()
+
+
+def validation_slope(example):
+    """Slope of one of the SLIDE_RESULTS examples without the planes."""
+    s = Slope(height=1, angle=None, length=1)
+
+    m1 = Material(20, 35, 0, 0.5)
+    m2 = Material(20, 35, 0 if example == "a" else 2, 1)
+    m3 = Material(18, 30, 0, 5)
+
+    s.set_materials(m1, m2, m3)
+
+    if example == "c":
+        s.set_water_table(0.7)
+    elif example == "d":
+        s.set_udls(Udl(magnitude=20, offset=0.5, length=2))
+    elif example == "e":
+        s.set_lls(LineLoad(magnitude=5, offset=1))
+
+    return s
+
+
+@pytest.mark.parametrize("example", SLIDE_RESULTS)
+def test_refine_search(example):
+    s = validation_slope(example)
+    s.update_analysis_options(slices=50, iterations=10000)
+
+    s.analyse_slope()
+    grid_fos = s.get_min_FOS()
+    grid_evaluations = s.get_analysis_statistics()["evaluations"]
+
+    s.analyse_slope(method="refine")
+    refine_fos = s.get_min_FOS()
+    refine_evaluations = s.get_analysis_statistics()["evaluations"]
+
+    # accuracy of 10000 iterations at the cost of about 1000
+    difference = abs(refine_fos - grid_fos)
+    average = (refine_fos + grid_fos) / 2
+    assert difference / average < 0.01
+    assert refine_fos <= grid_fos * 1.001
+    assert refine_evaluations <= grid_evaluations / 10
+
+
+def test_refine_search_options():
+    s = validation_slope("d")
+    s.update_analysis_options(slices=25, iterations=10000)
+
+    s.analyse_slope(method="refine")
+    refine_fos = s.get_min_FOS()
+
+    # the engine is used for every stage of the search
+    s.analyse_slope(method="refine", engine="scalar")
+    assert s.get_min_FOS() == pytest.approx(refine_fos, rel=0.01)
+    assert s.get_analysis_statistics()["bishop_planes"] == 0
+
+    s.update_screening_options(screen=0.1)
+    with pytest.raises(ValueError):
+        s.analyse_slope(method="refine")
+
+
+def test_polish():
+    s = Slope(height=1, angle=None, length=1)
+
+    m1 = Material(20, 35, 2, 0.5)
+    m2 = Material(20, 35, 2, 1)
+    m3 = Material(18, 30, 2, 5)
+
+    s.set_materials(m1, m2, m3)
+    s.set_water_table(0.5)
+
+    s.update_analysis_options(slices=25, iterations=1000)
+
+    s.analyse_slope()
+    grid_fos = s.get_min_FOS()
+
+    s.analyse_slope(polish=3)
+    statistics = s.get_analysis_statistics()
+
+    assert statistics["polish_initial_FOS"] == grid_fos
+    assert statistics["polish_FOS"] < grid_fos
+    assert s.get_min_FOS() == statistics["polish_FOS"]
+    assert 0 < statistics["polish_evaluations"] <= 3 * 200
+
+    with pytest.raises(ValueError):
+        s.analyse_slope(polish=-1)
+
+
+@pytest.mark.parametrize("example", SLIDE_RESULTS)
+def test_screening(example):
+    s = validation_slope(example)
+    s.update_analysis_options(slices=200, iterations=2000)
+
+    s.analyse_slope()
+    exhaustive = s.get_min_FOS()
+    planes = s.get_analysis_statistics()["evaluations"]
+
+    s.update_screening_options(screen=0.05)
+    s.analyse_slope()
+    statistics = s.get_analysis_statistics()
+
+    # same critical plane with only a few planes at full resolution
+    assert s.get_min_FOS() == exhaustive
+    assert statistics["screening_evaluations"] == planes
+    assert statistics["evaluations"] < planes / 5
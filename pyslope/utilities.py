@@ -1,6 +1,10 @@
 # standard library imports
 from math import cos, sin, sqrt, radians
+import warnings
+
+# third party imports
 from colour import Color
+import numpy as np
 
 MATERIAL_COLORS = [
     "#efa59c",
@@ -49,6 +53,69 @@ def circle_centre(beta, chord_intersection, chord_to_centre):
     return [a + b for a, b in zip(chord_intersection, (dx, dy))]
 
 
+def circles_from_chords(l_x, l_y, r_x, r_y, num_circles=5, fraction=None):
+    """Generate circles passing through many pairs of points at once.
+
+    For each pair of points num_circles circles are generated, starting
+    from a circle with a near vertical tangent at the left point and
+    reducing the distance from the chord to the edge of the circle in
+    equal steps.
+
+    Parameters
+    ----------
+    l_x, l_y : np.ndarray
+        coordinates of the left points
+    r_x, r_y : np.ndarray
+        coordinates of the right points
+    num_circles : int, optional
+        number of circles for each pair of points, by default 5
+    fraction : np.ndarray, optional
+        If specified a single circle is generated for each pair of points
+        instead, with the distance from the chord to the edge of the
+        circle being this fraction of the distance for the starting
+        circle (1 is the starting circle), by default None.
+
+    Returns
+    -------
+    tuple
+        Tuple containing:
+        (circle x coordinates, circle y coordinates, circle radii), each
+        with shape (n_pairs * num_circles,) ordered by pair and then circle.
+    """
+    l_x, l_y, r_x, r_y = (
+        np.atleast_1d(np.asarray(a, dtype=float))[:, None]
+        for a in (l_x, l_y, r_x, r_y)
+    )
+
+    if fraction is not None:
+        num_circles = 1
+        steps = np.atleast_1d(np.asarray(fraction, dtype=float))[:, None]
+    else:
+        steps = num_circles - np.arange(num_circles)
+
+    # angle of slope of chord
+    beta = np.arctan((l_y - r_y) / (r_x - l_x))
+
+    # half of the chord that passes from the left point to the right point
+    half_chord = np.sqrt((l_y - r_y) ** 2 + (r_x - l_x) ** 2) / 2
+
+    # starting circle details, if radius 1 would be a vertical slope.
+    # increase to 1.1 to prevent ma denominator issues for bishops method.
+    start_radius = half_chord / np.cos(beta) * 1.1
+    start_chord_to_centre = np.sqrt(start_radius**2 - half_chord**2)
+    start_chord_to_edge = start_radius - start_chord_to_centre
+
+    chord_to_edge = start_chord_to_edge * steps / num_circles
+
+    radius = circle_radius_from_abcd(chord_to_edge, half_chord**2)
+    chord_to_centre = radius - chord_to_edge
+
+    c_x = (l_x + r_x) / 2 + np.sin(beta) * chord_to_centre
+    c_y = (l_y + r_y) / 2 + np.cos(beta) * chord_to_centre
+
+    return c_x.ravel(), c_y.ravel(), radius.ravel()
+
+
 def cirle_line_intersection(top_coord, bot_coord, cx, cy, r):
     # Based on https://mathworld.wolfram.com/Circle-LineIntersection.html
     #  shift so 0,0 is datum
@@ -83,6 +150,341 @@ def cirle_line_intersection(top_coord, bot_coord, cx, cy, r):
         return [(x1, y1), (x2, y2)]
 
 
+def circle_polyline_intersection(c_x, c_y, radius, polyline, tolerance=0.01):
+    """Get the entry and exit points of many circles with a polyline.
+
+    Vectorised equivalent of calling cirle_line_intersection for each
+    segment of the polyline. Follows the same rules as used for a slope
+    surface, for the first segment only the left most intersection is
+    considered and for the last segment only the right most intersection
+    is considered. Intersections closer than the tolerance (in x) to the
+    previous intersection are removed.
+
+    Parameters
+    ----------
+    c_x : np.ndarray
+        circle centre x coordinates
+    c_y : np.ndarray
+        circle centre y coordinates
+    radius : np.ndarray
+        circle radii
+    polyline : list
+        list of (x, y) coordinates ordered from left to right
+    tolerance : float, optional
+        minimum x distance between unique intersections, by default 0.01
+
+    Returns
+    -------
+    tuple
+        Tuple containing:
+        (left coordinates (n, 2), right coordinates (n, 2), valid mask (n,)).
+        Coordinates are nan where the circle does not have two unique
+        intersections with the polyline.
+    """
+    c_x = np.atleast_1d(np.asarray(c_x, dtype=float))
+    c_y = np.atleast_1d(np.asarray(c_y, dtype=float))
+    radius = np.atleast_1d(np.asarray(radius, dtype=float))
+
+    num_segments = len(polyline) - 1
+    xs, ys = [], []
+
+    for i in range(num_segments):
+        (x0, y0), (x1, y1) = polyline[i], polyline[i + 1]
+
+        # Based on https://mathworld.wolfram.com/Circle-LineIntersection.html
+        # shift so circle centre is datum
+        ax, ay = x0 - c_x, y0 - c_y
+        bx, by = x1 - c_x, y1 - c_y
+
+        dx = x1 - x0
+        dy = y1 - y0
+        dr_sq = sqrt(dx**2 + dy**2) ** 2
+
+        D = ax * by - bx * ay
+        disc = np.abs(radius**2 * dr_sq) - np.abs(D**2)
+        root = np.sqrt(np.where(disc < 0, np.nan, disc))
+
+        m = -1 if dy < 0 else 1
+
+        px = np.stack(
+            [
+                (D * dy + m * dx * root) / dr_sq + c_x,
+                (D * dy - m * dx * root) / dr_sq + c_x,
+            ]
+        )
+        py = np.stack(
+            [
+                (-(D * dx) + abs(dy) * root) / dr_sq + c_y,
+                (-(D * dx) - abs(dy) * root) / dr_sq + c_y,
+            ]
+        )
+
+        # only the left most intersection of the first segment and the
+        # right most intersection of the last segment are considered
+        if i == 0 or i == num_segments - 1:
+            order = np.lexsort((py, px), axis=0)
+            pick = order[0] if i == 0 else order[-1]
+            px = np.take_along_axis(px, pick[None], axis=0)
+            py = np.take_along_axis(py, pick[None], axis=0)
+
+        # intersection must be on the segment
+        if dx != 0:
+            on_segment = (min(x0, x1) <= px) & (px <= max(x0, x1))
+        else:
+            on_segment = (min(y0, y1) <= py) & (py <= max(y0, y1))
+
+        xs.append(np.where(on_segment, px, np.nan))
+        ys.append(np.where(on_segment, py, np.nan))
+
+    xs = np.concatenate(xs).T
+    ys = np.concatenate(ys).T
+
+    # sort intersections from left to right (nan values sorted last)
+    order = np.argsort(xs, axis=1, kind="stable")
+    xs = np.take_along_axis(xs, order, axis=1)
+    ys = np.take_along_axis(ys, order, axis=1)
+
+    # remove any close points
+    previous = np.concatenate([np.full((len(xs), 1), -1.0), xs[:, :-1]], 1)
+    unique = np.abs(xs - previous) > tolerance
+
+    # left and right are the first two unique intersections
+    count = np.cumsum(unique, axis=1)
+    valid = count[:, -1] >= 2
+
+    left_i = np.argmax(unique & (count == 1), axis=1)[:, None]
+    right_i = np.argmax(unique & (count == 2), axis=1)[:, None]
+
+    left = np.column_stack(
+        [
+            np.take_along_axis(xs, left_i, axis=1)[:, 0],
+            np.take_along_axis(ys, left_i, axis=1)[:, 0],
+        ]
+    )
+    right = np.column_stack(
+        [
+            np.take_along_axis(xs, right_i, axis=1)[:, 0],
+            np.take_along_axis(ys, right_i, axis=1)[:, 0],
+        ]
+    )
+    left[~valid] = np.nan
+    right[~valid] = np.nan
+
+    return left, right, valid
+
+
+def halton(n, dimensions, start=0, seed=None):
+    """Generate points of the Halton low discrepancy sequence.
+
+    Parameters
+    ----------
+    n : int
+        number of points.
+    dimensions : int
+        number of dimensions (at most 6).
+    start : int, optional
+        index of the first point, used to continue a sequence,
+        by default 0.
+    seed : int, optional
+        if specified the sequence is given a random shift (modulo 1) in
+        each dimension, giving a different but reproducible sequence for
+        each seed, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        points in [0, 1) with shape (n, dimensions).
+
+    Examples
+    -----------------
+    >>> np.round(halton(4, 2), 3).tolist()
+    [[0.5, 0.333], [0.25, 0.667], [0.75, 0.111], [0.125, 0.444]]
+    """
+    primes = (2, 3, 5, 7, 11, 13)[:dimensions]
+    points = np.zeros((n, len(primes)))
+
+    for d, base in enumerate(primes):
+        # radical inverse of the index in the base
+        index = np.arange(start + 1, start + n + 1)
+        fraction = 1.0
+        while index.any():
+            fraction /= base
+            points[:, d] += fraction * (index % base)
+            index //= base
+
+    if seed is not None:
+        shift = np.random.default_rng(seed).random(len(primes))
+        points = (points + shift) % 1
+
+    return points
+
+
+def nelder_mead(func, x0, step, tolerance=1e-4, max_evaluations=200):
+    """Minimise a function with the Nelder-Mead simplex method.
+
+    Constraints can be applied by returning np.inf from func for points
+    outside the feasible region.
+
+    Parameters
+    ----------
+    func : callable
+        function to minimise, takes a 1D array and returns a float.
+    x0 : array like
+        starting point.
+    step : array like
+        initial size of the simplex in each direction.
+    tolerance : float, optional
+        stop when the spread of function values in the simplex is less
+        than tolerance, by default 1e-4.
+    max_evaluations : int, optional
+        maximum number of function evaluations, by default 200.
+
+    Returns
+    -------
+    tuple
+        Tuple containing:
+        (best point, best function value, number of function evaluations)
+    """
+    x0 = np.asarray(x0, dtype=float)
+    n = len(x0)
+
+    simplex = np.vstack([x0, x0 + np.diag(np.broadcast_to(step, n))])
+    values = np.array([func(x) for x in simplex])
+    evaluations = n + 1
+
+    while evaluations < max_evaluations:
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+
+        if values[-1] - values[0] < tolerance:
+            break
+
+        centroid = simplex[:-1].mean(axis=0)
+
+        # reflection
+        reflected = centroid + (centroid - simplex[-1])
+        f_reflected = func(reflected)
+        evaluations += 1
+
+        if f_reflected < values[0]:
+            # expansion
+            expanded = centroid + 2 * (centroid - simplex[-1])
+            f_expanded = func(expanded)
+            evaluations += 1
+
+            if f_expanded < f_reflected:
+                simplex[-1], values[-1] = expanded, f_expanded
+            else:
+                simplex[-1], values[-1] = reflected, f_reflected
+
+        elif f_reflected < values[-2]:
+            simplex[-1], values[-1] = reflected, f_reflected
+
+        else:
+            # contraction, towards the better of the worst and reflected
+            if f_reflected < values[-1]:
+                contracted = centroid + 0.5 * (reflected - centroid)
+            else:
+                contracted = centroid + 0.5 * (simplex[-1] - centroid)
+            f_contracted = func(contracted)
+            evaluations += 1
+
+            if f_contracted < min(f_reflected, values[-1]):
+                simplex[-1], values[-1] = contracted, f_contracted
+
+            else:
+                # shrink towards the best point
+                simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+                values[1:] = [func(x) for x in simplex[1:]]
+                evaluations += n
+
+    best = np.argmin(values)
+    return simplex[best], values[best], evaluations
+
+
+def illinois(func, a, b, fa, fb, tolerance, max_evaluations=10):
+    """Narrow a bracket on a root of a function with the Illinois method
+    (regula falsi, halving the function value kept at an end that isnt
+    replaced twice in a row).
+
+    Each new point is at least half the tolerance inside the bracket, so
+    the bracket shrinks by at least this much for every evaluation. A
+    RuntimeWarning is raised if the bracket is still wider than the
+    tolerance after max_evaluations.
+
+    Parameters
+    ----------
+    func : callable
+        function of a float returning a float.
+    a, b : float
+        ends of the bracket.
+    fa, fb : float
+        function values at a and b, with opposite signs.
+    tolerance : float
+        stop when the bracket is no wider than tolerance.
+    max_evaluations : int, optional
+        maximum number of function evaluations, by default 10.
+
+    Returns
+    -------
+    tuple
+        Tuple containing:
+        (end of the final bracket on the side of a, function value at
+        that end, end on the side of b, function value at that end,
+        number of function evaluations)
+
+    Examples
+    --------
+    >>> a, fa, b, fb, n = illinois(lambda x: x**2 - 2, 0, 2, -2, 2, 1e-6)
+    >>> round(a, 5), b - a <= 1e-6, n < 15
+    (1.41421, True, True)
+    """
+    if np.sign(fa) == np.sign(fb):
+        raise ValueError(
+            "The function values at a and b must have opposite signs."
+        )
+
+    low, high = min(a, b), max(a, b)
+    evaluations = 0
+
+    # function values used for the interpolation, the value at an end
+    # kept for two steps in a row is halved
+    wa, wb = fa, fb
+    kept = None
+
+    while high - low > tolerance and evaluations < max_evaluations:
+        x = (a * wb - b * wa) / (wb - wa)
+        x = min(max(x, low + tolerance / 2), high - tolerance / 2)
+
+        fx = func(x)
+        evaluations += 1
+
+        if fx == 0:
+            return x, fx, x, fx, evaluations
+
+        if np.sign(fx) == np.sign(fa):
+            a, fa, wa = x, fx, fx
+            if kept == "b":
+                wb /= 2
+            kept = "b"
+        else:
+            b, fb, wb = x, fx, fx
+            if kept == "a":
+                wa /= 2
+            kept = "a"
+
+        low, high = min(a, b), max(a, b)
+
+    if high - low > tolerance:
+        warnings.warn(
+            f"The bracket is {high - low:.3g} wide after {evaluations} "
+            f"evaluations, wider than the tolerance of {tolerance}.",
+            RuntimeWarning,
+        )
+
+    return a, fa, b, fb, evaluations
+
+
 def generate_circle_coordinates(c_x, c_y, radius, number_points=90):
     """Generate coordinates around bottom half of circumference of circle.
 
@@ -181,7 +181,9 @@ def index(request):
             slope.update_analysis_options(iterations=500, slices=10)
             slope.analyse_slope(max_fos=5)
 
-            for s in slope._search:
+            search = slope._search.to_dicts()
+
+            for s in search:
 
                 c_x = s["c_x"]
                 c_y = s["c_y"]
@@ -209,8 +211,6 @@ def index(request):
                 s["x"] = [l_c[0]] + x_ + [r_c[0]]
                 s["y"] = [l_c[1]] + y_ + [r_c[1]]
 
-            search = slope._search
-
             plot_json = (
                 slope.plot_critical().update_layout(height=1200, width=2000).to_json()
             )
@@ -280,7 +280,9 @@ def index(request):
 
             # return color_dictionary
             # add coordinates of failure planes to information that gets passed back.
-            for s in slope._search:
+            search = slope._search.to_dicts()
+
+            for s in search:
 
                 c_x = s["c_x"]
                 c_y = s["c_y"]
@@ -311,8 +313,6 @@ def index(request):
             plot = slope.plot_critical(material_table=True, legend=True)
             plot_json = plot.update_layout(autosize=True).to_json()
 
-            search = slope._search
-
             request.session["search"] = search
             request.session["plot_json"] = plot_json
             request.session["forms"] = request.POST